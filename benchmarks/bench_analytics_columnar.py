@@ -0,0 +1,108 @@
+"""Benchmark: agregação de séries temporais em dicts vs. em colunas.
+
+Simula o pipeline de um job de relatório sobre séries horárias de vários
+meses: reamostrar para dias (fuso de Brasília), preencher lacunas, calcular
+a taxa de entrega e juntar dois períodos. Compara o laço em Python sobre
+``TimeseriesPoint`` com ``TimeseriesTable`` (backends ``array`` e, se
+instalado, ``numpy``).
+
+Uso:
+    python benchmarks/bench_analytics_columnar.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from notifica.columnar import (  # noqa: E402
+    TimeseriesTable,
+    format_timestamp,
+    np,
+    parse_timestamps,
+)
+
+HOUR = 3600
+DAY = 86400
+OFFSET = -3 * HOUR
+START = 1704067200  # 2024-01-01T00:00:00Z
+
+
+def make_points(months: int, seed: int = 0) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    points = []
+    for hour in range(months * 30 * 24):
+        if rng.random() < 0.05:
+            continue  # horas sem envio não vêm na resposta
+        sent = rng.randint(0, 500)
+        failed = rng.randint(0, sent // 20)
+        points.append({
+            "timestamp": format_timestamp(START + hour * HOUR),
+            "sent": sent,
+            "delivered": sent - failed,
+            "failed": failed,
+        })
+    return points
+
+
+def naive_report(first: list[dict[str, Any]], second: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """O que os jobs fazem hoje: dicts e laços em Python."""
+    daily: dict[int, dict[str, int]] = {}
+    for point in first + second:
+        ts = parse_timestamps([point["timestamp"]])[0]
+        day = (ts + OFFSET) // DAY * DAY - OFFSET
+        bucket = daily.setdefault(day, {"sent": 0, "delivered": 0, "failed": 0})
+        for key in ("sent", "delivered", "failed"):
+            bucket[key] += point[key]
+    days = sorted(daily)
+    report = []
+    for day in range(days[0], days[-1] + DAY, DAY):
+        bucket = daily.get(day, {"sent": 0, "delivered": 0, "failed": 0})
+        rate = bucket["delivered"] / bucket["sent"] if bucket["sent"] else 0.0
+        report.append({"timestamp": day, **bucket, "delivery_rate": rate})
+    return report
+
+
+def columnar_report(first: list[dict[str, Any]], second: list[dict[str, Any]], backend: str) -> Any:
+    a = TimeseriesTable.from_points(first, backend=backend)  # type: ignore[arg-type]
+    b = TimeseriesTable.from_points(second, backend=backend)  # type: ignore[arg-type]
+    daily = a.merge(b).resample("day", utc_offset=OFFSET).fill_gaps("day")
+    return daily.with_column("delivery_rate", daily.rate("delivered", "sent"))
+
+
+def measure(fn: object) -> float:
+    timer = timeit.Timer(fn)  # type: ignore[arg-type]
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    backends = ["array"] + (["numpy"] if np is not None else [])
+    print(f"{'série':<24} {'dicts (ms)':>11} " + " ".join(f"{b + ' (ms)':>12}" for b in backends))
+    for months in (3, 6, 12):
+        points = make_points(months)
+        half = len(points) // 2
+        first, second = points[:half], points[half:]
+        expected = [row["sent"] for row in naive_report(first, second)]
+        row = [measure(lambda: naive_report(first, second))]  # noqa: B023
+        for backend in backends:
+            table = columnar_report(first, second, backend)
+            assert list(table["sent"].tolist()) == expected
+            row.append(measure(lambda: columnar_report(first, second, backend)))  # noqa: B023
+        label = f"{months} meses ({len(points):,} pts)"
+        print(f"{label:<24} " + " ".join(f"{t * 1000:>11.2f}" if i == 0 else f"{t * 1000:>12.2f}" for i, t in enumerate(row)))
+
+    points = make_points(12)
+    print("\nconversão de 12 meses por backend (já na resposta em dicts):")
+    for backend in backends:
+        ms = measure(lambda: TimeseriesTable.from_points(points, backend=backend)) * 1000  # noqa: B023
+        print(f"  from_points[{backend}]: {ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
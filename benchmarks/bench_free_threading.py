@@ -0,0 +1,94 @@
+"""Benchmark: escalabilidade por núcleo de envios em lote com o cliente síncrono.
+
+Dispara ``Notifications.send`` para uma lista de payloads via
+``map_concurrent`` (o mesmo fan-out de ``trigger_many``) com 1 a N threads,
+com caches locais ativos. O transporte HTTP é um ``httpx.MockTransport``:
+sem rede nem servidor, o custo medido é só CPU do SDK + httpx — com GIL a
+vazão fica estável ao adicionar threads; no CPython sem GIL (3.13t) ela
+deve crescer com o número de núcleos.
+
+Roda em CI: sem rede e com saída determinística. Com ``min_escala``, sai
+com código 1 se a vazão com todas as threads não atingir esse múltiplo da
+vazão com uma thread (use só em runners free-threaded com vários núcleos).
+
+Uso:
+    python benchmarks/bench_free_threading.py [envios] [min_escala]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx  # noqa: E402
+
+from notifica import Notifica, PreferenceCache  # noqa: E402
+from notifica.cache import free_threaded  # noqa: E402
+from notifica.concurrency import map_concurrent  # noqa: E402
+
+API_KEY = "nk_test_bench"
+BASE_URL = "https://bench.local/v1"
+RESPONSE = json.dumps({"data": {"id": "not_bench", "status": "pending"}}).encode()
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(202, content=RESPONSE, headers={"Content-Type": "application/json"})
+
+
+def make_client() -> Notifica:
+    client = Notifica(
+        API_KEY,
+        base_url=BASE_URL,
+        preference_cache=PreferenceCache(max_size=100_000),
+        normalize_phones=True,
+        validate_payloads=True,
+    )
+    http = client._client
+    http._client = httpx.Client(
+        base_url=BASE_URL, headers=http._default_headers(), transport=httpx.MockTransport(handler)
+    )
+    for i in range(1000):
+        client.notifications._preferences.store(  # type: ignore[union-attr]
+            f"sub_{i}", {"preferences": [{"category": "news", "channel": "sms", "enabled": True}]}
+        )
+    return client
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    min_scaling = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, max(cpus, 4) + 1)))
+    print(f"{total} envios, {cpus} CPUs, GIL {'desativado' if free_threaded() else 'ativo'}\n")
+
+    client = make_client()
+    payloads = [
+        ({"channel": "sms", "to": f"(11) 9{i % 10_000:04d}-{i % 7919:04d}", "template": "promo"}, i)
+        for i in range(total)
+    ]
+
+    def send(item: tuple[dict[str, str], int]) -> None:
+        params, i = item
+        client.notifications.send(params, {"subscriber_id": f"sub_{i % 1000}", "category": "news"})
+
+    map_concurrent(send, payloads[:500], 4)  # aquecimento
+    baseline = rate = 0.0
+    for threads in counts:
+        start = time.perf_counter()
+        map_concurrent(send, payloads, threads)
+        rate = total / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"  {threads:>3} threads {rate:>10,.0f} envios/s  (x{rate / baseline:.2f})")
+
+    if min_scaling is not None and rate / baseline < min_scaling:
+        print(f"\nescala x{rate / baseline:.2f} abaixo do mínimo x{min_scaling:.2f}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: vazão do renderizador local de templates.
+
+Uso:
+    python benchmarks/bench_rendering.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from notifica.rendering import CompiledTemplate  # noqa: E402
+
+CASES = [
+    (
+        "whatsapp curto (2 variáveis)",
+        CompiledTemplate("Olá {{name}}, seu pedido #{{order_id}} foi enviado!"),
+        {"name": "João", "order_id": 12345},
+    ),
+    (
+        "email (aninhadas + variantes)",
+        CompiledTemplate(
+            "Olá {{user.first_name}},\n\nSeu plano {{plan.name}} vence em {{plan.renews_at}}."
+            " Total: R$ {{plan.total}}.\n\nEquipe {{company}}",
+            {"subject": "{{user.first_name}}, sua fatura chegou", "html": "<p>{{user.first_name}}</p>"},
+        ),
+        {
+            "user": {"first_name": "Ana"},
+            "plan": {"name": "Pro", "renews_at": "2024-03-01", "total": 99.9},
+            "company": "Notifica",
+        },
+    ),
+]
+
+
+def measure(fn: object) -> float:
+    timer = timeit.Timer(fn)  # type: ignore[arg-type]
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    print(f"{'template':<32} {'render_body/s':>14} {'render (preview)/s':>20}")
+    for name, compiled, data in CASES:
+        body = measure(lambda: compiled.render_body(data))  # noqa: B023
+        full = measure(lambda: compiled.render(data))  # noqa: B023
+        print(f"{name:<32} {1 / body:>14,.0f} {1 / full:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
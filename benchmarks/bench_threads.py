@@ -0,0 +1,90 @@
+"""Benchmark: escalabilidade de um ``Notifica`` compartilhado entre threads.
+
+Cada thread envia notificações em loop pelo mesmo cliente contra um
+stand-in local da API; mede a vazão de 1 a N threads. Com latência fixa,
+a vazão ideal cresce linearmente com as threads (até saturar a CPU, já
+que o stand-in roda no mesmo processo) — o desvio mostra pontos de
+serialização (pool de conexões, locks, GIL). A coluna de conexões mostra
+quantas conexões novas cada rodada abriu: acima do limite de conexões
+ociosas do pool, cada envio pagaria um handshake (TLS, na API real).
+
+Uso:
+    python benchmarks/bench_threads.py [envios_por_thread] [latência_ms] [max_threads]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stand_in import connections, serve  # noqa: E402
+
+from notifica import Notifica, PreferenceCache, SmsConsentIndex  # noqa: E402
+
+API_KEY = "nk_test_bench"
+
+
+def run(client: Notifica, threads: int, per_thread: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for i in range(per_thread):
+            client.notifications.send(
+                {"channel": "sms", "to": f"+55119{index:03d}{i:05d}", "template": "welcome"},
+                {"subscriber_id": f"sub_{i % 100}"},
+            )
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    per_thread = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 5.0) / 1000
+    max_threads = int(sys.argv[3]) if len(sys.argv) > 3 else 64
+    counts = [n for n in (1, 2, 4, 8, 16, 32, 64, 128) if n <= max_threads]
+    print(f"{per_thread} envios por thread, latência {latency * 1000:.0f}ms, {os.cpu_count()} CPUs\n")
+
+    consent_index = SmsConsentIndex(max_age=None)
+    consent_index.load([{"phone": "+5511900000000", "status": "opted_out"}])
+    with serve(latency) as base_url:
+        for name, options in (
+            ("cliente simples", {}),
+            ("com caches locais", {
+                "preference_cache": PreferenceCache(),
+                "sms_consent_index": consent_index,
+                "validate_payloads": True,
+            }),
+        ):
+            print(name)
+            with Notifica(API_KEY, base_url=base_url, **options) as client:  # type: ignore[arg-type]
+                run(client, 4, 5)  # aquecimento
+                baseline = None
+                for threads in counts:
+                    opened = connections()
+                    elapsed = run(client, threads, per_thread)
+                    opened = connections() - opened
+                    rate = threads * per_thread / elapsed
+                    baseline = baseline or rate
+                    print(
+                        f"  {threads:>3} threads {rate:>10,.0f} envios/s  (x{rate / baseline:.1f})"
+                        f"  {opened:>5} conexões novas"
+                    )
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark: vazão de ``Workflows.trigger_many`` contra um stand-in local da API.
+
+Compara o loop sequencial de ``trigger`` com ``trigger_many`` (sync) e
+``trigger_many_async`` em diferentes níveis de concorrência.
+
+Uso:
+    python benchmarks/bench_trigger_many.py [destinatários] [latência_ms]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stand_in import serve  # noqa: E402
+
+from notifica import AsyncNotifica, Notifica  # noqa: E402
+from notifica.triggers import trigger_many_async  # noqa: E402
+
+API_KEY = "nk_test_bench"
+
+
+def report(name: str, count: int, elapsed: float) -> None:
+    print(f"{name:<36} {count / elapsed:>10,.0f} triggers/s  ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 5.0) / 1000
+    # 10% de duplicatas, como numa lista de destinatários real.
+    recipients = [f"+55119{i % (total * 9 // 10):08d}" for i in range(total)]
+    unique = len(set(recipients))
+    print(f"{total} destinatários ({unique} únicos), latência {latency * 1000:.0f}ms\n")
+
+    with serve(latency) as base_url:
+        with Notifica(API_KEY, base_url=base_url) as client:
+            start = time.perf_counter()
+            for recipient in dict.fromkeys(recipients):
+                client.workflows.trigger("welcome", {"recipient": recipient})
+            report("trigger sequencial", unique, time.perf_counter() - start)
+
+            for concurrency in (8, 32):
+                start = time.perf_counter()
+                client.workflows.trigger_many("welcome", recipients, max_concurrency=concurrency)
+                report(f"trigger_many (concorrência {concurrency})", unique, time.perf_counter() - start)
+
+        async def run_async(concurrency: int) -> float:
+            async with AsyncNotifica(API_KEY, base_url=base_url) as client:
+                start = time.perf_counter()
+                await trigger_many_async(client, "welcome", recipients, max_concurrency=concurrency)
+                return time.perf_counter() - start
+
+        for concurrency in (8, 32):
+            elapsed = asyncio.run(run_async(concurrency))
+            report(f"trigger_many_async (concorrência {concurrency})", unique, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark: custo por chamada dos validadores compilados.
+
+Uso:
+    python benchmarks/bench_validation.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from notifica.types import (  # noqa: E402
+    CreateSubscriberParams,
+    CreateWorkflowParams,
+    SendNotificationParams,
+    TriggerWorkflowParams,
+)
+from notifica.validation import compile_validator  # noqa: E402
+
+CASES = [
+    (
+        "SendNotificationParams",
+        SendNotificationParams,
+        {
+            "channel": "whatsapp",
+            "to": "+5511999999999",
+            "template": "welcome",
+            "data": {"name": "João", "plan": "pro"},
+            "metadata": {"campaign": "c1"},
+        },
+    ),
+    (
+        "CreateSubscriberParams",
+        CreateSubscriberParams,
+        {"external_id": "user-1", "email": "a@b.com", "phone": "+5511999999999", "name": "A"},
+    ),
+    (
+        "TriggerWorkflowParams",
+        TriggerWorkflowParams,
+        {"recipient": "+5511999999999", "data": {"name": "João"}},
+    ),
+    (
+        "CreateWorkflowParams (3 steps)",
+        CreateWorkflowParams,
+        {
+            "slug": "welcome-flow",
+            "name": "Welcome",
+            "steps": [
+                {"type": "send", "channel": "email", "template": "welcome-email"},
+                {"type": "delay", "duration": "1h"},
+                {"type": "fallback", "channels": ["whatsapp", "sms"], "template": "welcome"},
+            ],
+        },
+    ),
+]
+
+
+def main() -> None:
+    start = timeit.default_timer()
+    for _, schema, _ in CASES:
+        compile_validator.cache_clear()
+        compile_validator(schema)
+    compile_ms = (timeit.default_timer() - start) * 1000
+    print(f"compilação de {len(CASES)} validadores: {compile_ms:.2f} ms (uma vez por processo)\n")
+
+    print(f"{'schema':<34} {'µs/chamada':>12}")
+    for name, schema, payload in CASES:
+        validate = compile_validator(schema)
+        validate(payload)
+        timer = timeit.Timer(lambda: validate(payload))  # noqa: B023
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        print(f"{name:<34} {best * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
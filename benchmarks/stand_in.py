@@ -0,0 +1,76 @@
+"""Stand-in local e mínimo da API Notifica para os benchmarks.
+
+Responde a qualquer requisição com um envelope ``{"data": ...}`` após uma
+latência artificial, simulando o tempo de ida e volta da API real.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+
+_ids = count()
+_connections = [0]
+_connections_lock = threading.Lock()
+
+
+def connections() -> int:
+    """Total de conexões TCP aceitas pelo stand-in (mede reuso do pool)."""
+    return _connections[0]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def setup(self) -> None:
+        with _connections_lock:
+            _connections[0] += 1
+        super().setup()
+
+    def _respond(self, data: object) -> None:
+        body = json.dumps({"data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.latency)
+        self._respond({"id": f"obj_{next(_ids)}", "status": "pending", **payload})
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(self.latency)
+        self._respond({"id": self.path.rsplit("/", 1)[-1], "status": "delivered"})
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # O backlog padrão (5) derruba conexões sob concorrência alta.
+    request_queue_size = 1024
+
+
+@contextmanager
+def serve(latency: float = 0.005) -> Iterator[str]:
+    """Sobe o stand-in numa porta livre e retorna a ``base_url``."""
+    handler = type("Handler", (_Handler,), {"latency": latency})
+    server = _Server(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    finally:
+        server.shutdown()
+        server.server_close()
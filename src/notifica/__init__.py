@@ -23,8 +23,30 @@ Async:
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .analytics_cache import AnalyticsCache
 from .client import AsyncNotificaClient, NotificaClient
-from .errors import ApiError, NotificaError, RateLimitError, TimeoutError, ValidationError
+from .columnar import ColumnarTable, TimeseriesTable
+from .consents import SmsConsentIndex
+from .deliveries import DeliveryFuture, DeliveryIndex, WebhookReceiver
+from .domain_health import DomainHealthCache
+from .errors import (
+    ApiError,
+    NotificaError,
+    QuotaExceededError,
+    RateLimitError,
+    TimeoutError,
+    ValidationError,
+    WebhookSignatureError,
+)
+from .governor import QuotaGovernor
+from .hooks import LoggingHook, MetricsHook, RequestHook
+from .phone import is_valid_phone, normalize_phone
+from .preferences import PreferenceCache
+from .previews import PreviewCache
+from .registry import AsyncClientRegistry, ClientRegistry
 from .resources.analytics import Analytics
 from .resources.api_keys import ApiKeys
 from .resources.audit import Audit
@@ -39,6 +61,10 @@ from .resources.subscribers import Subscribers
 from .resources.templates import Templates
 from .resources.webhooks import Webhooks
 from .resources.workflows import Workflows
+from .runs import WorkflowRunWatcher
+from .template_index import TemplateVariableIndex
+from .tracking import NotificationTracker
+from .transport import SharedTransport
 
 __version__ = "0.1.0"
 
@@ -46,12 +72,40 @@ __all__ = [
     # Clientes
     "Notifica",
     "AsyncNotifica",
+    "SharedTransport",
+    "ClientRegistry",
+    "AsyncClientRegistry",
+    # Observabilidade
+    "RequestHook",
+    "LoggingHook",
+    "MetricsHook",
     # Erros
     "NotificaError",
     "ApiError",
     "ValidationError",
     "RateLimitError",
     "TimeoutError",
+    "WebhookSignatureError",
+    "QuotaExceededError",
+    # Caches locais
+    "PreferenceCache",
+    "SmsConsentIndex",
+    "PreviewCache",
+    "TemplateVariableIndex",
+    "AnalyticsCache",
+    "DomainHealthCache",
+    # Utilitários
+    "normalize_phone",
+    "is_valid_phone",
+    "NotificationTracker",
+    "WorkflowRunWatcher",
+    "QuotaGovernor",
+    "ColumnarTable",
+    "TimeseriesTable",
+    # Confirmação de entrega
+    "DeliveryIndex",
+    "DeliveryFuture",
+    "WebhookReceiver",
     # Recursos (para uso avançado)
     "Notifications",
     "Templates",
@@ -79,6 +133,29 @@ class Notifica:
         timeout: Timeout padrão em segundos (default: 30.0)
         max_retries: Máximo de retries em 429/5xx (default: 3)
         auto_idempotency: Gerar idempotency key automaticamente para POSTs (default: True)
+        preference_cache: Cache opt-in de preferências para pular envios a
+            subscribers que desativaram o canal (default: None)
+        sms_consent_index: Índice local de opt-outs SMS para pular envios a
+            números bloqueados (default: None)
+        normalize_phones: Normalizar telefones para E.164 localmente (``to`` de
+            envios WhatsApp/SMS e consentimentos), rejeitando inválidos sem
+            round trip (default: False)
+        validate_payloads: Validar localmente os payloads de envio, criação de
+            subscribers e workflows contra os TypedDicts de ``notifica.types``
+            (default: False)
+        preview_cache: Cache LRU de previews de templates (default: None)
+        template_variable_index: Índice das variáveis de cada template para
+            verificar ``data`` localmente nos envios (default: None)
+        delivery_index: Índice de ``DeliveryFuture`` pendentes, resolvidos por
+            ``WebhookReceiver`` em ``notifications.send_tracked`` (default: None)
+        quota_governor: Limitador de envios conforme o uso da quota do plano,
+            lido de ``billing.usage`` (default: None)
+        analytics_cache: Cache de analytics com TTL por período e atualização
+            incremental de ``timeseries`` (default: None)
+        domain_health_cache: Cache com TTL curto de ``domains.get_health``,
+            usado também por ``domains.check_health`` (default: None)
+        hooks: ``RequestHook``s notificados a cada tentativa, resposta, retry
+            e falha das requisições HTTP (default: None)
 
     Example:
         ```python
@@ -124,6 +201,18 @@ class Notifica:
         timeout: float = 30.0,
         max_retries: int = 3,
         auto_idempotency: bool = True,
+        preference_cache: PreferenceCache | None = None,
+        sms_consent_index: SmsConsentIndex | None = None,
+        normalize_phones: bool = False,
+        validate_payloads: bool = False,
+        preview_cache: PreviewCache | None = None,
+        template_variable_index: TemplateVariableIndex | None = None,
+        delivery_index: DeliveryIndex | None = None,
+        quota_governor: QuotaGovernor | None = None,
+        analytics_cache: AnalyticsCache | None = None,
+        domain_health_cache: DomainHealthCache | None = None,
+        transport: SharedTransport | None = None,
+        hooks: Iterable[RequestHook] | None = None,
     ) -> None:
         self._client = NotificaClient(
             api_key=api_key,
@@ -131,19 +220,57 @@ class Notifica:
             timeout=timeout,
             max_retries=max_retries,
             auto_idempotency=auto_idempotency,
+            transport=transport,
+            hooks=hooks,
+        )
+        # Configuração serializável (veja ``__reduce__``).
+        self._config = {
+            "base_url": base_url,
+            "timeout": timeout,
+            "max_retries": max_retries,
+            "auto_idempotency": auto_idempotency,
+            "normalize_phones": normalize_phones,
+            "validate_payloads": validate_payloads,
+        }
+
+        self.notifications = Notifications(
+            self._client,
+            preference_cache=preference_cache,
+            sms_consent_index=sms_consent_index,
+            normalize_phones=normalize_phones,
+            validate_payloads=validate_payloads,
+            template_variable_index=template_variable_index,
+            delivery_index=delivery_index,
+            quota_governor=quota_governor,
+        )
+        self.templates = Templates(
+            self._client,
+            preview_cache=preview_cache,
+            variable_index=template_variable_index,
+        )
+        self.workflows = Workflows(
+            self._client,
+            validate_payloads=validate_payloads,
+            quota_governor=quota_governor,
+        )
+        self.subscribers = Subscribers(
+            self._client,
+            preference_cache=preference_cache,
+            validate_payloads=validate_payloads,
         )
-
-        self.notifications = Notifications(self._client)
-        self.templates = Templates(self._client)
-        self.workflows = Workflows(self._client)
-        self.subscribers = Subscribers(self._client)
         self.channels = Channels(self._client)
-        self.domains = Domains(self._client)
+        self.domains = Domains(self._client, health_cache=domain_health_cache)
         self.webhooks = Webhooks(self._client)
         self.api_keys = ApiKeys(self._client)
-        self.analytics = Analytics(self._client)
-        self.sms = Sms(self._client)
+        self.analytics = Analytics(self._client, cache=analytics_cache)
+        self.sms = Sms(
+            self._client,
+            consent_index=sms_consent_index,
+            normalize_phones=normalize_phones,
+        )
         self.billing = Billing(self._client)
+        if quota_governor is not None:
+            quota_governor.attach(self.billing)
         self.inbox_embed = InboxEmbed(self._client)
         self.inbox = Inbox(self._client)
         self.audit = Audit(self._client)
@@ -152,6 +279,16 @@ class Notifica:
         """Fecha o cliente HTTP."""
         self._client.close()
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Serializa a configuração e os hooks (ex: para ``ProcessPoolExecutor``).
+
+        Hooks serializáveis são levados; os demais (ex: ``MetricsHook``) são
+        descartados com um ``RuntimeWarning``. Caches, índices, governor e
+        ``transport`` são locais ao processo e não são levados; o cliente
+        desserializado cria o próprio pool no primeiro uso.
+        """
+        return (_restore, (Notifica, self._client._api_key, {**self._config, "hooks": _hooks(self._client)}))
+
     def __enter__(self) -> Notifica:
         return self
 
@@ -192,6 +329,8 @@ class AsyncNotifica:
         timeout: float = 30.0,
         max_retries: int = 3,
         auto_idempotency: bool = True,
+        transport: SharedTransport | None = None,
+        hooks: Iterable[RequestHook] | None = None,
     ) -> None:
         self._client = AsyncNotificaClient(
             api_key=api_key,
@@ -199,14 +338,35 @@ class AsyncNotifica:
             timeout=timeout,
             max_retries=max_retries,
             auto_idempotency=auto_idempotency,
+            transport=transport,
+            hooks=hooks,
         )
 
     async def close(self) -> None:
         """Fecha o cliente HTTP."""
         await self._client.close()
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Serializa a configuração e os hooks (veja ``Notifica.__reduce__``)."""
+        http = self._client
+        return (_restore, (AsyncNotifica, http._api_key, {
+            "base_url": http._base_url,
+            "timeout": http._timeout,
+            "max_retries": http._max_retries,
+            "auto_idempotency": http._auto_idempotency,
+            "hooks": _hooks(http),
+        }))
+
     async def __aenter__(self) -> AsyncNotifica:
         return self
 
     async def __aexit__(self, *args: object) -> None:
         await self.close()
+
+
+def _restore(cls: Callable[..., Any], api_key: str, config: dict[str, Any]) -> Any:
+    return cls(api_key, **config)
+
+
+def _hooks(http: NotificaClient | AsyncNotificaClient) -> list[RequestHook] | None:
+    return http._hooks.picklable() if http._hooks is not None else None
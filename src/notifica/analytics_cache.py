@@ -0,0 +1,202 @@
+"""Cache de analytics com TTL por período e atualização incremental de séries.
+
+Dashboards pedem ``timeseries`` com ``period="30d"`` e ``granularity="hour"``
+a cada minuto e baixam 720 pontos, dos quais só os últimos mudaram. Buckets
+cujo intervalo terminou antes da última consulta são definitivos e ficam
+guardados; ao expirar o TTL, a série é atualizada com o menor ``period``
+que cubra os buckets abertos desde então — ``"1h"`` enquanto a hora não
+vira, ``"24h"`` (24 pontos) sempre que ela vira — e só esses buckets são
+mesclados.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .cache import TTLCache
+from .columnar import parse_timestamps
+from .previews import fingerprint
+
+PERIOD_SECONDS = {"1h": 3600, "24h": 86400, "7d": 7 * 86400, "30d": 30 * 86400}
+GRANULARITY_SECONDS = {"hour": 3600, "day": 86400}
+DEFAULT_TTLS = {"1h": 10.0, "24h": 60.0, "7d": 120.0, "30d": 300.0}
+
+_MAX_SPAN = max(PERIOD_SECONDS.values())
+
+
+class _Series:
+    """Buckets conhecidos de uma série (mesma granularidade e filtros)."""
+
+    __slots__ = ("points", "covered_from", "fetched_at")
+
+    def __init__(self, covered_from: float, fetched_at: float) -> None:
+        self.points: dict[int, dict[str, Any]] = {}
+        self.covered_from = covered_from
+        self.fetched_at = fetched_at
+
+
+class AnalyticsCache:
+    """Cache opt-in dos endpoints de analytics.
+
+    ``overview``, ``by_channel`` e ``top_templates`` são memoizados pelo
+    TTL do seu ``period``. ``timeseries`` com ``period`` e ``granularity``
+    guarda os buckets por granularidade + filtros, compartilhados entre
+    períodos (um painel de 7d reaproveita a série de 30d): dentro do TTL,
+    nenhuma requisição; depois dele, uma só, com o menor período que
+    cubra os buckets abertos desde a última consulta (``"1h"`` na mesma
+    hora, ``"24h"`` quando a hora virou). Buckets já fechados mantêm os
+    valores em cache; da resposta, só os abertos são mesclados.
+
+    Args:
+        ttls: TTL em segundos por ``AnalyticsPeriod`` (mesclado a ``DEFAULT_TTLS``).
+        default_ttl: TTL de consultas sem ``period``.
+        max_size: Número máximo de respostas não incrementais em cache.
+        clock: Relógio de parede em segundos (comparado aos timestamps dos buckets).
+
+    Example:
+        ```python
+        from notifica import AnalyticsCache, Notifica
+
+        client = Notifica("nk_live_...", analytics_cache=AnalyticsCache())
+        params = {"period": "30d", "granularity": "hour"}
+        client.analytics.timeseries(params)  # 720 pontos
+        client.analytics.timeseries(params)  # cache
+        # ...após o TTL: GET ?period=1h&granularity=hour, mesclado aos buckets fechados
+        # ...após virar a hora: GET ?period=24h&granularity=hour
+        ```
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 60.0,
+        max_size: int = 256,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._default_ttl = default_ttl
+        self._clock = clock
+        self._responses: TTLCache[tuple[str, str], Any] = TTLCache(max_size, default_ttl, clock=clock)
+        self._series: dict[str, _Series] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.refreshes = 0
+        self.full_fetches = 0
+        self.points_fetched = 0
+
+    def ttl(self, period: str | None) -> float:
+        """TTL aplicado a um ``AnalyticsPeriod``."""
+        return self._ttls.get(period, self._default_ttl) if period else self._default_ttl
+
+    # ── Respostas inteiras ──────────────────────────────
+
+    def cached(self, path: str, params: dict[str, Any], fetch: Callable[[], Any]) -> Any:
+        """Resposta de ``path`` em cache pelo TTL do período, ou ``fetch()``."""
+        key = (path, fingerprint(params))
+        value = self._responses.get(key)
+        if value is None:
+            value = fetch()
+            self._responses.set(key, value, ttl=self.ttl(params.get("period")))
+        else:
+            with self._lock:
+                self.hits += 1
+        return copy.deepcopy(value)
+
+    # ── Séries temporais ────────────────────────────────
+
+    def timeseries(
+        self,
+        params: dict[str, Any],
+        fetch: Callable[[dict[str, Any]], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Série de ``params`` a partir dos buckets em cache, buscando só o necessário.
+
+        Sem ``period`` ou ``granularity`` conhecidos, a série é cacheada
+        inteira, como em ``cached``.
+        """
+        period, granularity = params.get("period"), params.get("granularity")
+        if period not in PERIOD_SECONDS or granularity not in GRANULARITY_SECONDS:
+            return self.cached("/analytics/timeseries", params, lambda: fetch(params))  # type: ignore[no-any-return]
+
+        span, step = PERIOD_SECONDS[period], GRANULARITY_SECONDS[granularity]
+        key = fingerprint({k: v for k, v in params.items() if k != "period"})
+        now = self._clock()
+        # Os buckets de uma série são alterados por outras threads; leituras
+        # e cópias acontecem sob o lock, a requisição fora dele.
+        with self._lock:
+            series = self._series.get(key)
+            covered = series is not None and series.covered_from <= now - span
+            if series is not None and covered and now - series.fetched_at < self.ttl(period):
+                self.hits += 1
+                return self._window(series, now, span, step)
+            refresh_period = None
+            open_from = 0.0
+            if series is not None and covered:
+                # Do bucket aberto na última consulta até o atual, inclusive.
+                open_from = series.fetched_at // step * step
+                refresh_period = _smallest_period(now // step * step - open_from + step, span)
+
+        points = fetch({**params, "period": refresh_period} if refresh_period else params)
+        timestamps = parse_timestamps([point["timestamp"] for point in points])
+        with self._lock:
+            if refresh_period is None or series is None:
+                series = self._series[key] = _Series(now - span, now)
+                self.full_fetches += 1
+            else:
+                self.refreshes += 1
+            self.points_fetched += len(points)
+            # Da atualização, só os buckets ainda abertos na última consulta:
+            # os fechados antes dela são definitivos e continuam os do cache.
+            series.points.update(
+                (ts, point) for ts, point in zip(timestamps, points, strict=True) if ts >= open_from
+            )
+            series.fetched_at = now
+            self._trim(series, now, step)
+            return self._window(series, now, span, step)
+
+    @staticmethod
+    def _trim(series: _Series, now: float, step: int) -> None:
+        """Descarta buckets fora do maior período possível."""
+        oldest = now - _MAX_SPAN
+        stale = [ts for ts in series.points if ts + step <= oldest]
+        for ts in stale:
+            del series.points[ts]
+        series.covered_from = max(series.covered_from, oldest)
+
+    @staticmethod
+    def _window(series: _Series, now: float, span: int, step: int) -> list[dict[str, Any]]:
+        """Cópia dos ``span / step`` últimos buckets, até o atual (aberto), em ordem."""
+        start = now // step * step - span
+        return [dict(series.points[ts]) for ts in sorted(series.points) if start < ts <= now]
+
+    def clear(self) -> None:
+        """Remove todas as respostas e séries em cache."""
+        with self._lock:
+            self._series.clear()
+        self._responses.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Métricas: hits, atualizações incrementais, buscas completas e pontos baixados."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "refreshes": self.refreshes,
+                "full_fetches": self.full_fetches,
+                "points_fetched": self.points_fetched,
+                "series": len(self._series),
+                "responses": len(self._responses),
+            }
+
+
+def _smallest_period(needed: float, limit: int) -> str | None:
+    """Menor ``AnalyticsPeriod`` que cobre ``needed`` segundos sem passar de ``limit``."""
+    for period, seconds in sorted(PERIOD_SECONDS.items(), key=lambda item: item[1]):
+        if seconds > limit:
+            break
+        if seconds >= needed:
+            return period
+    return None
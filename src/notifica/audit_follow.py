@@ -0,0 +1,147 @@
+"""Modo *follow* (tail) dos audit logs, para streaming quase em tempo real.
+
+Cada consulta lista apenas as entradas a partir da marca d'água
+(``start_date`` = ``created_at`` mais recente já visto). O intervalo entre
+consultas é adaptativo: volta a ``min_interval`` quando chegam entradas
+novas e cresce por ``backoff`` até ``max_interval`` enquanto ocioso.
+Ids já emitidos são lembrados numa janela limitada (``max_seen``) — a
+fronteira inclusiva de ``start_date`` devolve as últimas entradas de novo.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .client import async_http_client
+
+if TYPE_CHECKING:
+    from . import AsyncNotifica
+    from .client import AsyncNotificaClient
+    from .resources.audit import Audit
+
+AUDIT_PATH = "/internal/audit-logs"
+
+
+class _Follower:
+    """Estado compartilhado entre ``follow`` e ``follow_async``."""
+
+    def __init__(
+        self,
+        params: dict[str, Any] | None,
+        since: str | None,
+        min_interval: float,
+        max_interval: float,
+        backoff: float,
+        max_seen: int,
+    ) -> None:
+        self.params = dict(params or {})
+        self.params.pop("cursor", None)
+        self.high_water_mark = since
+        self.bootstrapped = since is not None
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.max_seen = max_seen
+        self._seen: OrderedDict[str, None] = OrderedDict()
+
+    def bootstrap_request(self) -> dict[str, Any]:
+        return {**self.params, "limit": 1}
+
+    def request(self) -> dict[str, Any]:
+        if self.high_water_mark is None:
+            return dict(self.params)
+        return {**self.params, "start_date": self.high_water_mark}
+
+    def _remember(self, log_id: str) -> None:
+        self._seen[log_id] = None
+        if len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+
+    def bootstrap(self, page: list[dict[str, Any]]) -> None:
+        """Começa do agora: a entrada mais recente vira a marca d'água."""
+        self.bootstrapped = True
+        if page:
+            self.high_water_mark = page[0]["created_at"]
+            self._remember(page[0]["id"])
+
+    def accept(self, logs: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Filtra entradas já vistas, ordena da mais antiga para a mais nova e ajusta o intervalo."""
+        new = [log for log in logs if log["id"] not in self._seen]
+        # A API lista da mais nova para a mais antiga; inverter antes da
+        # ordenação estável preserva a ordem entre entradas do mesmo instante.
+        new.reverse()
+        new.sort(key=lambda log: log["created_at"])
+        for log in new:
+            self._remember(log["id"])
+            if self.high_water_mark is None or log["created_at"] > self.high_water_mark:
+                self.high_water_mark = log["created_at"]
+        if new:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        return new
+
+
+def follow(
+    audit: Audit,
+    params: dict[str, Any] | None = None,
+    *,
+    since: str | None = None,
+    min_interval: float = 1.0,
+    max_interval: float = 60.0,
+    backoff: float = 2.0,
+    max_seen: int = 10_000,
+    max_polls: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[dict[str, Any]]:
+    """Implementação de ``Audit.follow`` (veja sua documentação)."""
+    state = _Follower(params, since, min_interval, max_interval, backoff, max_seen)
+    if not state.bootstrapped:
+        state.bootstrap(audit.list(state.bootstrap_request())["data"])
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        if polls:
+            sleep(state.interval)
+        polls += 1
+        yield from state.accept(audit.list_auto(state.request()))
+
+
+async def follow_async(
+    client: AsyncNotifica | AsyncNotificaClient,
+    params: dict[str, Any] | None = None,
+    *,
+    since: str | None = None,
+    min_interval: float = 1.0,
+    max_interval: float = 60.0,
+    backoff: float = 2.0,
+    max_seen: int = 10_000,
+    max_polls: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Equivalente assíncrono de ``Audit.follow``.
+
+    Example:
+        ```python
+        from notifica.audit_follow import follow_async
+
+        async with AsyncNotifica(admin_token) as client:
+            async for log in follow_async(client, {"resource_type": "api_key"}):
+                await siem.send(log)
+        ```
+    """
+    http = async_http_client(client)
+    state = _Follower(params, since, min_interval, max_interval, backoff, max_seen)
+    if not state.bootstrapped:
+        state.bootstrap((await http.list(AUDIT_PATH, params=state.bootstrap_request()))["data"])
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        if polls:
+            await asyncio.sleep(state.interval)
+        polls += 1
+        logs = [log async for log in http.list_auto(AUDIT_PATH, params=state.request())]
+        for log in state.accept(logs):
+            yield log
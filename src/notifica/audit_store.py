@@ -0,0 +1,244 @@
+"""Espelho local (SQLite) dos audit logs, com sincronização incremental.
+
+Investigações recorrentes consultam o espelho local — com índices por
+ação, tipo de recurso, ator e data — em vez de paginar
+``/internal/audit-logs`` a cada consulta.
+
+Example:
+    ```python
+    from notifica.audit_store import AuditLogStore
+
+    with AuditLogStore("audit.db", client.audit) as store:
+        store.sync()  # busca só entradas mais novas que a última sincronizada
+        logs = store.query(action="api_key.revoked", start_date="2024-01-01T00:00:00Z")
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Literal
+
+from .previews import fingerprint
+
+if TYPE_CHECKING:
+    from .resources.audit import Audit
+
+SYNC_BATCH_SIZE = 500
+
+_WATERMARK = "high_water_mark"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id TEXT PRIMARY KEY,
+    action TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    resource_id TEXT,
+    actor_type TEXT,
+    actor_id TEXT,
+    created_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS audit_logs_action ON audit_logs (action, created_at);
+CREATE INDEX IF NOT EXISTS audit_logs_resource ON audit_logs (resource_type, resource_id, created_at);
+CREATE INDEX IF NOT EXISTS audit_logs_actor ON audit_logs (actor_type, actor_id, created_at);
+CREATE INDEX IF NOT EXISTS audit_logs_created_at ON audit_logs (created_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_INSERT = (
+    "INSERT OR IGNORE INTO audit_logs "
+    "(id, action, resource_type, resource_id, actor_type, actor_id, created_at, payload) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Filtro de ``query`` -> (coluna, operador)
+_FILTERS = {
+    "action": ("action", "="),
+    "resource_type": ("resource_type", "="),
+    "resource_id": ("resource_id", "="),
+    "actor_type": ("actor_type", "="),
+    "actor_id": ("actor_id", "="),
+    "start_date": ("created_at", ">="),
+    "end_date": ("created_at", "<="),
+}
+
+
+def _watermark_key(params: dict[str, Any]) -> str:
+    """Chave da marca d'água em ``sync_state`` para um conjunto de filtros.
+
+    Cada combinação de filtros tem a sua: uma sincronização filtrada só viu
+    parte das entradas e não pode adiantar a de outra combinação.
+    """
+    filters = {name: value for name, value in params.items() if name not in ("start_date", "cursor")}
+    return f"{_WATERMARK}:{fingerprint(filters)}" if filters else _WATERMARK
+
+
+def _row(log: dict[str, Any]) -> tuple[Any, ...]:
+    actor = log.get("actor") or {}
+    return (
+        log["id"],
+        log.get("action", ""),
+        log.get("resource_type", ""),
+        log.get("resource_id"),
+        actor.get("type"),
+        actor.get("id"),
+        log["created_at"],
+        json.dumps(log, separators=(",", ":")),
+    )
+
+
+class AuditLogStore:
+    """Espelho SQLite dos audit logs.
+
+    ``sync()`` busca apenas entradas a partir da última sincronizada
+    (``start_date`` = marca d'água) e as grava em lotes de
+    ``SYNC_BATCH_SIZE``; entradas repetidas na fronteira são ignoradas pela
+    chave primária. Sincronizações com filtros (``action``, ``actor_id``...)
+    mantêm uma marca d'água própria por combinação de filtros.
+
+    Args:
+        path: Caminho do banco SQLite (default: em memória).
+        audit: Recurso ``client.audit`` usado por ``sync()``.
+    """
+
+    def __init__(self, path: str = ":memory:", audit: Audit | None = None) -> None:
+        self._audit = audit
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    # ── Sincronização ───────────────────────────────────
+
+    @property
+    def high_water_mark(self) -> str | None:
+        """``created_at`` da entrada mais nova sincronizada sem filtros."""
+        return self._watermark(_WATERMARK)
+
+    def _watermark(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _insert(self, batch: list[dict[str, Any]]) -> int:
+        with self._lock, self._db:
+            return self._db.executemany(_INSERT, [_row(log) for log in batch]).rowcount
+
+    def _advance(self, key: str, newest: str) -> None:
+        current = self._watermark(key)
+        if current is not None and current >= newest:
+            return
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, newest))
+
+    def add(self, logs: Iterable[dict[str, Any]]) -> int:
+        """Grava entradas (ignorando ids já presentes); retorna quantas eram novas."""
+        return self._store(logs)[1]
+
+    def _store(self, logs: Iterable[dict[str, Any]], key: str = _WATERMARK) -> tuple[int, int]:
+        fetched = inserted = 0
+        newest = ""
+        batch: list[dict[str, Any]] = []
+        for log in logs:
+            fetched += 1
+            batch.append(log)
+            if log["created_at"] > newest:
+                newest = log["created_at"]
+            if len(batch) >= SYNC_BATCH_SIZE:
+                inserted += self._insert(batch)
+                batch = []
+        if batch:
+            inserted += self._insert(batch)
+        # A marca d'água só avança ao final: a listagem vem da mais nova para
+        # a mais antiga, e uma sincronização interrompida não pode pular entradas.
+        if newest:
+            self._advance(key, newest)
+        return fetched, inserted
+
+    def sync(self, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Busca e grava as entradas mais novas que a marca d'água dos filtros.
+
+        Retorna ``{"fetched", "inserted", "high_water_mark"}``, com a marca
+        d'água da combinação de filtros em ``params``.
+        """
+        if self._audit is None:
+            raise RuntimeError("AuditLogStore não está associado a client.audit")
+        request = dict(params or {})
+        key = _watermark_key(request)
+        high_water_mark = self._watermark(key)
+        if high_water_mark is not None:
+            request["start_date"] = high_water_mark
+        fetched, inserted = self._store(self._audit.list_auto(request), key)
+        return {"fetched": fetched, "inserted": inserted, "high_water_mark": self._watermark(key)}
+
+    # ── Consultas ───────────────────────────────────────
+
+    def _where(self, filters: dict[str, Any]) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        values: list[Any] = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name not in _FILTERS:
+                raise TypeError(f"Filtro desconhecido: {name}")
+            column, operator = _FILTERS[name]
+            clauses.append(f"{column} {operator} ?")
+            values.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", values
+
+    def query(
+        self,
+        *,
+        limit: int | None = None,
+        order: Literal["asc", "desc"] = "desc",
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """Consulta o espelho local.
+
+        Filtros: ``action``, ``resource_type``, ``resource_id``,
+        ``actor_type``, ``actor_id``, ``start_date`` e ``end_date``
+        (ISO 8601, inclusivos) — os mesmos de ``Audit.list``.
+        """
+        where, values = self._where(filters)
+        direction = "ASC" if order == "asc" else "DESC"
+        sql = f"SELECT payload FROM audit_logs{where} ORDER BY created_at {direction}, id {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            values.append(limit)
+        with self._lock:
+            rows = self._db.execute(sql, values).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def count(self, **filters: Any) -> int:
+        """Conta as entradas que atendem aos filtros de ``query``."""
+        where, values = self._where(filters)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM audit_logs{where}", values).fetchone()[0]  # type: ignore[no-any-return]
+
+    def get(self, id: str) -> dict[str, Any] | None:
+        """Obtém uma entrada pelo id, ou ``None``."""
+        with self._lock:
+            row = self._db.execute("SELECT payload FROM audit_logs WHERE id = ?", (id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __len__(self) -> int:
+        return self.count()
+
+    # ── Lifecycle ───────────────────────────────────────
+
+    def close(self) -> None:
+        """Fecha o banco."""
+        self._db.close()
+
+    def __enter__(self) -> AuditLogStore:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
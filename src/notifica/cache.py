@@ -0,0 +1,145 @@
+"""Cache LRU com TTL usado pelos caches locais opcionais do SDK."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar, cast
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Entradas mínimas por shard: caches pequenos continuam um LRU exato.
+_MIN_SHARD_SIZE = 64
+
+
+def free_threaded() -> bool:
+    """Indica se o interpretador roda sem GIL (CPython 3.13t+)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_shards() -> int:
+    """Shards padrão: 1 com GIL; sem GIL, um por CPU (até 16)."""
+    return min(16, os.cpu_count() or 1) if free_threaded() else 1
+
+
+class _Shard(Generic[K, V]):
+    __slots__ = ("data", "lock", "max_size", "hits", "misses", "evictions")
+
+    def __init__(self, max_size: int) -> None:
+        self.data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class TTLCache(Generic[K, V]):
+    """Cache em memória limitado por tamanho (LRU) e por tempo de vida (TTL).
+
+    Thread-safe: cada operação usa um único lock curto. Com ``shards > 1``
+    as chaves são repartidas por hash entre LRUs independentes, cada um com
+    seu lock — threads em núcleos diferentes (Python sem GIL) raramente
+    disputam o mesmo lock. O LRU passa a ser por shard.
+
+    Args:
+        max_size: Número máximo de entradas; a menos usada recentemente é descartada.
+        ttl: Tempo de vida de cada entrada em segundos (``None`` = sem expiração).
+        clock: Relógio monotônico (injetável em testes).
+        shards: Número de partições (default: ``default_shards()``); limitado
+            para que cada uma tenha ao menos 64 entradas.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        shards: int | None = None,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size deve ser maior que zero")
+        count = default_shards() if shards is None else shards
+        count = max(1, min(count, max_size // _MIN_SHARD_SIZE))
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        per_shard = -(-max_size // count)
+        self._shards: list[_Shard[K, V]] = [_Shard(per_shard) for _ in range(count)]
+
+    def _shard(self, key: object) -> _Shard[K, V]:
+        shards = self._shards
+        return shards[0] if len(shards) == 1 else shards[hash(key) % len(shards)]
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Obtém um valor, ou ``default`` se ausente ou expirado."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.data.get(key)
+            if entry is None:
+                shard.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at < self._clock():
+                del shard.data[key]
+                shard.misses += 1
+                return default
+            shard.data.move_to_end(key)
+            shard.hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Armazena um valor, opcionalmente com TTL próprio."""
+        ttl = self._ttl if ttl is None else ttl
+        expires_at = float("inf") if ttl is None else self._clock() + ttl
+        shard = self._shard(key)
+        with shard.lock:
+            shard.data[key] = (expires_at, value)
+            shard.data.move_to_end(key)
+            while len(shard.data) > shard.max_size:
+                shard.data.popitem(last=False)
+                shard.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """Remove uma entrada (no-op se ausente)."""
+        shard = self._shard(key)
+        with shard.lock:
+            shard.data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            # ``in`` aceita qualquer objeto; chaves de outro tipo só não são encontradas.
+            entry = shard.data.get(cast(K, key))
+            return entry is not None and entry[0] >= self._clock()
+
+    def __len__(self) -> int:
+        return sum(len(shard.data) for shard in self._shards)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        return sum(shard.misses for shard in self._shards)
+
+    @property
+    def evictions(self) -> int:
+        return sum(shard.evictions for shard in self._shards)
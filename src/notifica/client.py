@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import json as jsonlib
+import os
 import random
+import threading
 import time
 import uuid
-from typing import Any, AsyncIterator, Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from .errors import ApiError, NotificaError, RateLimitError, TimeoutError, ValidationError
+from .hooks import HookDispatcher, RequestHook
+from .transport import DEFAULT_LIMITS, SharedTransport
+from .types import RetryReason
+
+if TYPE_CHECKING:
+    from . import AsyncNotifica
 
 DEFAULT_BASE_URL = "https://app.usenotifica.com.br/v1"
 DEFAULT_TIMEOUT = 30.0
@@ -18,6 +28,41 @@ SDK_VERSION = "0.1.0"
 
 RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
+# Serializa a recriação do cliente httpx após um fork (rara; fora dela,
+# nenhuma requisição passa por lock do SDK).
+_fork_lock = threading.Lock()
+
+
+def _reset_fork_lock() -> None:
+    global _fork_lock
+    _fork_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_fork_lock)
+
+# Tamanho alvo de cada chunk enviado em corpos streaming (chunked transfer encoding).
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _retry_delay(attempt: int, last_error: Exception | None) -> float:
+    """Espera antes da tentativa ``attempt`` (``Retry-After`` ou backoff exponencial com jitter)."""
+    if isinstance(last_error, RateLimitError) and last_error.retry_after is not None:
+        return float(last_error.retry_after)
+    base = 0.5 * 2.0 ** (attempt - 1)
+    jitter = random.random() * base * 0.5  # noqa: S311
+    return base + jitter
+
+
+def _retry_reason(error: Exception | None) -> RetryReason:
+    if isinstance(error, TimeoutError):
+        return "timeout"
+    if isinstance(error, RateLimitError):
+        return "rate_limited"
+    if isinstance(error, ApiError):
+        return "server_error"
+    return "network"
+
 
 def _clean_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
     """Remove chaves com valor None de query params."""
@@ -26,6 +71,72 @@ def _clean_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
     return {k: v for k, v in params.items() if v is not None}
 
 
+def _encode_json(value: Any) -> bytes:
+    """Serializa um valor em JSON compacto (mesmo formato usado pelo httpx)."""
+    return jsonlib.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _open_json_array(key: str, extra: dict[str, Any] | None) -> bytes:
+    """Abre o objeto ``{...extra, "key": [`` de um corpo streaming."""
+    head = _encode_json({**(extra or {}), key: []})
+    return head[: -len(b"[]}")] + b"["
+
+
+def _iter_json_array_body(
+    key: str,
+    items: Iterable[Any],
+    extra: dict[str, Any] | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Codifica ``{key: [items...]}`` incrementalmente em chunks de bytes.
+
+    Cada item é serializado assim que é consumido do iterável, de modo que
+    o pico de memória é um item (mais um buffer de ``chunk_size`` bytes) e
+    não o payload inteiro.
+    """
+    buffer = bytearray(_open_json_array(key, extra))
+    first = True
+    for item in items:
+        if not first:
+            buffer += b","
+        buffer += _encode_json(item)
+        first = False
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
+async def _aiter_json_array_body(
+    key: str,
+    items: Iterable[Any] | AsyncIterable[Any],
+    extra: dict[str, Any] | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Versão assíncrona de ``_iter_json_array_body``.
+
+    Aceita tanto iteráveis síncronos quanto assíncronos.
+    """
+    if not hasattr(items, "__aiter__"):
+        for chunk in _iter_json_array_body(key, items, extra, chunk_size):
+            yield chunk
+        return
+
+    buffer = bytearray(_open_json_array(key, extra))
+    first = True
+    async for item in items:
+        if not first:
+            buffer += b","
+        buffer += _encode_json(item)
+        first = False
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
 def _parse_error_body(response: httpx.Response) -> dict[str, Any]:
     """Extrai corpo de erro JSON de forma segura."""
     try:
@@ -83,6 +194,10 @@ class NotificaClient:
 
     Implementa retry com exponential backoff, idempotency keys automáticas,
     paginação manual e auto-paginação.
+
+    Thread-safe: uma instância pode ser compartilhada por muitas threads. O
+    estado por requisição fica na pilha de ``_request``; o pool do httpx é
+    o único recurso compartilhado e mantém até ``DEFAULT_LIMITS`` conexões.
     """
 
     def __init__(
@@ -92,6 +207,8 @@ class NotificaClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         auto_idempotency: bool = True,
+        transport: SharedTransport | None = None,
+        hooks: Iterable[RequestHook] | None = None,
     ) -> None:
         if not api_key:
             raise NotificaError(
@@ -103,13 +220,36 @@ class NotificaClient:
         self._timeout = timeout
         self._max_retries = max_retries
         self._auto_idempotency = auto_idempotency
-
-        self._client = httpx.Client(
+        self._transport = transport
+        self._hooks = HookDispatcher.build(hooks)
+        self._client = self._build_http()
+
+    def _build_http(self) -> httpx.Client:
+        self._pid = os.getpid()
+        # Com ``transport``, o pool é emprestado: criar o cliente não abre
+        # sockets nem contexto TLS, e ``close`` não afeta os demais clientes.
+        return httpx.Client(
             base_url=self._base_url,
-            timeout=httpx.Timeout(timeout),
+            timeout=httpx.Timeout(self._timeout),
             headers=self._default_headers(),
+            limits=DEFAULT_LIMITS,
+            transport=self._transport.borrow() if self._transport is not None else None,
+            trust_env=self._transport is None,
         )
 
+    def _http(self) -> httpx.Client:
+        """Cliente httpx do processo atual.
+
+        Após um ``fork`` (gunicorn, uWSGI, multiprocessing), o filho herdaria
+        os sockets do pai; o cliente herdado é abandonado sem ser fechado
+        (fechá-lo encerraria as conexões TLS do pai) e um novo é criado.
+        """
+        if self._pid != os.getpid():
+            with _fork_lock:
+                if self._pid != os.getpid():
+                    self._client = self._build_http()
+        return self._client
+
     def _default_headers(self) -> dict[str, str]:
         return {
             "Authorization": f"Bearer {self._api_key}",
@@ -127,77 +267,119 @@ class NotificaClient:
         json: Any | None = None,
         params: dict[str, Any] | None = None,
         options: dict[str, Any] | None = None,
+        content: Iterable[bytes] | None = None,
     ) -> Any:
-        """Faz uma requisição HTTP com retry e backoff."""
+        """Faz uma requisição HTTP com retry e backoff.
+
+        Corpos streaming (``content``) não podem ser reenviados, então
+        nunca são retentados.
+        """
         options = options or {}
         headers = self._build_headers(method, options)
         req_timeout = options.get("timeout", self._timeout)
         clean = _clean_params(params)
+        max_retries = 0 if content is not None else self._max_retries
 
+        # Sem hooks, nenhum evento é montado e nenhum tempo é medido.
+        hooks = self._hooks
+        idempotency_key = headers.get("Idempotency-Key")
+        started = time.perf_counter() if hooks is not None else 0.0
         last_error: Exception | None = None
+        attempt = 0
 
-        for attempt in range(self._max_retries + 1):
-            if attempt > 0:
-                self._backoff(attempt, last_error)
-
-            try:
-                response = self._client.request(
-                    method=method,
-                    url=path,
-                    json=json,
-                    params=clean,
-                    headers=headers,
-                    timeout=req_timeout,
-                )
-            except httpx.TimeoutException as exc:
-                last_error = TimeoutError(req_timeout)
-                if attempt < self._max_retries:
-                    continue
-                raise last_error from exc
-            except httpx.HTTPError as exc:
-                last_error = NotificaError(f"Erro de rede: {exc}")
-                if attempt < self._max_retries:
-                    continue
-                raise last_error from exc
-
-            # 2xx — sucesso
-            if response.is_success:
-                if response.status_code == 204:
-                    return None
-                return response.json()
-
-            # 429 — rate limit (retryable)
-            if response.status_code == 429:
-                error_data = _parse_error_body(response)
-                retry_after = _parse_retry_after(response)
-                err = RateLimitError(
-                    error_data.get("error", {}).get("message", "Rate limit exceeded"),
-                    retry_after=retry_after,
-                    request_id=response.headers.get("x-request-id"),
-                )
-                if attempt < self._max_retries:
-                    last_error = err
+        try:
+            for attempt in range(max_retries + 1):
+                if attempt > 0:
+                    delay = _retry_delay(attempt, last_error)
+                    if hooks is not None:
+                        hooks.retry({
+                            "method": method, "path": path, "attempt": attempt,
+                            "idempotency_key": idempotency_key, "reason": _retry_reason(last_error),
+                            "delay": delay, "error": last_error,  # type: ignore[typeddict-item]
+                        })
+                    self._backoff(delay)
+
+                if hooks is not None:
+                    hooks.request({
+                        "method": method, "path": path, "attempt": attempt + 1,
+                        "idempotency_key": idempotency_key,
+                    })
+                    sent = time.perf_counter()
+                try:
+                    response = self._http().request(
+                        method=method,
+                        url=path,
+                        json=json,
+                        content=content,
+                        params=clean,
+                        headers=headers,
+                        timeout=req_timeout,
+                    )
+                except httpx.TimeoutException as exc:
+                    last_error = TimeoutError(req_timeout)
+                    if attempt < max_retries:
+                        continue
+                    raise last_error from exc
+                except httpx.HTTPError as exc:
+                    last_error = NotificaError(f"Erro de rede: {exc}")
+                    if attempt < max_retries:
+                        continue
+                    raise last_error from exc
+
+                if hooks is not None:
+                    hooks.response({
+                        "method": method, "path": path, "attempt": attempt + 1,
+                        "idempotency_key": idempotency_key, "status": response.status_code,
+                        "elapsed": time.perf_counter() - sent, "bytes": len(response.content),
+                        "request_id": response.headers.get("x-request-id"),
+                    })
+
+                # 2xx — sucesso
+                if response.is_success:
+                    if response.status_code == 204:
+                        return None
+                    return response.json()
+
+                # 429 — rate limit (retryable)
+                if response.status_code == 429:
+                    error_data = _parse_error_body(response)
+                    retry_after = _parse_retry_after(response)
+                    err = RateLimitError(
+                        error_data.get("error", {}).get("message", "Rate limit exceeded"),
+                        retry_after=retry_after,
+                        request_id=response.headers.get("x-request-id"),
+                    )
+                    if attempt < max_retries:
+                        last_error = err
+                        continue
+                    raise err
+
+                # 5xx — server error (retryable)
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries:
+                    error_data = _parse_error_body(response)
+                    last_error = ApiError(
+                        error_data.get("error", {}).get(
+                            "message", f"Server error ({response.status_code})"
+                        ),
+                        status=response.status_code,
+                        code=error_data.get("error", {}).get("code", "server_error"),
+                        details=error_data.get("error", {}).get("details", {}),
+                        request_id=response.headers.get("x-request-id"),
+                    )
                     continue
-                raise err
-
-            # 5xx — server error (retryable)
-            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self._max_retries:
-                error_data = _parse_error_body(response)
-                last_error = ApiError(
-                    error_data.get("error", {}).get(
-                        "message", f"Server error ({response.status_code})"
-                    ),
-                    status=response.status_code,
-                    code=error_data.get("error", {}).get("code", "server_error"),
-                    details=error_data.get("error", {}).get("details", {}),
-                    request_id=response.headers.get("x-request-id"),
-                )
-                continue
-
-            # 4xx / demais erros — não retryable
-            _raise_for_error(response)
-
-        raise last_error or NotificaError("Request failed after max retries")
+
+                # 4xx / demais erros — não retryable
+                _raise_for_error(response)
+
+            raise last_error or NotificaError("Request failed after max retries")
+        except NotificaError as exc:
+            if hooks is not None:
+                hooks.error({
+                    "method": method, "path": path, "attempt": attempt + 1,
+                    "idempotency_key": idempotency_key, "error": exc,
+                    "elapsed": time.perf_counter() - started,
+                })
+            raise
 
     def _build_headers(
         self, method: str, options: dict[str, Any]
@@ -211,13 +393,7 @@ class NotificaClient:
                 headers["Idempotency-Key"] = str(uuid.uuid4())
         return headers
 
-    def _backoff(self, attempt: int, last_error: Exception | None) -> None:
-        if isinstance(last_error, RateLimitError) and last_error.retry_after is not None:
-            delay = float(last_error.retry_after)
-        else:
-            base = 0.5 * (2 ** (attempt - 1))
-            jitter = random.random() * base * 0.5  # noqa: S311
-            delay = base + jitter
+    def _backoff(self, delay: float) -> None:
         time.sleep(delay)
 
     # ── HTTP verbs ──────────────────────────────────────
@@ -236,9 +412,29 @@ class NotificaClient:
         path: str,
         json: Any | None = None,
         options: dict[str, Any] | None = None,
+        content: Iterable[bytes] | None = None,
+    ) -> Any:
+        """POST request.
+
+        ``content`` envia um corpo streaming (chunked transfer encoding) no
+        lugar de ``json`` — veja ``post_stream``.
+        """
+        return self._request("POST", path, json=json, options=options, content=content)
+
+    def post_stream(
+        self,
+        path: str,
+        key: str,
+        items: Iterable[Any],
+        extra: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
     ) -> Any:
-        """POST request."""
-        return self._request("POST", path, json=json, options=options)
+        """POST de ``{key: [items...]}`` codificado incrementalmente.
+
+        Os itens são consumidos e serializados sob demanda, então ``items``
+        pode ser um generator sem materializar a lista inteira.
+        """
+        return self.post(path, options=options, content=_iter_json_array_body(key, items, extra))
 
     def put(
         self,
@@ -310,6 +506,15 @@ class NotificaClient:
         """Fecha o cliente HTTP."""
         self._client.close()
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Configuração e hooks serializáveis (veja ``HookDispatcher.picklable``).
+        # ``transport`` não é levado: o pool é local ao processo e o cliente
+        # desserializado cria o próprio.
+        return (NotificaClient, (
+            self._api_key, self._base_url, self._timeout, self._max_retries, self._auto_idempotency,
+            None, self._hooks.picklable() if self._hooks is not None else None,
+        ))
+
     def __enter__(self) -> NotificaClient:
         return self
 
@@ -335,6 +540,8 @@ class AsyncNotificaClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         auto_idempotency: bool = True,
+        transport: SharedTransport | None = None,
+        hooks: Iterable[RequestHook] | None = None,
     ) -> None:
         if not api_key:
             raise NotificaError(
@@ -346,18 +553,34 @@ class AsyncNotificaClient:
         self._timeout = timeout
         self._max_retries = max_retries
         self._auto_idempotency = auto_idempotency
+        self._transport = transport
+        self._hooks = HookDispatcher.build(hooks)
+        self._client = self._build_http()
 
-        self._client = httpx.AsyncClient(
+    def _build_http(self) -> httpx.AsyncClient:
+        self._pid = os.getpid()
+        return httpx.AsyncClient(
             base_url=self._base_url,
-            timeout=httpx.Timeout(timeout),
+            timeout=httpx.Timeout(self._timeout),
             headers={
-                "Authorization": f"Bearer {api_key}",
+                "Authorization": f"Bearer {self._api_key}",
                 "Content-Type": "application/json",
                 "Accept": "application/json",
                 "User-Agent": f"notifica-python/{SDK_VERSION}",
             },
+            limits=DEFAULT_LIMITS,
+            transport=self._transport.borrow_async() if self._transport is not None else None,
+            trust_env=self._transport is None,
         )
 
+    def _http(self) -> httpx.AsyncClient:
+        """Cliente httpx do processo atual (veja ``NotificaClient._http``)."""
+        if self._pid != os.getpid():
+            with _fork_lock:
+                if self._pid != os.getpid():
+                    self._client = self._build_http()
+        return self._client
+
     # ── Core request ────────────────────────────────────
 
     async def _request(
@@ -367,75 +590,115 @@ class AsyncNotificaClient:
         json: Any | None = None,
         params: dict[str, Any] | None = None,
         options: dict[str, Any] | None = None,
+        content: AsyncIterable[bytes] | None = None,
     ) -> Any:
-        """Faz uma requisição HTTP assíncrona com retry e backoff."""
-        import asyncio
+        """Faz uma requisição HTTP assíncrona com retry e backoff.
 
+        Corpos streaming (``content``) não podem ser reenviados, então
+        nunca são retentados.
+        """
         options = options or {}
         headers = self._build_headers(method, options)
         req_timeout = options.get("timeout", self._timeout)
         clean = _clean_params(params)
+        max_retries = 0 if content is not None else self._max_retries
 
+        # Sem hooks, nenhum evento é montado e nenhum tempo é medido.
+        hooks = self._hooks
+        idempotency_key = headers.get("Idempotency-Key")
+        started = time.perf_counter() if hooks is not None else 0.0
         last_error: Exception | None = None
+        attempt = 0
 
-        for attempt in range(self._max_retries + 1):
-            if attempt > 0:
-                await self._backoff(attempt, last_error)
-
-            try:
-                response = await self._client.request(
-                    method=method,
-                    url=path,
-                    json=json,
-                    params=clean,
-                    headers=headers,
-                    timeout=req_timeout,
-                )
-            except httpx.TimeoutException as exc:
-                last_error = TimeoutError(req_timeout)
-                if attempt < self._max_retries:
-                    continue
-                raise last_error from exc
-            except httpx.HTTPError as exc:
-                last_error = NotificaError(f"Erro de rede: {exc}")
-                if attempt < self._max_retries:
-                    continue
-                raise last_error from exc
-
-            if response.is_success:
-                if response.status_code == 204:
-                    return None
-                return response.json()
-
-            if response.status_code == 429:
-                error_data = _parse_error_body(response)
-                retry_after = _parse_retry_after(response)
-                err = RateLimitError(
-                    error_data.get("error", {}).get("message", "Rate limit exceeded"),
-                    retry_after=retry_after,
-                    request_id=response.headers.get("x-request-id"),
-                )
-                if attempt < self._max_retries:
-                    last_error = err
+        try:
+            for attempt in range(max_retries + 1):
+                if attempt > 0:
+                    delay = _retry_delay(attempt, last_error)
+                    if hooks is not None:
+                        hooks.retry({
+                            "method": method, "path": path, "attempt": attempt,
+                            "idempotency_key": idempotency_key, "reason": _retry_reason(last_error),
+                            "delay": delay, "error": last_error,  # type: ignore[typeddict-item]
+                        })
+                    await self._backoff(delay)
+
+                if hooks is not None:
+                    hooks.request({
+                        "method": method, "path": path, "attempt": attempt + 1,
+                        "idempotency_key": idempotency_key,
+                    })
+                    sent = time.perf_counter()
+                try:
+                    response = await self._http().request(
+                        method=method,
+                        url=path,
+                        json=json,
+                        content=content,
+                        params=clean,
+                        headers=headers,
+                        timeout=req_timeout,
+                    )
+                except httpx.TimeoutException as exc:
+                    last_error = TimeoutError(req_timeout)
+                    if attempt < max_retries:
+                        continue
+                    raise last_error from exc
+                except httpx.HTTPError as exc:
+                    last_error = NotificaError(f"Erro de rede: {exc}")
+                    if attempt < max_retries:
+                        continue
+                    raise last_error from exc
+
+                if hooks is not None:
+                    hooks.response({
+                        "method": method, "path": path, "attempt": attempt + 1,
+                        "idempotency_key": idempotency_key, "status": response.status_code,
+                        "elapsed": time.perf_counter() - sent, "bytes": len(response.content),
+                        "request_id": response.headers.get("x-request-id"),
+                    })
+
+                if response.is_success:
+                    if response.status_code == 204:
+                        return None
+                    return response.json()
+
+                if response.status_code == 429:
+                    error_data = _parse_error_body(response)
+                    retry_after = _parse_retry_after(response)
+                    err = RateLimitError(
+                        error_data.get("error", {}).get("message", "Rate limit exceeded"),
+                        retry_after=retry_after,
+                        request_id=response.headers.get("x-request-id"),
+                    )
+                    if attempt < max_retries:
+                        last_error = err
+                        continue
+                    raise err
+
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries:
+                    error_data = _parse_error_body(response)
+                    last_error = ApiError(
+                        error_data.get("error", {}).get(
+                            "message", f"Server error ({response.status_code})"
+                        ),
+                        status=response.status_code,
+                        code=error_data.get("error", {}).get("code", "server_error"),
+                        details=error_data.get("error", {}).get("details", {}),
+                        request_id=response.headers.get("x-request-id"),
+                    )
                     continue
-                raise err
 
-            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self._max_retries:
-                error_data = _parse_error_body(response)
-                last_error = ApiError(
-                    error_data.get("error", {}).get(
-                        "message", f"Server error ({response.status_code})"
-                    ),
-                    status=response.status_code,
-                    code=error_data.get("error", {}).get("code", "server_error"),
-                    details=error_data.get("error", {}).get("details", {}),
-                    request_id=response.headers.get("x-request-id"),
-                )
-                continue
+                _raise_for_error(response)
 
-            _raise_for_error(response)
-
-        raise last_error or NotificaError("Request failed after max retries")
+            raise last_error or NotificaError("Request failed after max retries")
+        except NotificaError as exc:
+            if hooks is not None:
+                hooks.error({
+                    "method": method, "path": path, "attempt": attempt + 1,
+                    "idempotency_key": idempotency_key, "error": exc,
+                    "elapsed": time.perf_counter() - started,
+                })
+            raise
 
     def _build_headers(
         self, method: str, options: dict[str, Any]
@@ -449,15 +712,9 @@ class AsyncNotificaClient:
                 headers["Idempotency-Key"] = str(uuid.uuid4())
         return headers
 
-    async def _backoff(self, attempt: int, last_error: Exception | None) -> None:
+    async def _backoff(self, delay: float) -> None:
         import asyncio
 
-        if isinstance(last_error, RateLimitError) and last_error.retry_after is not None:
-            delay = float(last_error.retry_after)
-        else:
-            base = 0.5 * (2 ** (attempt - 1))
-            jitter = random.random() * base * 0.5  # noqa: S311
-            delay = base + jitter
         await asyncio.sleep(delay)
 
     # ── HTTP verbs ──────────────────────────────────────
@@ -476,9 +733,30 @@ class AsyncNotificaClient:
         path: str,
         json: Any | None = None,
         options: dict[str, Any] | None = None,
+        content: AsyncIterable[bytes] | None = None,
+    ) -> Any:
+        """POST request.
+
+        ``content`` envia um corpo streaming (chunked transfer encoding) no
+        lugar de ``json`` — veja ``post_stream``.
+        """
+        return await self._request("POST", path, json=json, options=options, content=content)
+
+    async def post_stream(
+        self,
+        path: str,
+        key: str,
+        items: Iterable[Any] | AsyncIterable[Any],
+        extra: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
     ) -> Any:
-        """POST request."""
-        return await self._request("POST", path, json=json, options=options)
+        """POST de ``{key: [items...]}`` codificado incrementalmente.
+
+        Aceita iteráveis síncronos ou assíncronos (async generators).
+        """
+        return await self.post(
+            path, options=options, content=_aiter_json_array_body(key, items, extra)
+        )
 
     async def put(
         self,
@@ -551,8 +829,25 @@ class AsyncNotificaClient:
         """Fecha o cliente HTTP."""
         await self._client.aclose()
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Veja ``NotificaClient.__reduce__``.
+        return (AsyncNotificaClient, (
+            self._api_key, self._base_url, self._timeout, self._max_retries, self._auto_idempotency,
+            None, self._hooks.picklable() if self._hooks is not None else None,
+        ))
+
     async def __aenter__(self) -> AsyncNotificaClient:
         return self
 
     async def __aexit__(self, *args: object) -> None:
         await self.close()
+
+
+def async_http_client(client: AsyncNotifica | AsyncNotificaClient) -> AsyncNotificaClient:
+    """Cliente HTTP assíncrono de um ``AsyncNotifica`` (ou o próprio ``AsyncNotificaClient``).
+
+    Usado pelas funções assíncronas de nível de módulo que aceitam ambos.
+    """
+    if isinstance(client, AsyncNotificaClient):
+        return client
+    return client._client
@@ -0,0 +1,401 @@
+"""Resultados de analytics em colunas, com operações vetorizadas.
+
+``Analytics.timeseries``, ``by_channel`` e ``top_templates`` retornam listas
+de dicts — convenientes, mas caras de percorrer em Python para reamostrar,
+preencher lacunas, calcular taxas e juntar períodos. ``ColumnarTable``
+guarda cada campo numa coluna contígua (``numpy.ndarray`` quando NumPy está
+instalado, senão ``array.array``) e aplica essas operações à coluna inteira.
+
+NumPy é opcional (``pip install notifica[columnar]``); sem ele o backend
+``"array"`` oferece a mesma API, com os laços em Python.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Literal
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None  # type: ignore[assignment]
+
+Backend = Literal["auto", "numpy", "array"]
+
+_STEPS = {"hour": 3600, "day": 86400}
+_DEFAULT_POINT_FIELDS = ("timestamp", "sent", "delivered", "failed")
+
+
+def _resolve_backend(backend: str) -> str:
+    if backend == "auto":
+        return "array" if np is None else "numpy"
+    if backend == "numpy" and np is None:
+        raise ImportError("backend='numpy' requer NumPy: pip install notifica[columnar]")
+    if backend not in ("numpy", "array"):
+        raise ValueError(f"Backend desconhecido: {backend!r}")
+    return backend
+
+
+def _step(every: int | str) -> int:
+    if isinstance(every, str):
+        try:
+            return _STEPS[every]
+        except KeyError:
+            raise ValueError(f"Intervalo desconhecido: {every!r} (use 'hour', 'day' ou segundos)") from None
+    if every <= 0:
+        raise ValueError("O intervalo deve ser positivo")
+    return int(every)
+
+
+def _to_epoch(value: str) -> int:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _epoch(value: int | str) -> int:
+    return value if isinstance(value, int) else _to_epoch(value)
+
+
+def parse_timestamps(values: Iterable[str]) -> array[int]:
+    """Converte timestamps ISO 8601 em segundos desde a época (UTC).
+
+    O caminho rápido (``AAAA-MM-DDTHH:MM:SS`` com ou sem ``Z``) converte a
+    data uma vez por dia e soma hora, minuto e segundo; os demais formatos
+    (frações, offsets) passam por ``datetime.fromisoformat``.
+    """
+    out: array[int] = array("q")
+    append = out.append
+    days: dict[str, int] = {}
+    for value in values:
+        size = len(value)
+        if (size == 19 or (size == 20 and value[19] == "Z")) and value[10] in "T ":
+            day = value[:10]
+            base = days.get(day)
+            if base is None:
+                base = days[day] = _to_epoch(f"{day}T00:00:00+00:00")
+            append(base + int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19]))
+        else:
+            append(_to_epoch(value))
+    return out
+
+
+def _parse_timestamps_numpy(values: list[str]) -> Any:
+    """Como ``parse_timestamps``, mas com o parser de ``datetime64`` do NumPy.
+
+    Só se aplica quando todos os valores estão em UTC com ``Z`` (formato da
+    API); caso contrário, usa ``parse_timestamps``.
+    """
+    if all(len(value) == 20 and value[19] == "Z" for value in values):
+        return np.array([value[:19] for value in values], dtype="datetime64[s]").astype(np.int64)
+    return parse_timestamps(values)
+
+
+def format_timestamp(seconds: int) -> str:
+    """Formata segundos desde a época como ``AAAA-MM-DDTHH:MM:SSZ``."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+def _column(values: Sequence[Any]) -> Any:
+    """Monta a coluna mais compacta possível: inteiros, floats ou lista."""
+    for typecode in ("q", "d"):
+        try:
+            return array(typecode, values)
+        except TypeError:
+            continue
+    return list(values)
+
+
+def _tolist(column: Any) -> list[Any]:
+    return column if isinstance(column, list) else column.tolist()
+
+
+class ColumnarTable:
+    """Tabela de colunas numéricas (e de texto) de mesmo comprimento.
+
+    Colunas de inteiros e floats ficam em ``numpy.ndarray`` (backend
+    ``"numpy"``) ou ``array.array`` (backend ``"array"``); as demais, em
+    listas. As operações retornam tabelas novas.
+
+    Example:
+        ```python
+        channels = client.analytics.by_channel_columns({"period": "30d"})
+        channels["sent"]                  # coluna inteira
+        channels.rate("failed", "sent")   # taxa de falha por canal
+        channels.sort_by("sent", descending=True).to_records()
+        ```
+    """
+
+    def __init__(self, columns: dict[str, Any], backend: Backend = "auto") -> None:
+        self.backend = _resolve_backend(backend)
+        self._columns = {name: self._wrap(column) for name, column in columns.items()}
+        lengths = {len(column) for column in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Todas as colunas devem ter o mesmo comprimento")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]], backend: Backend = "auto") -> ColumnarTable:
+        """Transpõe uma lista de dicts (resposta da API) em colunas."""
+        records = records if isinstance(records, list) else list(records)
+        names = list(records[0]) if records else []
+        return cls(
+            {name: _column([record[name] for record in records]) for name in names},
+            backend=backend,
+        )
+
+    def _wrap(self, column: Any) -> Any:
+        if self.backend == "numpy" and isinstance(column, array):
+            return np.frombuffer(column, dtype=np.int64 if column.typecode == "q" else np.float64)
+        return column
+
+    def _new(self, columns: dict[str, Any]) -> ColumnarTable:
+        return type(self)(columns, backend=self.backend)  # type: ignore[arg-type]
+
+    def _is_numeric(self, column: Any) -> bool:
+        if self.backend == "numpy":
+            return isinstance(column, np.ndarray) and column.dtype.kind in "if"
+        return isinstance(column, array)
+
+    def _numeric(self) -> dict[str, Any]:
+        return {name: column for name, column in self._columns.items() if self._is_numeric(column)}
+
+    def _take(self, column: Any, indices: Any) -> Any:
+        if self.backend == "numpy" and isinstance(column, np.ndarray):
+            return column[indices]
+        if isinstance(column, array):
+            return array(column.typecode, [column[i] for i in indices])
+        return [column[i] for i in indices]
+
+    # ── Acesso ──────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Any:
+        return self._columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} linhas, colunas={list(self._columns)}, backend={self.backend!r})"
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Nomes das colunas, na ordem da API."""
+        return tuple(self._columns)
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Converte de volta para uma lista de dicts."""
+        names = list(self._columns)
+        values = [_tolist(self._columns[name]) for name in names]
+        return [dict(zip(names, row, strict=True)) for row in zip(*values, strict=True)]
+
+    # ── Agregação ───────────────────────────────────────
+
+    def sum(self, name: str) -> int | float:
+        """Soma de uma coluna numérica."""
+        column = self._columns[name]
+        total: int | float = column.sum().item() if self.backend == "numpy" else sum(column)
+        return total
+
+    def totals(self) -> dict[str, int | float]:
+        """Soma de todas as colunas numéricas."""
+        return {name: self.sum(name) for name in self._numeric()}
+
+    def rate(self, numerator: str = "delivered", denominator: str = "sent") -> Any:
+        """Coluna ``numerator / denominator`` (0 onde o denominador é 0)."""
+        num, den = self._columns[numerator], self._columns[denominator]
+        if self.backend == "numpy":
+            return np.divide(num, den, out=np.zeros(len(num), dtype=np.float64), where=den != 0)
+        return array("d", [n / d if d else 0.0 for n, d in zip(num, den, strict=True)])
+
+    def with_column(self, name: str, column: Any) -> ColumnarTable:
+        """Nova tabela com a coluna ``name`` adicionada ou substituída."""
+        return self._new({**self._columns, name: column})
+
+    def sort_by(self, name: str, descending: bool = False) -> ColumnarTable:
+        """Nova tabela ordenada (de forma estável) por uma coluna."""
+        column = self._columns[name]
+        order: Any
+        if self.backend == "numpy" and isinstance(column, np.ndarray):
+            order = np.argsort(-column if descending else column, kind="stable")
+        else:
+            order = sorted(range(len(column)), key=column.__getitem__, reverse=descending)
+        return self._new({key: self._take(value, order) for key, value in self._columns.items()})
+
+
+class TimeseriesTable(ColumnarTable):
+    """Série temporal em colunas, ordenada por ``timestamp``.
+
+    ``timestamp`` é guardado em segundos desde a época (UTC); as contagens
+    (``sent``, ``delivered``, ``failed``) são somadas ao reamostrar, preencher
+    lacunas ou juntar períodos. Colunas não numéricas são descartadas
+    nessas operações.
+
+    Example:
+        ```python
+        series = client.analytics.timeseries_columns({"period": "30d", "granularity": "hour"})
+
+        daily = series.resample("day", utc_offset=-3 * 3600)  # dias de Brasília
+        daily = daily.fill_gaps("day")                        # dias sem envio = 0
+        daily.rate("delivered", "sent")                       # taxa de entrega por dia
+
+        full = previous_month.merge(series)                   # junta períodos
+        full.to_points()                                      # de volta a TimeseriesPoint
+        ```
+    """
+
+    def __init__(self, columns: dict[str, Any], backend: Backend = "auto") -> None:
+        if "timestamp" not in columns:
+            raise ValueError("TimeseriesTable requer a coluna 'timestamp'")
+        super().__init__(columns, backend)
+        timestamps = self._columns["timestamp"]
+        if not self._is_sorted(timestamps):
+            order: Any
+            if self.backend == "numpy":
+                order = np.argsort(timestamps, kind="stable")
+            else:
+                order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+            self._columns = {name: self._take(column, order) for name, column in self._columns.items()}
+
+    def _numeric(self) -> dict[str, Any]:
+        numeric = super()._numeric()
+        numeric.pop("timestamp", None)
+        return numeric
+
+    def _is_sorted(self, timestamps: Any) -> bool:
+        if self.backend == "numpy":
+            return bool(np.all(timestamps[1:] >= timestamps[:-1]))
+        return all(a <= b for a, b in zip(timestamps, islice(timestamps, 1, None), strict=False))
+
+    @classmethod
+    def from_points(cls, points: Iterable[dict[str, Any]], backend: Backend = "auto") -> TimeseriesTable:
+        """Converte ``TimeseriesPoint`` em colunas, sem montar dicts intermediários."""
+        points = points if isinstance(points, list) else list(points)
+        names = list(points[0]) if points else list(_DEFAULT_POINT_FIELDS)
+        parse = _parse_timestamps_numpy if _resolve_backend(backend) == "numpy" else parse_timestamps
+        columns: dict[str, Any] = {}
+        for name in names:
+            values = list(map(itemgetter(name), points))
+            columns[name] = parse(values) if name == "timestamp" else _column(values)
+        return cls(columns, backend=backend)
+
+    def to_points(self) -> list[dict[str, Any]]:
+        """Converte de volta para ``TimeseriesPoint`` (timestamps ISO 8601)."""
+        records = self.to_records()
+        for record in records:
+            record["timestamp"] = format_timestamp(record["timestamp"])
+        return records
+
+    def _reduce(self, keys: Any, columns: dict[str, Any]) -> TimeseriesTable:
+        """Soma as linhas consecutivas com a mesma chave (``keys`` ordenado)."""
+        if self.backend == "numpy":
+            if len(keys) == 0:
+                return self._new({"timestamp": keys, **columns})  # type: ignore[return-value]
+            starts: Any = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+            reduced: dict[str, Any] = {name: np.add.reduceat(column, starts) for name, column in columns.items()}
+            return self._new({"timestamp": keys[starts], **reduced})  # type: ignore[return-value]
+
+        # Fatia cada grupo e soma em C, em vez de acumular linha a linha.
+        starts = [0] + [i for i, (a, b) in enumerate(zip(keys, islice(keys, 1, None), strict=False), 1) if a != b]
+        if len(starts) >= len(keys):  # chaves únicas: nada a somar
+            return self._new({"timestamp": keys, **columns})  # type: ignore[return-value]
+        spans = list(zip(starts, [*starts[1:], len(keys)], strict=True))
+        reduced = {
+            name: array(column.typecode, [sum(column[a:b]) for a, b in spans])
+            for name, column in columns.items()
+        }
+        return self._new({"timestamp": array("q", [keys[i] for i in starts]), **reduced})  # type: ignore[return-value]
+
+    def resample(self, every: int | str = "day", *, utc_offset: int = 0) -> TimeseriesTable:
+        """Agrega em janelas de ``every`` (``"hour"``, ``"day"`` ou segundos).
+
+        ``utc_offset`` (segundos) alinha as janelas a outro fuso — ex:
+        ``-3 * 3600`` para dias de Brasília. O timestamp de cada janela é o
+        seu início, em UTC.
+        """
+        step = _step(every)
+        timestamps = self._columns["timestamp"]
+        numeric = self._numeric()
+        if self.backend == "numpy":
+            keys = (timestamps + utc_offset) // step * step - utc_offset
+        else:
+            keys = array("q", [(t + utc_offset) // step * step - utc_offset for t in timestamps])
+        return self._reduce(keys, numeric)
+
+    def fill_gaps(
+        self,
+        every: int | str = "hour",
+        *,
+        start: int | str | None = None,
+        end: int | str | None = None,
+    ) -> TimeseriesTable:
+        """Preenche com zeros os intervalos sem pontos entre ``start`` e ``end``.
+
+        A grade começa em ``start`` (default: primeiro ponto) e avança de
+        ``every`` até ``end`` (default: último ponto). Pontos fora da grade
+        são somados ao intervalo que os contém; fora do período, descartados.
+        """
+        step = _step(every)
+        timestamps = self._columns["timestamp"]
+        numeric = self._numeric()
+        if start is None and not len(timestamps):
+            return self._new({"timestamp": timestamps, **numeric})  # type: ignore[return-value]
+        first = _epoch(start) if start is not None else int(timestamps[0])
+        last = _epoch(end) if end is not None else int(timestamps[-1])
+        size = max(0, (last - first) // step + 1)
+
+        if self.backend == "numpy":
+            slots: Any = (timestamps - first) // step
+            mask = (slots >= 0) & (slots < size)
+            slots = slots[mask]
+            filled: dict[str, Any] = {
+                name: np.bincount(slots, weights=column[mask], minlength=size).astype(column.dtype)
+                for name, column in numeric.items()
+            }
+            grid: Any = np.arange(size, dtype=np.int64) * step + first
+            return self._new({"timestamp": grid, **filled})  # type: ignore[return-value]
+
+        filled = {name: array(column.typecode, bytes(column.itemsize * size)) for name, column in numeric.items()}
+        slots = [(t - first) // step for t in timestamps]
+        for name, column in numeric.items():
+            out = filled[name]
+            for slot, value in zip(slots, column, strict=True):
+                if 0 <= slot < size:
+                    out[slot] += value
+        grid = array("q", range(first, first + size * step, step))
+        return self._new({"timestamp": grid, **filled})  # type: ignore[return-value]
+
+    def merge(self, other: TimeseriesTable) -> TimeseriesTable:
+        """Junta duas séries (ex: dois períodos), somando timestamps repetidos.
+
+        Mantém as colunas numéricas presentes nas duas séries.
+        """
+        mine, theirs = self._numeric(), other._numeric()
+        names = [name for name in mine if name in theirs]
+        if self.backend == "numpy":
+            timestamps: Any = np.concatenate((self._columns["timestamp"], np.asarray(other["timestamp"])))
+            order: Any = np.argsort(timestamps, kind="stable")
+            columns: dict[str, Any] = {
+                name: np.concatenate((mine[name], np.asarray(theirs[name])))[order] for name in names
+            }
+            return self._reduce(timestamps[order], columns)
+
+        timestamps = array("q", self._columns["timestamp"]) + array("q", _tolist(other["timestamp"]))
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        columns = {}
+        for name in names:
+            typecode = "d" if "d" in (mine[name].typecode, getattr(theirs[name], "typecode", "d")) else "q"
+            joined = array(typecode, mine[name]) + array(typecode, _tolist(theirs[name]))
+            columns[name] = array(typecode, [joined[i] for i in order])
+        return self._reduce(array("q", [timestamps[i] for i in order]), columns)
@@ -0,0 +1,118 @@
+"""Utilitários de fan-out com concorrência limitada para o cliente síncrono."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def map_concurrent(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[R | BaseException]:
+    """Aplica ``fn`` a cada item em até ``max_concurrency`` threads.
+
+    O ``httpx.Client`` compartilhado é thread-safe, então as requisições
+    reaproveitam o mesmo pool de conexões. Os resultados voltam na ordem
+    dos itens. Com ``return_exceptions=True``, exceções são devolvidas no
+    lugar do resultado em vez de propagadas (como ``asyncio.gather``).
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = 1 if max_concurrency <= 1 else min(max_concurrency, len(items))
+
+    results: list[R | BaseException] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notifica") as pool:
+        futures = [pool.submit(fn, item) for item in items]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(exc)
+    return results
+
+
+def imap_concurrent(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> Iterator[R | BaseException]:
+    """Versão streaming de ``map_concurrent``: consome ``items`` sob demanda.
+
+    No máximo ``2 * max_concurrency`` itens ficam em voo, então iteráveis
+    grandes (ou geradores) não são materializados. Os resultados são
+    produzidos na ordem dos itens.
+    """
+    workers = max(1, max_concurrency)
+    window = 2 * workers
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notifica") as pool:
+        pending: deque[Future[R]] = deque()
+        try:
+            for item in items:
+                pending.append(pool.submit(fn, item))
+                if len(pending) >= window:
+                    result = _result(pending.popleft(), return_exceptions)
+                    yield result
+            while pending:
+                result = _result(pending.popleft(), return_exceptions)
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def imap_unordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> Iterator[tuple[T, R | BaseException]]:
+    """Como ``imap_concurrent``, mas produz ``(item, resultado)`` assim que cada um termina.
+
+    Um item lento não atrasa os resultados dos demais; no máximo
+    ``2 * max_concurrency`` itens ficam em voo.
+    """
+    workers = max(1, max_concurrency)
+    window = 2 * workers
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notifica") as pool:
+        pending: dict[Future[R], T] = {}
+        try:
+            for item in items:
+                pending[pool.submit(fn, item)] = item
+                if len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = _result(future, return_exceptions)
+                        yield pending.pop(future), result
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = _result(future, return_exceptions)
+                    yield pending.pop(future), result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _result(future: Future[T], return_exceptions: bool) -> T | BaseException:
+    try:
+        return future.result()
+    except Exception as exc:
+        if not return_exceptions:
+            raise
+        return exc
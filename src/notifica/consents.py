@@ -0,0 +1,295 @@
+"""Índice local de opt-outs SMS para checagem O(1) antes do envio."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from .cache import TTLCache
+from .errors import ApiError
+from .phone import _normalize
+
+if TYPE_CHECKING:
+    from .resources.sms import SmsConsents
+
+
+def _phone_key(phone: str) -> int | None:
+    """Reduz um telefone (normalizado para E.164 quando possível) a um inteiro compacto."""
+    normalized = _normalize(phone)
+    digits = normalized[1:] if normalized else "".join(ch for ch in phone if ch.isdigit())
+    return int(digits) if digits else None
+
+
+class BloomFilter:
+    """Bloom filter simples sobre um ``bytearray``.
+
+    Sem falsos negativos; a taxa de falsos positivos é limitada por
+    ``false_positive_rate`` enquanto o número de itens não exceder ``capacity``.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001) -> None:
+        capacity = max(1, capacity)
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self._size = max(8, bits)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, key: int) -> Iterable[int]:
+        digest = hashlib.blake2b(key.to_bytes(16, "big"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hashes))
+
+    def add(self, key: int) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: int) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+
+class ScalableBloomFilter:
+    """Sequência de ``BloomFilter`` que cresce com os itens (total desconhecido).
+
+    Quando o filtro atual atinge sua capacidade, um novo, com o dobro dela,
+    passa a receber as inserções; a taxa de falsos positivos total fica
+    limitada à soma das taxas dos filtros.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001) -> None:
+        self._capacity = max(1, capacity)
+        self._false_positive_rate = false_positive_rate
+        self._filters = [BloomFilter(self._capacity, false_positive_rate)]
+        self._count = 0
+
+    def add(self, key: int) -> None:
+        if self._count >= self._capacity:
+            self._capacity *= 2
+            self._filters.append(BloomFilter(self._capacity, self._false_positive_rate))
+            self._count = 0
+        self._filters[-1].add(key)
+        self._count += 1
+
+    def __contains__(self, key: int) -> bool:
+        return any(key in bloom for bloom in self._filters)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return sum(bloom.size_in_bytes for bloom in self._filters)
+
+
+class SmsConsentIndex:
+    """Índice em memória dos números com opt-out de SMS.
+
+    Carregado em lote via ``SmsConsents.list_auto({"status": "opted_out"})``
+    e mantido por write-through em ``SmsConsents.create``/``revoke`` e por
+    ``apply()`` (ex: a partir de webhooks). Os números são normalizados para
+    E.164 e guardados como inteiros num ``set`` — ou, acima de ``bloom_threshold``
+    itens, num Bloom filter cujos positivos são confirmados com
+    ``SmsConsents.get`` (resultado em cache). No modo Bloom, ``load`` passa
+    os números ao filtro conforme as páginas chegam, sem montar o conjunto
+    completo em memória.
+
+    Quando configurado em ``Notifica(sms_consent_index=...)``,
+    ``Notifications.send`` pula envios SMS para números bloqueados.
+
+    Args:
+        max_age: Idade máxima do índice em segundos antes de um refresh
+            automático na próxima consulta (``None`` = apenas manual).
+        bloom_threshold: A partir de quantos opt-outs usar Bloom filter
+            (``None`` = sempre ``set`` exato).
+        false_positive_rate: Taxa de falsos positivos alvo do Bloom filter.
+
+    Example:
+        ```python
+        from notifica import Notifica, SmsConsentIndex
+
+        index = SmsConsentIndex(max_age=600)
+        client = Notifica("nk_live_...", sms_consent_index=index)
+        index.load()
+
+        if index.is_blocked("+5511999999999"):
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        max_age: float | None = 300.0,
+        bloom_threshold: int | None = None,
+        false_positive_rate: float = 0.001,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_age = max_age
+        self._bloom_threshold = bloom_threshold
+        self._false_positive_rate = false_positive_rate
+        self._clock = clock
+        self._consents: SmsConsents | None = None
+
+        self._blocked: set[int] = set()
+        self._bloom: ScalableBloomFilter | None = None
+        # Em modo Bloom: opt-outs revertidos desde o último load (não removíveis do filtro).
+        self._unblocked: set[int] = set()
+        self._confirmed: TTLCache[int, bool] = TTLCache(max_size=4096, ttl=max_age)
+        self._size = 0
+        self._loaded_at: float | None = None
+        # ``_lock`` protege trocas e mutações do índice; leituras não o usam.
+        # ``_loading`` garante uma única recarga automática por vez.
+        self._lock = threading.Lock()
+        self._loading = threading.Lock()
+
+    def attach(self, consents: SmsConsents) -> None:
+        """Associa o índice ao recurso usado para carregar e confirmar."""
+        self._consents = consents
+
+    # ── Loading ─────────────────────────────────────────
+
+    def load(self, consents: Iterable[Mapping[str, Any]] | None = None) -> dict[str, int]:
+        """(Re)constrói o índice a partir dos opt-outs atuais.
+
+        Sem argumentos, pagina ``SmsConsents.list_auto`` filtrando por
+        ``opted_out``. Retorna ``{"size", "added", "removed"}`` em relação
+        ao índice anterior. Ao atingir ``bloom_threshold``, os números
+        passam a ir direto para o Bloom filter; daí em diante, repetições e
+        a comparação com o índice anterior são decididas pelos filtros, com
+        erro limitado pela taxa de falsos positivos.
+        """
+        if consents is None:
+            if self._consents is None:
+                raise RuntimeError("SmsConsentIndex não está associado a um cliente")
+            consents = self._consents.list_auto({"status": "opted_out"})
+
+        previous_bloom, previous, unblocked = self._bloom, self._blocked, self._unblocked
+        previous_size = len(self)
+        blocked: set[int] = set()
+        bloom: ScalableBloomFilter | None = None
+        size = added = 0
+        for consent in consents:
+            if consent.get("status", "opted_out") != "opted_out":
+                continue
+            key = _phone_key(consent["phone"])
+            if key is None or (key in bloom if bloom is not None else key in blocked):
+                continue
+            size += 1
+            if previous_bloom is not None:
+                added += key in unblocked or key not in previous_bloom
+            else:
+                added += key not in previous
+            if bloom is not None:
+                bloom.add(key)
+                continue
+            blocked.add(key)
+            if self._bloom_threshold is not None and len(blocked) >= self._bloom_threshold:
+                bloom = ScalableBloomFilter(max(size, previous_size) * 2, self._false_positive_rate)
+                for seen in blocked:
+                    bloom.add(seen)
+                blocked = set()
+
+        stats = {"size": size, "added": added, "removed": max(0, previous_size - (size - added))}
+
+        # Troca de referências — leitores concorrentes veem o índice antigo ou o novo.
+        with self._lock:
+            self._bloom = bloom
+            self._blocked = blocked
+            self._unblocked = set()
+            self._size = size
+            self._confirmed.clear()
+            self._loaded_at = self._clock()
+        return stats
+
+    def refresh(self) -> dict[str, int]:
+        """Recarrega os opt-outs e troca o índice atomicamente (veja ``load``)."""
+        return self.load()
+
+    def refresh_if_stale(self) -> None:
+        """Recarrega o índice se ``max_age`` expirou (ou se nunca foi carregado)."""
+        if self._consents is None or not self._is_stale():
+            return
+        # Com um índice já carregado, as demais threads seguem com ele
+        # enquanto uma só recarrega; sem índice, todas esperam a carga.
+        if not self._loading.acquire(blocking=self._loaded_at is None):
+            return
+        try:
+            if self._is_stale():
+                self.load()
+        finally:
+            self._loading.release()
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or (
+            self._max_age is not None and self._clock() - self._loaded_at > self._max_age
+        )
+
+    def apply(self, consent: Mapping[str, Any]) -> None:
+        """Aplica uma mudança de consentimento (``{"phone", "status"}``) ao índice."""
+        key = _phone_key(consent["phone"])
+        if key is None:
+            return
+        with self._lock:
+            self._confirmed.invalidate(key)
+            if consent.get("status") == "opted_out":
+                self._unblocked.discard(key)
+                if self._bloom is not None:
+                    self._bloom.add(key)
+                else:
+                    self._blocked.add(key)
+            else:
+                self._blocked.discard(key)
+                if self._bloom is not None:
+                    self._unblocked.add(key)
+
+    # ── Lookup ──────────────────────────────────────────
+
+    def is_blocked(self, phone: str) -> bool:
+        """Indica se o número tem opt-out de SMS."""
+        self.refresh_if_stale()
+        key = _phone_key(phone)
+        if key is None:
+            return False
+        if self._bloom is None:
+            return key in self._blocked
+        if key in self._unblocked or key not in self._bloom:
+            return False
+        return self._confirm(phone, key)
+
+    def _confirm(self, phone: str, key: int) -> bool:
+        """Confirma um positivo do Bloom filter consultando a API."""
+        cached = self._confirmed.get(key)
+        if cached is not None:
+            return cached
+        if self._consents is None:
+            return True
+        try:
+            blocked = self._consents.get(phone).get("status") == "opted_out"
+        except ApiError as exc:
+            if exc.status != 404:
+                raise
+            blocked = False
+        self._confirmed.set(key, blocked)
+        return blocked
+
+    def __contains__(self, phone: object) -> bool:
+        return isinstance(phone, str) and self.is_blocked(phone)
+
+    def __len__(self) -> int:
+        return len(self._blocked) if self._bloom is None else self._size
+
+    def stats(self) -> dict[str, Any]:
+        """Métricas do índice."""
+        return {
+            "mode": "bloom" if self._bloom is not None else "set",
+            "size": len(self),
+            "bloom_bytes": self._bloom.size_in_bytes if self._bloom is not None else 0,
+            "unblocked": len(self._unblocked),
+            "confirm_hits": self._confirmed.hits,
+            "confirm_misses": self._confirmed.misses,
+        }
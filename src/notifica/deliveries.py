@@ -0,0 +1,323 @@
+"""Confirmação de entrega por webhooks, com fallback para polling.
+
+``Notifications.send_tracked`` envia a notificação e devolve um
+``DeliveryFuture``, resolvido quando o ``WebhookReceiver`` recebe o evento
+terminal correspondente (``notification.delivered``, ``.failed``,
+``.bounced`` ou ``.rejected``). Se nenhum webhook chegar em
+``webhook_timeout`` segundos, o future passa a consultar
+``Notifications.get`` com backoff — e continua aceitando o webhook
+enquanto isso.
+
+Example:
+    ```python
+    from notifica import DeliveryIndex, Notifica, WebhookReceiver
+
+    deliveries = DeliveryIndex(webhook_timeout=30)
+    client = Notifica("nk_live_...", delivery_index=deliveries)
+    receiver = WebhookReceiver(deliveries, signing_secret="whsec_...")
+
+    # No endpoint de webhooks da aplicação:
+    receiver.handle(request.body, request.headers.get("X-Notifica-Signature"))
+    # ...ou monte ``receiver.wsgi_app`` diretamente.
+
+    future = client.notifications.send_tracked({...})
+    notification = future.result(timeout=300)  # ou: await future
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any
+
+from .cache import TTLCache
+from .errors import TimeoutError, WebhookSignatureError
+from .tracking import TERMINAL_STATUSES
+
+if TYPE_CHECKING:
+    from .resources.notifications import Notifications
+
+SIGNATURE_HEADER = "X-Notifica-Signature"
+
+
+class DeliveryFuture:
+    """Resultado final (status terminal) de uma notificação enviada.
+
+    ``result()`` bloqueia; ``await future`` (ou ``await future.wait()``)
+    espera sem bloquear o event loop.
+
+    Attributes:
+        notification: Retorno de ``send`` (notificação enfileirada ou
+            ``SkippedNotification``).
+    """
+
+    def __init__(
+        self,
+        notification: dict[str, Any],
+        notifications: Notifications,
+        index: DeliveryIndex | None = None,
+    ) -> None:
+        self.notification = notification
+        self.id: str | None = notification.get("id")
+        self._notifications = notifications
+        self._index = index
+        self._future: Future[dict[str, Any]] = Future()
+        if notification.get("skipped") or notification.get("status") in TERMINAL_STATUSES:
+            self._resolve(notification)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def _resolve(self, notification: dict[str, Any]) -> None:
+        # Webhook e polling podem resolver ao mesmo tempo.
+        with contextlib.suppress(InvalidStateError):
+            self._future.set_result(notification)
+
+    def _webhook_timeout(self) -> float:
+        return self._index.webhook_timeout if self._index is not None else 0.0
+
+    def _poll(self, deadline: float | None, timeout: float | None) -> dict[str, Any]:
+        """Consulta ``Notifications.get`` com backoff até um status terminal."""
+        index = self._index
+        interval = index.poll_interval if index is not None else 2.0
+        max_interval = index.max_poll_interval if index is not None else 30.0
+        while not self._future.done():
+            notification = self._notifications.get(self.id)  # type: ignore[arg-type]
+            if notification.get("status") in TERMINAL_STATUSES:
+                self._resolve(notification)
+                break
+            wait = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(timeout)  # type: ignore[arg-type]
+                wait = min(wait, remaining)
+            try:
+                # Esperar no future (em vez de sleep) aceita o webhook que chegar.
+                return self._future.result(wait)
+            except FutureTimeoutError:
+                interval = min(interval * 2, max_interval)
+        if index is not None and self.id is not None:
+            index.discard(self.id)
+        return self._future.result()
+
+    def result(self, timeout: float | None = None) -> dict[str, Any]:
+        """Bloqueia até o status terminal; levanta ``TimeoutError`` após ``timeout``."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        webhook_wait = self._webhook_timeout()
+        if timeout is not None:
+            webhook_wait = min(webhook_wait, timeout)
+        try:
+            return self._future.result(webhook_wait)
+        except FutureTimeoutError:
+            return self._poll(deadline, timeout)
+
+    async def wait(self, timeout: float | None = None) -> dict[str, Any]:
+        """Equivalente assíncrono de ``result()``."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        webhook_wait = self._webhook_timeout()
+        if timeout is not None:
+            webhook_wait = min(webhook_wait, timeout)
+        waiter = asyncio.wrap_future(self._future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter), webhook_wait)
+        except asyncio.TimeoutError:
+            return await asyncio.to_thread(self._poll, deadline, timeout)
+
+    def __await__(self) -> Any:
+        return self.wait().__await__()
+
+
+class DeliveryIndex:
+    """Índice dos ``DeliveryFuture`` pendentes, por id de notificação.
+
+    A memória é limitada: entradas expiram após ``ttl`` segundos e, acima de
+    ``max_pending``, as mais antigas são descartadas. Um future descartado
+    continua funcionando — apenas passa a depender do polling. Eventos que
+    chegam antes do registro (webhook mais rápido que a resposta do
+    ``send``) ficam guardados por ``early_ttl`` segundos.
+
+    Args:
+        max_pending: Máximo de futures aguardando webhook.
+        ttl: Tempo máximo (segundos) que um future aguarda no índice.
+        webhook_timeout: Espera pelo webhook antes de começar o polling.
+        poll_interval: Intervalo inicial do polling de fallback.
+        max_poll_interval: Intervalo máximo do polling de fallback.
+        early_ttl: Retenção de eventos recebidos antes do registro.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 100_000,
+        ttl: float = 3600.0,
+        webhook_timeout: float = 60.0,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+        early_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_pending <= 0:
+            raise ValueError("max_pending deve ser positivo")
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.webhook_timeout = webhook_timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._clock = clock
+        self._pending: OrderedDict[str, tuple[float, DeliveryFuture]] = OrderedDict()
+        self._early: TTLCache[str, dict[str, Any]] = TTLCache(max_pending, early_ttl, clock=clock)
+        self._lock = threading.Lock()
+        self.resolved = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def _purge(self, now: float) -> None:
+        # Entradas são inseridas em ordem de tempo: as expiradas estão no início.
+        while self._pending:
+            registered_at = next(iter(self._pending.values()))[0]
+            if now - registered_at <= self.ttl:
+                break
+            self._pending.popitem(last=False)
+            self.expired += 1
+
+    def register(self, future: DeliveryFuture) -> None:
+        """Registra um future para ser resolvido por webhook."""
+        if future.id is None or future.done():
+            return
+        early = self._early.get(future.id)
+        if early is not None:
+            self._early.invalidate(future.id)
+            future._resolve(early)
+            with self._lock:
+                self.resolved += 1
+            return
+        now = self._clock()
+        with self._lock:
+            self._purge(now)
+            self._pending[future.id] = (now, future)
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.evicted += 1
+
+    def resolve(self, notification: dict[str, Any]) -> bool:
+        """Resolve o future da notificação; retorna ``False`` se não havia um pendente."""
+        notification_id = notification["id"]
+        with self._lock:
+            entry = self._pending.pop(notification_id, None)
+            if entry is not None:
+                self.resolved += 1
+        if entry is None:
+            self._early.set(notification_id, notification)
+            return False
+        entry[1]._resolve(notification)
+        return True
+
+    def discard(self, notification_id: str) -> None:
+        """Remove um id do índice (ex: resolvido por polling)."""
+        with self._lock:
+            self._pending.pop(notification_id, None)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> dict[str, int]:
+        """Métricas: pendentes, resolvidos por webhook, expirados, descartados e antecipados."""
+        with self._lock:
+            self._purge(self._clock())
+            return {
+                "pending": len(self._pending),
+                "resolved": self.resolved,
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "early": len(self._early),
+            }
+
+
+class WebhookReceiver:
+    """Recebe webhooks do Notifica e resolve os ``DeliveryFuture`` pendentes.
+
+    Independente de framework: passe o corpo bruto e o header de assinatura
+    para ``handle``, ou monte ``wsgi_app`` como endpoint.
+
+    Args:
+        deliveries: Índice de futures pendentes.
+        signing_secret: ``signing_secret`` do webhook (``None`` desativa a
+            verificação — apenas para desenvolvimento).
+        on_event: Chamado com cada evento válido recebido.
+    """
+
+    def __init__(
+        self,
+        deliveries: DeliveryIndex,
+        signing_secret: str | None = None,
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self._deliveries = deliveries
+        self._secret = signing_secret.encode() if signing_secret else None
+        self._on_event = on_event
+
+    def verify(self, payload: bytes, signature: str | None) -> None:
+        """Verifica a assinatura HMAC-SHA256 do payload."""
+        if self._secret is None:
+            return
+        if not signature:
+            raise WebhookSignatureError("Assinatura do webhook ausente")
+        if signature.startswith("sha256="):
+            signature = signature[len("sha256="):]
+        expected = hmac.new(self._secret, payload, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, signature):
+            raise WebhookSignatureError("Assinatura do webhook inválida")
+
+    def dispatch(self, event: Mapping[str, Any]) -> bool:
+        """Aplica um evento já verificado; retorna ``True`` se resolveu um future."""
+        if self._on_event is not None:
+            self._on_event(dict(event))
+        name = str(event.get("event") or event.get("type") or "")
+        data = event.get("data") or {}
+        notification_id = data.get("id") or data.get("notification_id")
+        if not name.startswith("notification.") or not notification_id:
+            return False
+        status: str | None = name[len("notification."):]
+        if status not in TERMINAL_STATUSES:
+            status = data.get("status")
+        if status not in TERMINAL_STATUSES:
+            return False
+        return self._deliveries.resolve({**data, "id": notification_id, "status": status})
+
+    def handle(self, payload: bytes, signature: str | None = None) -> dict[str, Any]:
+        """Verifica, decodifica e aplica um webhook; retorna o evento."""
+        self.verify(payload, signature)
+        event = json.loads(payload)
+        if not isinstance(event, dict):
+            raise ValueError("Payload de webhook inválido")
+        self.dispatch(event)
+        return event
+
+    def wsgi_app(self, environ: dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+        """Aplicação WSGI mínima para o endpoint de webhooks."""
+        if environ.get("REQUEST_METHOD") != "POST":
+            start_response("405 Method Not Allowed", [("Allow", "POST")])
+            return [b""]
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        payload = environ["wsgi.input"].read(length)
+        signature = environ.get("HTTP_" + SIGNATURE_HEADER.upper().replace("-", "_"))
+        try:
+            self.handle(payload, signature)
+        except WebhookSignatureError:
+            status, body = "401 Unauthorized", b'{"error":"invalid_signature"}'
+        except ValueError:  # inclui json.JSONDecodeError
+            status, body = "400 Bad Request", b'{"error":"invalid_payload"}'
+        else:
+            status, body = "200 OK", b'{"received":true}'
+        start_response(status, [("Content-Type", "application/json")])
+        return [body]
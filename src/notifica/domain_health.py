@@ -0,0 +1,190 @@
+"""Verificação de saúde de muitos domínios, com concorrência limitada e cache.
+
+``Domains.check_health`` (síncrono) e ``check_health_async`` consultam
+``/domains/{id}/health`` em paralelo e resumem o resultado: domínios com
+DNS/DKIM/SPF inválidos, ``issues`` ou falha na própria consulta entram em
+``failing`` e geram alertas no formato ``DomainAlert``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .cache import TTLCache
+from .client import async_http_client
+from .concurrency import DEFAULT_MAX_CONCURRENCY
+from .errors import NotificaError
+
+if TYPE_CHECKING:
+    from . import AsyncNotifica
+    from .client import AsyncNotificaClient
+
+DomainRef = str | dict[str, Any]
+
+# Verificação -> (tipo do alerta, severidade, mensagem)
+_CHECKS = (
+    ("dns_valid", "dns_invalid", "critical", "Registro TXT de verificação não encontrado ou inválido"),
+    ("dkim_valid", "dkim_invalid", "critical", "Registros DKIM ausentes ou inválidos"),
+    ("spf_valid", "spf_invalid", "warning", "Registro SPF ausente ou não inclui o Notifica"),
+)
+
+
+class DomainHealthCache:
+    """Cache de ``DomainHealth`` por domínio, com TTL curto.
+
+    Apenas consultas bem-sucedidas são guardadas; falhas são refeitas na
+    próxima verificação. Leituras e escritas copiam o resultado, então
+    alterá-lo não afeta o cache.
+
+    Args:
+        ttl: Tempo de vida de cada resultado em segundos.
+        max_size: Número máximo de domínios em cache.
+
+    Example:
+        ```python
+        from notifica import DomainHealthCache, Notifica
+
+        client = Notifica("nk_live_...", domain_health_cache=DomainHealthCache(ttl=60))
+        report = client.domains.check_health()   # consulta todos os domínios
+        report = client.domains.check_health()   # servido do cache por 60s
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_size: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cache: TTLCache[str, dict[str, Any]] = TTLCache(max_size, ttl, clock=clock)
+
+    def get(self, domain_id: str) -> dict[str, Any] | None:
+        """Saúde em cache de um domínio, ou ``None``."""
+        cached = self._cache.get(domain_id)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def set(self, domain_id: str, health: dict[str, Any]) -> None:
+        """Guarda uma cópia da saúde de um domínio."""
+        self._cache.set(domain_id, copy.deepcopy(health))
+
+    def invalidate(self, domain_id: str) -> None:
+        """Descarta a saúde em cache de um domínio."""
+        self._cache.invalidate(domain_id)
+
+    def clear(self) -> None:
+        """Remove todos os resultados em cache."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Métricas do cache: tamanho, hits, misses e evictions."""
+        return {
+            "size": len(self._cache),
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "evictions": self._cache.evictions,
+        }
+
+
+def domain_ref(domain: DomainRef) -> tuple[str, str | None]:
+    """``(id, nome)`` de um id ou objeto ``Domain`` (aceito em ``domains`` das verificações)."""
+    if isinstance(domain, str):
+        return domain, None
+    return domain["id"], domain.get("domain")
+
+
+def _alert(domain_id: str, alert_type: str, severity: str, message: str, created_at: str) -> dict[str, Any]:
+    return {
+        "id": f"{domain_id}:{alert_type}",
+        "domain_id": domain_id,
+        "alert_type": alert_type,
+        "message": message,
+        "severity": severity,
+        "created_at": created_at,
+    }
+
+
+def health_alerts(health: dict[str, Any]) -> list[dict[str, Any]]:
+    """Alertas (formato ``DomainAlert``) derivados de um ``DomainHealth``."""
+    domain_id = health["domain_id"]
+    checked_at = health.get("last_checked_at", "")
+    alerts = [
+        _alert(domain_id, alert_type, severity, message, checked_at)
+        for field, alert_type, severity, message in _CHECKS
+        if not health.get(field, False)
+    ]
+    alerts.extend(
+        _alert(domain_id, f"issue:{i}", "warning", issue, checked_at)
+        for i, issue in enumerate(health.get("issues") or [])
+    )
+    return alerts
+
+
+def build_report(results: Iterable[tuple[str, str | None, dict[str, Any] | BaseException]]) -> dict[str, Any]:
+    """Resume ``(id, nome, DomainHealth | exceção)`` em um ``DomainHealthReport``."""
+    report: dict[str, Any] = {"checked": 0, "healthy": 0, "failing": [], "alerts": [], "errors": {}}
+    for domain_id, name, result in results:
+        report["checked"] += 1
+        if isinstance(result, BaseException):
+            report["errors"][domain_id] = result
+            alerts = [_alert(domain_id, "health_check_failed", "warning", str(result), "")]
+            health = None
+        else:
+            alerts = health_alerts(result)
+            health = result
+        if not alerts:
+            report["healthy"] += 1
+            continue
+        report["alerts"].extend(alerts)
+        report["failing"].append({
+            "domain_id": domain_id,
+            "domain": name,
+            "health": health,
+            "issues": [alert["message"] for alert in alerts],
+        })
+    return report
+
+
+async def check_health_async(
+    client: AsyncNotifica | AsyncNotificaClient,
+    domains: Iterable[DomainRef] | None = None,
+    *,
+    cache: DomainHealthCache | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> dict[str, Any]:
+    """Equivalente assíncrono de ``Domains.check_health``.
+
+    Example:
+        ```python
+        from notifica.domain_health import DomainHealthCache, check_health_async
+
+        cache = DomainHealthCache(ttl=60)
+        async with AsyncNotifica("nk_live_...") as client:
+            report = await check_health_async(client, cache=cache, max_concurrency=16)
+        ```
+    """
+    http = async_http_client(client)
+    if domains is None:
+        refs = [domain_ref(domain) async for domain in http.list_auto("/domains")]
+    else:
+        refs = [domain_ref(domain) for domain in domains]
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def check(domain_id: str) -> dict[str, Any] | BaseException:
+        cached = cache.get(domain_id) if cache is not None else None
+        if cached is not None:
+            return cached
+        async with semaphore:
+            try:
+                health: dict[str, Any] = await http.get_one(f"/domains/{domain_id}/health")
+            except NotificaError as exc:
+                return exc
+        if cache is not None:
+            cache.set(domain_id, health)
+        return health
+
+    results = await asyncio.gather(*(check(domain_id) for domain_id, _ in refs))
+    return build_report((domain_id, name, result) for (domain_id, name), result in zip(refs, results, strict=True))
@@ -72,3 +72,16 @@ class TimeoutError(NotificaError):
     def __init__(self, timeout_seconds: float) -> None:
         super().__init__(f"Request timed out after {timeout_seconds}s")
         self.timeout_seconds = timeout_seconds
+
+
+class WebhookSignatureError(NotificaError):
+    """Assinatura de webhook ausente ou inválida."""
+
+
+class QuotaExceededError(NotificaError):
+    """Envio bloqueado localmente pelo ``QuotaGovernor`` (quota do plano esgotada)."""
+
+    def __init__(self, message: str, metric: str, usage: float) -> None:
+        super().__init__(message)
+        self.metric = metric
+        self.usage = usage
@@ -0,0 +1,184 @@
+"""Exportação de listagens paginadas para NDJSON/CSV com memória limitada.
+
+Cada página é serializada e gravada assim que chega, enquanto a próxima já
+é buscada em segundo plano (read-ahead). O pico de memória é de duas
+páginas, independente do total exportado.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import os
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Literal, Union
+
+from .client import _encode_json
+
+if TYPE_CHECKING:
+    from .client import NotificaClient
+
+ExportFormat = Literal["ndjson", "csv"]
+Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def iter_pages(
+    client: NotificaClient,
+    path: str,
+    params: dict[str, Any] | None = None,
+    *,
+    read_ahead: bool = True,
+) -> Iterator[list[dict[str, Any]]]:
+    """Itera pelas páginas de ``path``; com ``read_ahead``, busca a próxima em paralelo.
+
+    A próxima página é pedida assim que o cursor da atual é conhecido,
+    antes de a atual ser entregue ao chamador — no máximo uma página fica
+    em voo.
+    """
+    query = {**(params or {})}
+    query.pop("cursor", None)
+    if not read_ahead:
+        cursor = None
+        while True:
+            response = client.list(path, params={**query, "cursor": cursor} if cursor else query)
+            yield response["data"]
+            meta = response.get("meta") or {}
+            if not meta.get("has_more"):
+                return
+            cursor = meta.get("cursor")
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="notifica-export") as pool:
+        pending: Future[dict[str, Any]] | None = pool.submit(client.list, path, query)
+        while pending is not None:
+            response = pending.result()
+            meta = response.get("meta") or {}
+            pending = None
+            if meta.get("has_more"):
+                pending = pool.submit(client.list, path, {**query, "cursor": meta.get("cursor")})
+            yield response["data"]
+
+
+class _CountingWriter:
+    """Repassa escritas a ``raw`` contando os bytes gravados."""
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        self.raw = raw
+        self.bytes = 0
+
+    def write(self, data: bytes) -> int:
+        self.bytes += len(data)
+        return self.raw.write(data)
+
+    def flush(self) -> None:
+        self.raw.flush()
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return value
+
+
+class _CsvEncoder:
+    def __init__(self, fields: Sequence[str] | None) -> None:
+        self.fields = list(fields) if fields is not None else None
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+
+    def encode(self, records: list[dict[str, Any]]) -> bytes:
+        if self.fields is None:
+            if not records:
+                return b""
+            self.fields = list(records[0])
+            self._writer.writerow(self.fields)
+        fields = self.fields
+        self._writer.writerows([[_cell(record.get(field)) for field in fields] for record in records])
+        chunk = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+    def header(self) -> bytes:
+        """Cabeçalho explícito (``fields`` informado), escrito antes da primeira página."""
+        if self.fields is None:
+            return b""
+        self._writer.writerow(self.fields)
+        return self.encode([])
+
+
+def _encode_ndjson(records: list[dict[str, Any]]) -> bytes:
+    return b"".join(_encode_json(record) + b"\n" for record in records)
+
+
+def export_list(
+    client: NotificaClient,
+    path: str,
+    destination: Destination,
+    params: dict[str, Any] | None = None,
+    *,
+    format: ExportFormat = "ndjson",
+    fields: Sequence[str] | None = None,
+    compress: bool | None = None,
+    read_ahead: bool = True,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Exporta todos os itens de uma listagem paginada (veja ``Notifications.export``)."""
+    if format not in ("ndjson", "csv"):
+        raise ValueError(f"Formato de exportação desconhecido: {format!r} (use 'ndjson' ou 'csv')")
+    is_path = isinstance(destination, (str, os.PathLike))
+    if compress is None:
+        compress = is_path and os.fspath(destination).endswith(".gz")  # type: ignore[arg-type]
+
+    started = time.monotonic()
+    target = os.fspath(destination) if is_path else None  # type: ignore[arg-type]
+    partial = f"{target}.part" if target is not None else None
+    raw: IO[bytes] = open(partial, "wb", buffering=buffer_size) if partial else destination  # type: ignore[assignment]  # noqa: SIM115
+    counter = _CountingWriter(raw)
+    sink: Any = gzip.GzipFile(fileobj=counter, mode="wb", mtime=0) if compress else counter
+
+    csv_encoder = _CsvEncoder(fields) if format == "csv" else None
+    encode = csv_encoder.encode if csv_encoder is not None else _encode_ndjson
+    progress = {"rows": 0, "pages": 0, "bytes_written": 0, "bytes_uncompressed": 0}
+    try:
+        if csv_encoder is not None and fields is not None:
+            header = csv_encoder.header()
+            sink.write(header)
+            progress["bytes_uncompressed"] += len(header)
+        for page in iter_pages(client, path, params, read_ahead=read_ahead):
+            chunk = encode(page)
+            sink.write(chunk)
+            progress["rows"] += len(page)
+            progress["pages"] += 1
+            progress["bytes_uncompressed"] += len(chunk)
+            progress["bytes_written"] = counter.bytes
+            if on_progress is not None:
+                on_progress(dict(progress))
+        if compress:
+            sink.close()  # grava o trailer gzip (não fecha ``raw``)
+        raw.flush()
+    except BaseException:
+        if partial is not None:
+            raw.close()
+            os.remove(partial)
+        raise
+    if partial is not None:
+        raw.close()
+        os.replace(partial, target)  # type: ignore[arg-type]
+
+    progress["bytes_written"] = counter.bytes
+    return {
+        **progress,
+        "format": format,
+        "compressed": compress,
+        "path": target,
+        "elapsed": time.monotonic() - started,
+    }
@@ -0,0 +1,253 @@
+"""Limitação de envios conforme o uso da quota mensal do plano."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal
+
+from .errors import NotificaError, QuotaExceededError
+
+if TYPE_CHECKING:
+    from .resources.billing import Billing
+
+Priority = Literal["transactional", "bulk"]
+
+# Canal -> (métrica em ``BillingUsageMetrics``, quota em ``BillingQuotas``)
+_CHANNEL_METRICS = {
+    "email": ("emails", "emails_per_month"),
+    "sms": ("sms", "sms_per_month"),
+    "whatsapp": ("whatsapp", "whatsapp_per_month"),
+}
+_TOTAL_METRIC = ("notifications", "notifications_per_month")
+
+
+class QuotaGovernor:
+    """Reduz suavemente a taxa de envio conforme o uso se aproxima da quota.
+
+    Lê ``Billing.usage.get()`` no máximo a cada ``refresh_interval``
+    segundos e, entre leituras, soma os envios feitos localmente. O uso
+    considerado é o maior entre o total de notificações e o canal do envio
+    (ex: ``emails`` para ``email``).
+
+    Abaixo de ``soft_limit`` nada é limitado. Entre ``soft_limit`` e
+    ``hard_limit``, envios ``bulk`` são limitados a ``rate`` × fator, com o
+    fator caindo linearmente de 1 a 0; acima de ``hard_limit`` eles são
+    bloqueados com ``QuotaExceededError``. Envios ``transactional`` (padrão
+    de ``Notifications.send``) só começam a ser limitados em
+    ``transactional_soft_limit`` e nunca abaixo de ``transactional_floor``.
+
+    Args:
+        rate: Taxa nominal de envios por segundo sobre a qual o fator se aplica.
+        soft_limit: Uso (0–1) a partir do qual envios ``bulk`` são limitados.
+        hard_limit: Uso a partir do qual envios ``bulk`` são bloqueados.
+        transactional_soft_limit: Uso a partir do qual envios
+            ``transactional`` são limitados.
+        transactional_floor: Fator mínimo para envios ``transactional``.
+        refresh_interval: Intervalo mínimo entre leituras de uso (segundos).
+        max_wait: Espera máxima por envio; acima disso, ``QuotaExceededError``.
+        on_event: Chamado com ``{"type", "metric", "usage", "priority", ...}``
+            quando a limitação é ativada (``throttle_engaged``), liberada
+            (``throttle_released``) ou bloqueia envios (``blocked``).
+
+    Example:
+        ```python
+        from notifica import Notifica, QuotaGovernor
+
+        governor = QuotaGovernor(rate=100, on_event=print)
+        client = Notifica("nk_live_...", quota_governor=governor)
+
+        client.notifications.send({...})  # transactional
+        client.notifications.send({...}, options={"priority": "bulk"})
+        ```
+    """
+
+    def __init__(
+        self,
+        billing: Billing | None = None,
+        *,
+        rate: float = 50.0,
+        soft_limit: float = 0.8,
+        hard_limit: float = 1.0,
+        transactional_soft_limit: float = 0.95,
+        transactional_floor: float = 0.1,
+        refresh_interval: float = 60.0,
+        max_wait: float = 30.0,
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if not 0 <= soft_limit < hard_limit or not 0 <= transactional_soft_limit < hard_limit:
+            raise ValueError("Os limites devem satisfazer 0 <= soft_limit < hard_limit")
+        self._billing = billing
+        self.rate = rate
+        self.soft_limit = soft_limit
+        self.hard_limit = hard_limit
+        self.transactional_soft_limit = transactional_soft_limit
+        self.transactional_floor = transactional_floor
+        self.refresh_interval = refresh_interval
+        self.max_wait = max_wait
+        self._on_event = on_event
+        self._clock = clock
+        self._sleep = sleep
+
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._usage: dict[str, Any] | None = None
+        self._fetched_at: float | None = None
+        self._local: dict[str, int] = {}
+        # (prioridade, canal) -> [tokens, último reabastecimento]
+        self._buckets: dict[tuple[str, str], list[float]] = {}
+        self._throttled: set[tuple[str, str]] = set()
+        self.waited = 0.0
+        self.blocked = 0
+
+    def attach(self, billing: Billing) -> None:
+        """Associa o governor ao recurso de billing usado nas leituras."""
+        self._billing = billing
+
+    # ── Uso ─────────────────────────────────────────────
+
+    def refresh(self, force: bool = False) -> None:
+        """Relê o uso se ``refresh_interval`` expirou (ou sempre, com ``force``).
+
+        Apenas uma thread lê por vez; as demais seguem com o valor em cache.
+        Falhas de leitura mantêm o último valor conhecido.
+        """
+        if self._billing is None:
+            return
+        fetched_at = self._fetched_at
+        if not force and fetched_at is not None and self._clock() - fetched_at < self.refresh_interval:
+            return
+        if not self._refreshing.acquire(blocking=force):
+            return
+        try:
+            try:
+                usage = self._billing.usage.get()
+            except NotificaError as exc:
+                self._emit({"type": "refresh_failed", "error": exc})
+                usage = None
+            with self._lock:
+                if usage is not None:
+                    self._usage = usage
+                    self._local.clear()
+                self._fetched_at = self._clock()
+        finally:
+            self._refreshing.release()
+
+    def _ratio(self, metric: str, quota_key: str) -> float:
+        usage = self._usage
+        if usage is None:
+            return 0.0
+        quota = (usage.get("quotas") or {}).get(quota_key)
+        if not quota:
+            return 0.0  # sem quota (ilimitado)
+        current = (usage.get("current") or {}).get(metric, 0) + self._local.get(metric, 0)
+        return float(current) / float(quota)
+
+    def usage(self, channel: str | None = None) -> tuple[str, float]:
+        """Métrica mais restritiva e seu uso estimado (0–1+) para um canal."""
+        metric, ratio = _TOTAL_METRIC[0], self._ratio(*_TOTAL_METRIC)
+        if channel in _CHANNEL_METRICS:
+            channel_ratio = self._ratio(*_CHANNEL_METRICS[channel])
+            if channel_ratio > ratio:
+                metric, ratio = _CHANNEL_METRICS[channel][0], channel_ratio
+        return metric, ratio
+
+    def factor(self, channel: str | None = None, priority: Priority = "transactional") -> float:
+        """Fração da taxa nominal permitida (1 = sem limitação, 0 = bloqueado)."""
+        _, ratio = self.usage(channel)
+        soft = self.transactional_soft_limit if priority == "transactional" else self.soft_limit
+        if ratio <= soft:
+            return 1.0
+        factor = max(0.0, 1.0 - (ratio - soft) / (self.hard_limit - soft))
+        if priority == "transactional":
+            factor = max(factor, self.transactional_floor)
+        return factor
+
+    # ── Envio ───────────────────────────────────────────
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        if self._on_event is not None:
+            self._on_event(event)
+
+    def acquire(self, channel: str | None = None, priority: Priority = "transactional") -> float:
+        """Aguarda a vez de um envio; retorna o tempo esperado em segundos.
+
+        Levanta ``QuotaExceededError`` se o envio está bloqueado ou se a
+        espera passaria de ``max_wait``.
+        """
+        self.refresh()
+        key = (priority, channel or "")
+        metric, ratio = self.usage(channel)
+        factor = self.factor(channel, priority)
+        event = {"metric": metric, "usage": ratio, "priority": priority, "channel": channel, "factor": factor}
+
+        transition = None
+        with self._lock:
+            if factor >= 1.0:
+                if key in self._throttled:
+                    self._throttled.discard(key)
+                    transition = "throttle_released"
+            elif key not in self._throttled:
+                self._throttled.add(key)
+                transition = "throttle_engaged"
+            if factor <= 0.0:
+                self.blocked += 1
+        # Eventos são emitidos fora do lock: ``on_event`` pode ser lento.
+        if transition is not None:
+            self._emit({"type": transition, **event})
+        if factor >= 1.0:
+            self._count(channel)
+            return 0.0
+        if factor <= 0.0:
+            self._emit({"type": "blocked", **event})
+            raise QuotaExceededError(
+                f"Envio {priority} bloqueado: uso de {metric} em {ratio:.0%} da quota",
+                metric,
+                ratio,
+            )
+
+        rate = self.rate * factor
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.setdefault(key, [1.0, now])
+            burst = max(1.0, rate)
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            wait = 0.0 if bucket[0] >= 1.0 else (1.0 - bucket[0]) / rate
+            if wait > self.max_wait:
+                self.blocked += 1
+                raise QuotaExceededError(
+                    f"Envio {priority} excederia max_wait ({wait:.1f}s) com uso de {metric} em {ratio:.0%}",
+                    metric,
+                    ratio,
+                )
+            # Reserva o token agora e espera fora do lock.
+            bucket[0] -= 1.0
+            self.waited += wait
+        if wait > 0:
+            self._sleep(wait)
+        self._count(channel)
+        return wait
+
+    def _count(self, channel: str | None) -> None:
+        with self._lock:
+            local = self._local
+            local["notifications"] = local.get("notifications", 0) + 1
+            if channel in _CHANNEL_METRICS:
+                metric = _CHANNEL_METRICS[channel][0]
+                local[metric] = local.get(metric, 0) + 1
+
+    def stats(self) -> dict[str, Any]:
+        """Métricas: uso estimado, tempo total esperado e envios bloqueados."""
+        metric, ratio = self.usage()
+        with self._lock:
+            return {
+                "metric": metric,
+                "usage": ratio,
+                "throttled": sorted(f"{p}:{c}" if c else p for p, c in self._throttled),
+                "waited": self.waited,
+                "blocked": self.blocked,
+            }
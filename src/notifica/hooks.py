@@ -0,0 +1,275 @@
+"""Hooks do ciclo de vida das requisições HTTP (observabilidade).
+
+Um ``RequestHook`` recebe eventos de cada chamada que o cliente faz:
+início de cada tentativa (``on_request``), resposta recebida
+(``on_response``), retry agendado (``on_retry``) e falha definitiva
+(``on_error``). Sem hooks configurados, o cliente não mede tempo nem monta
+eventos. Hooks são síncronos também no ``AsyncNotifica`` e devem ser
+rápidos; exceções levantadas por eles são registradas no logger
+``notifica`` e não interrompem a requisição.
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import threading
+import warnings
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .types import ErrorEvent, RequestEvent, ResponseEvent, RetryEvent
+
+logger = logging.getLogger("notifica")
+
+_EVENTS = ("on_request", "on_response", "on_retry", "on_error")
+
+# Limites superiores (segundos) do histograma de latência do ``MetricsHook``.
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestHook:
+    """Base para hooks: sobrescreva só os eventos de interesse.
+
+    Métodos não sobrescritos não são chamados. Qualquer objeto com algum
+    dos métodos ``on_request``/``on_response``/``on_retry``/``on_error``
+    também é aceito.
+
+    Example:
+        ```python
+        from notifica import Notifica, RequestHook
+
+        class SlowRequests(RequestHook):
+            def on_response(self, event):
+                if event["elapsed"] > 1.0:
+                    print("lenta:", event["method"], event["path"], event["elapsed"])
+
+        client = Notifica("nk_live_...", hooks=[SlowRequests()])
+        ```
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Antes de cada tentativa (``attempt`` começa em 1)."""
+
+    def on_response(self, event: ResponseEvent) -> None:
+        """A cada resposta HTTP recebida, inclusive de erro."""
+
+    def on_retry(self, event: RetryEvent) -> None:
+        """Antes de esperar ``delay`` segundos para repetir uma tentativa."""
+
+    def on_error(self, event: ErrorEvent) -> None:
+        """Quando a requisição falha definitivamente."""
+
+
+class HookDispatcher:
+    """Repassa eventos aos hooks que implementam cada um (uso interno dos clientes)."""
+
+    __slots__ = (*_EVENTS, "hooks")
+
+    def __init__(self, hooks: Iterable[Any]) -> None:
+        self.hooks = tuple(hooks)
+        for name in _EVENTS:
+            handlers: list[Callable[[Any], None]] = []
+            for hook in self.hooks:
+                method = getattr(type(hook), name, None)
+                if method is None or method is getattr(RequestHook, name):
+                    continue
+                handlers.append(getattr(hook, name))
+            setattr(self, name, tuple(handlers))
+
+    @classmethod
+    def build(cls, hooks: Iterable[Any] | None) -> HookDispatcher | None:
+        """Dispatcher para ``hooks``, ou ``None`` se não houver nenhum."""
+        return cls(list(hooks)) if hooks else None
+
+    def picklable(self) -> list[Any]:
+        """Hooks que podem ser serializados, para o ``__reduce__`` dos clientes.
+
+        Hooks não serializáveis (ex: ``MetricsHook``, que guarda um lock) são
+        descartados com um ``RuntimeWarning``: o cliente desserializado não
+        os notifica.
+        """
+        kept = []
+        for hook in self.hooks:
+            try:
+                pickle.dumps(hook)
+            except Exception:
+                warnings.warn(
+                    f"Hook {hook!r} não é serializável e não será levado pelo pickle do cliente",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            else:
+                kept.append(hook)
+        return kept
+
+    @staticmethod
+    def _emit(handlers: tuple[Callable[[Any], None], ...], event: Any) -> None:
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Hook %r falhou", handler)
+
+    def request(self, event: RequestEvent) -> None:
+        self._emit(self.on_request, event)  # type: ignore[attr-defined]
+
+    def response(self, event: ResponseEvent) -> None:
+        self._emit(self.on_response, event)  # type: ignore[attr-defined]
+
+    def retry(self, event: RetryEvent) -> None:
+        self._emit(self.on_retry, event)  # type: ignore[attr-defined]
+
+    def error(self, event: ErrorEvent) -> None:
+        self._emit(self.on_error, event)  # type: ignore[attr-defined]
+
+
+class LoggingHook(RequestHook):
+    """Registra requisições no logger ``notifica`` (ou no informado).
+
+    Respostas em ``level`` (default ``DEBUG``); retries e falhas em
+    ``WARNING``. Com ``log_requests=True``, também o início de cada tentativa.
+
+    Example:
+        ```python
+        import logging
+        from notifica import LoggingHook, Notifica
+
+        logging.basicConfig(level=logging.DEBUG)
+        client = Notifica("nk_live_...", hooks=[LoggingHook()])
+        # DEBUG:notifica:POST /notifications -> 202 em 84.1 ms (312 B, tentativa 1)
+        ```
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+        log_requests: bool = False,
+    ) -> None:
+        self.logger = logger if logger is not None else logging.getLogger("notifica")
+        self.level = level
+        self.log_requests = log_requests
+
+    def on_request(self, event: RequestEvent) -> None:
+        if self.log_requests:
+            self.logger.log(self.level, "%s %s (tentativa %d)", event["method"], event["path"], event["attempt"])
+
+    def on_response(self, event: ResponseEvent) -> None:
+        self.logger.log(
+            self.level,
+            "%s %s -> %d em %.1f ms (%d B, tentativa %d)",
+            event["method"],
+            event["path"],
+            event["status"],
+            event["elapsed"] * 1000,
+            event["bytes"],
+            event["attempt"],
+        )
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self.logger.warning(
+            "%s %s: tentativa %d falhou (%s: %s); nova tentativa em %.2fs",
+            event["method"],
+            event["path"],
+            event["attempt"],
+            event["reason"],
+            event["error"],
+            event["delay"],
+        )
+
+    def on_error(self, event: ErrorEvent) -> None:
+        self.logger.warning(
+            "%s %s falhou após %d tentativa(s) em %.1f ms: %s",
+            event["method"],
+            event["path"],
+            event["attempt"],
+            event["elapsed"] * 1000,
+            event["error"],
+        )
+
+
+class MetricsHook(RequestHook):
+    """Métricas agregadas em memória, thread-safe, para exportar ao seu coletor.
+
+    Args:
+        latency_buckets: Limites superiores (segundos) do histograma de latência.
+
+    Example:
+        ```python
+        from notifica import MetricsHook, Notifica
+
+        metrics = MetricsHook()
+        client = Notifica("nk_live_...", hooks=[metrics])
+        ...
+        metrics.snapshot()
+        # {"requests": 120, "responses": {"202": 118, "429": 2},
+        #  "retries": {"rate_limited": 2}, "errors": {}, "bytes_received": 48213,
+        #  "latency": {"count": 120, "sum": 9.7, "max": 0.41, "buckets": {...}}}
+        ```
+    """
+
+    def __init__(self, latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._bounds = tuple(sorted(latency_buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zera todas as métricas."""
+        with self._lock:
+            self._requests = 0
+            self._responses: dict[str, int] = {}
+            self._retries: dict[str, int] = {}
+            self._errors: dict[str, int] = {}
+            self._bytes = 0
+            self._latency_sum = 0.0
+            self._latency_max = 0.0
+            self._latency_counts = [0] * (len(self._bounds) + 1)
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._requests += 1
+
+    def on_response(self, event: ResponseEvent) -> None:
+        status = str(event["status"])
+        elapsed = event["elapsed"]
+        bucket = bisect_left(self._bounds, elapsed)
+        with self._lock:
+            self._responses[status] = self._responses.get(status, 0) + 1
+            self._bytes += event["bytes"]
+            self._latency_sum += elapsed
+            self._latency_max = max(self._latency_max, elapsed)
+            self._latency_counts[bucket] += 1
+
+    def on_retry(self, event: RetryEvent) -> None:
+        with self._lock:
+            self._retries[event["reason"]] = self._retries.get(event["reason"], 0) + 1
+
+    def on_error(self, event: ErrorEvent) -> None:
+        name = type(event["error"]).__name__
+        with self._lock:
+            self._errors[name] = self._errors.get(name, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Cópia das métricas; ``latency.buckets`` é cumulativo (``le``), como no Prometheus."""
+        with self._lock:
+            cumulative: dict[str, int] = {}
+            total = 0
+            for bound, count in zip((*self._bounds, float("inf")), self._latency_counts, strict=True):
+                total += count
+                cumulative["+Inf" if bound == float("inf") else str(bound)] = total
+            return {
+                "requests": self._requests,
+                "responses": dict(self._responses),
+                "retries": dict(self._retries),
+                "errors": dict(self._errors),
+                "bytes_received": self._bytes,
+                "latency": {
+                    "count": total,
+                    "sum": self._latency_sum,
+                    "max": self._latency_max,
+                    "buckets": cumulative,
+                },
+            }
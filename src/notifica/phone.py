@@ -0,0 +1,104 @@
+"""Normalização e validação de telefones para E.164 (foco em números brasileiros)."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from .errors import ValidationError
+
+PHONE_CACHE_SIZE = 65_536
+
+# DDDs válidos no Brasil (Anatel).
+BR_AREA_CODES = frozenset({
+    "11", "12", "13", "14", "15", "16", "17", "18", "19",
+    "21", "22", "24", "27", "28",
+    "31", "32", "33", "34", "35", "37", "38",
+    "41", "42", "43", "44", "45", "46", "47", "48", "49",
+    "51", "53", "54", "55",
+    "61", "62", "63", "64", "65", "66", "67", "68", "69",
+    "71", "73", "74", "75", "77", "79",
+    "81", "82", "83", "84", "85", "86", "87", "88", "89",
+    "91", "92", "93", "94", "95", "96", "97", "98", "99",
+})
+
+# Pontuação aceita e descartada: espaços, parênteses, hífens, pontos e barras.
+_PUNCTUATION = str.maketrans("", "", " \t()-./ ")
+
+
+def _normalize_br(national: str) -> str | None:
+    """Normaliza DDD + número local (10 ou 11 dígitos) para E.164."""
+    if len(national) not in (10, 11):
+        return None
+    area, local = national[:2], national[2:]
+    if area not in BR_AREA_CODES:
+        return None
+    if len(local) == 9:
+        if local[0] != "9":
+            return None
+    elif local[0] in "6789":
+        # Celular sem o nono dígito (formato anterior a 2016).
+        local = "9" + local
+    elif local[0] not in "2345":
+        return None
+    return f"+55{area}{local}"
+
+
+@lru_cache(maxsize=PHONE_CACHE_SIZE)
+def _normalize(phone: str) -> str | None:
+    """Normaliza um telefone para E.164, ou ``None`` se inválido (memoizado)."""
+    raw = phone.strip().translate(_PUNCTUATION)
+    international = raw.startswith("+")
+    digits = raw[1:] if international else raw
+    if not digits.isdigit() or not digits.isascii():
+        return None
+
+    if not international and digits.startswith("00"):
+        digits, international = digits[2:], True
+
+    if international:
+        if digits.startswith("55"):
+            return _normalize_br(digits[2:])
+        if 8 <= len(digits) <= 15 and digits[0] != "0":
+            return f"+{digits}"
+        return None
+
+    if digits.startswith("0"):
+        # Prefixo de tronco, opcionalmente seguido do código da operadora (0 XX DDD número).
+        digits = digits[1:]
+        if len(digits) in (12, 13):
+            digits = digits[2:]
+    elif len(digits) in (12, 13) and digits.startswith("55"):
+        digits = digits[2:]
+    return _normalize_br(digits)
+
+
+def normalize_phone(phone: str, field: str = "phone") -> str:
+    """Normaliza um telefone para E.164.
+
+    Aceita formatos nacionais brasileiros (``(11) 99999-9999``,
+    ``011 99999 9999``, com código de operadora, sem o nono dígito) e
+    internacionais (``+`` ou ``00``). Números sem código de país são
+    tratados como brasileiros.
+
+    Raises:
+        ValidationError: Se o número é inválido — mesmo erro que a API
+            retornaria com 422, porém sem round trip.
+
+    Example:
+        ```python
+        normalize_phone("(11) 9999-8888")   # "+5511999998888"
+        normalize_phone("+1 415 555 2671")  # "+14155552671"
+        ```
+    """
+    normalized = _normalize(phone)
+    if normalized is None:
+        raise ValidationError(
+            f"Telefone inválido: {phone!r}",
+            details={field: ["is not a valid phone number"]},
+        )
+    return normalized
+
+
+def is_valid_phone(phone: str) -> bool:
+    """Indica se o telefone pode ser normalizado para E.164."""
+    return _normalize(phone) is not None
@@ -0,0 +1,125 @@
+"""Cache local de preferências de subscribers para filtragem antes do envio."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .cache import TTLCache
+
+# (category, channel) -> enabled
+PreferenceMap = Mapping[tuple[str, str], bool]
+
+
+class PreferenceCache:
+    """Cache opt-in das preferências de notificação dos subscribers.
+
+    Populado por ``Subscribers.get_preferences`` (read-through) e atualizado
+    por ``Subscribers.update_preferences`` (write-through). ``Notifications.send``
+    consulta o cache quando ``options["subscriber_id"]`` é informado e pula
+    localmente envios para canais/categorias desativados — sem round trip.
+
+    O cache nunca faz requisições por conta própria: subscribers ausentes ou
+    expirados são tratados como permitidos e a decisão fica com a API.
+
+    Args:
+        max_size: Número máximo de subscribers em cache (LRU).
+        ttl: Tempo de vida das preferências em segundos.
+
+    Example:
+        ```python
+        from notifica import Notifica, PreferenceCache
+
+        client = Notifica("nk_live_...", preference_cache=PreferenceCache(ttl=600))
+        client.subscribers.get_preferences("sub_123")  # aquece o cache
+
+        result = client.notifications.send(
+            {"channel": "email", "to": "a@b.com", "template": "promo"},
+            options={"subscriber_id": "sub_123", "category": "marketing"},
+        )
+        if result.get("skipped"):
+            print("Pulado:", result["reason"])
+        ```
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cache: TTLCache[str, PreferenceMap] = TTLCache(max_size, ttl, clock=clock)
+        self._lock = threading.Lock()
+        self.skipped = 0
+
+    # ── Population ──────────────────────────────────────
+
+    def store(self, subscriber_id: str, preferences: Mapping[str, Any]) -> None:
+        """Armazena a resposta de ``get_preferences``/``update_preferences``."""
+        compiled = {
+            (pref["category"], pref["channel"]): bool(pref["enabled"])
+            for pref in preferences.get("preferences", [])
+        }
+        self._cache.set(subscriber_id, compiled)
+
+    def invalidate(self, subscriber_id: str) -> None:
+        """Descarta as preferências de um subscriber."""
+        self._cache.invalidate(subscriber_id)
+
+    def clear(self) -> None:
+        """Descarta todas as preferências em cache."""
+        self._cache.clear()
+
+    # ── Lookup ──────────────────────────────────────────
+
+    def get(self, subscriber_id: str) -> dict[str, Any] | None:
+        """Obtém as preferências em cache no formato da API, ou ``None``."""
+        compiled = self._cache.get(subscriber_id)
+        if compiled is None:
+            return None
+        return {
+            "preferences": [
+                {"category": category, "channel": channel, "enabled": enabled}
+                for (category, channel), enabled in compiled.items()
+            ]
+        }
+
+    def is_allowed(
+        self,
+        subscriber_id: str,
+        channel: str,
+        category: str | None = None,
+    ) -> bool:
+        """Indica se um envio é permitido pelas preferências em cache.
+
+        Com ``category``, verifica a preferência ``(category, channel)``.
+        Sem ``category``, bloqueia apenas se o canal estiver desativado em
+        todas as categorias conhecidas. Subscribers fora do cache são
+        sempre permitidos.
+        """
+        compiled = self._cache.get(subscriber_id)
+        if not compiled:
+            return True
+        if category is not None:
+            return compiled.get((category, channel), True)
+        flags = [enabled for (_, ch), enabled in compiled.items() if ch == channel]
+        return not flags or any(flags)
+
+    # ── Stats ───────────────────────────────────────────
+
+    def record_skip(self) -> None:
+        """Contabiliza um envio pulado localmente."""
+        with self._lock:
+            self.skipped += 1
+
+    def stats(self) -> dict[str, int]:
+        """Métricas do cache: tamanho, hits, misses, evictions e envios pulados."""
+        return {
+            "size": len(self._cache),
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "evictions": self._cache.evictions,
+            "skipped": self.skipped,
+        }
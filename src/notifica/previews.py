@@ -0,0 +1,110 @@
+"""Cache de previews de templates (``Templates.preview``/``preview_content``)."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .cache import TTLCache
+
+
+def fingerprint(value: Any) -> str:
+    """Hash estável de um payload JSON (independente da ordem das chaves)."""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PreviewCache:
+    """Memoização LRU de previews de templates.
+
+    A chave combina o id do template, sua versão conhecida (``updated_at``
+    visto em ``get``/``create``/``update``, mais um contador de geração
+    incrementado a cada ``update``/``delete`` feito por este cliente) e um
+    hash dos dados. Invalidar um template é O(1): as entradas antigas deixam
+    de ser alcançáveis e saem por LRU/TTL. ``preview_content`` é chaveado
+    apenas pelo hash do conteúdo + dados.
+
+    O TTL limita a defasagem quando o template é alterado por outro
+    processo.
+
+    Args:
+        max_size: Número máximo de previews em cache.
+        ttl: Tempo de vida de cada preview em segundos (``None`` = sem expiração).
+
+    Example:
+        ```python
+        from notifica import Notifica, PreviewCache
+
+        client = Notifica("nk_live_...", preview_cache=PreviewCache(max_size=4096))
+        client.templates.preview("tpl_abc", {"variables": {"name": "João"}})  # POST
+        client.templates.preview("tpl_abc", {"variables": {"name": "João"}})  # cache
+        ```
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cache: TTLCache[tuple[str, ...], dict[str, Any]] = TTLCache(max_size, ttl, clock=clock)
+        self._versions: dict[str, str] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ── Keys ────────────────────────────────────────────
+
+    def template_key(self, template_id: str, params: Mapping[str, Any]) -> tuple[str, ...]:
+        """Chave de ``preview(template_id, params)`` na versão atual do template."""
+        version = self._versions.get(template_id, "")
+        generation = self._generations.get(template_id, 0)
+        return ("template", template_id, version, str(generation), fingerprint(params))
+
+    @staticmethod
+    def content_key(params: Mapping[str, Any]) -> tuple[str, ...]:
+        """Chave de ``preview_content(params)``."""
+        return ("content", fingerprint(params))
+
+    # ── Versions ────────────────────────────────────────
+
+    def note_version(self, template: Mapping[str, Any]) -> None:
+        """Registra a versão (``updated_at``) de um template visto pelo cliente."""
+        template_id = template.get("id")
+        updated_at = template.get("updated_at")
+        if template_id and updated_at:
+            with self._lock:
+                self._versions[template_id] = str(updated_at)
+
+    def invalidate(self, template_id: str) -> None:
+        """Invalida todos os previews de um template."""
+        with self._lock:
+            self._generations[template_id] = self._generations.get(template_id, 0) + 1
+            self._versions.pop(template_id, None)
+
+    def clear(self) -> None:
+        """Remove todos os previews em cache."""
+        self._cache.clear()
+
+    # ── Storage ─────────────────────────────────────────
+
+    def get(self, key: tuple[str, ...]) -> dict[str, Any] | None:
+        """Obtém uma cópia do preview em cache, ou ``None``."""
+        cached = self._cache.get(key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def set(self, key: tuple[str, ...], preview: dict[str, Any]) -> None:
+        self._cache.set(key, copy.deepcopy(preview))
+
+    def stats(self) -> dict[str, int]:
+        """Métricas do cache: tamanho, hits, misses e evictions."""
+        return {
+            "size": len(self._cache),
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "evictions": self._cache.evictions,
+        }
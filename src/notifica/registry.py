@@ -0,0 +1,331 @@
+"""Registro de clientes por tenant (uma API key por organização).
+
+``ClientRegistry`` entrega um ``Notifica`` por tenant, criado sob demanda
+a partir de uma configuração comum e mantido em um LRU limitado. Todos os
+clientes usam o mesmo ``SharedTransport``, então criar um cliente custa
+microssegundos e o número de sockets não cresce com o de tenants.
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from .transport import SharedTransport
+
+if TYPE_CHECKING:
+    from . import AsyncNotifica, Notifica
+
+C = TypeVar("C")
+
+
+class _Registry(Generic[C]):
+    """LRU de clientes com empréstimos (leases); comum às versões sync e async."""
+
+    def __init__(
+        self,
+        max_size: int,
+        transport: SharedTransport | None,
+        options_for: Callable[[Any], dict[str, Any]] | None,
+        options: dict[str, Any],
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size deve ser maior que zero")
+        if "api_key" in options or "transport" in options:
+            raise ValueError("api_key e transport não fazem parte da configuração comum")
+        self._max_size = max_size
+        self._owns_transport = transport is None
+        self._transport = transport if transport is not None else SharedTransport()
+        self._options_for = options_for
+        self._options = options
+        self._clients: OrderedDict[Hashable, C] = OrderedDict()
+        self._leases: dict[int, int] = {}
+        self._retired: dict[int, C] = {}  # removidos do LRU, ainda emprestados
+        self._closed = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _options_of(self, tenant: Hashable) -> dict[str, Any]:
+        if self._options_for is None:
+            return {**self._options, "transport": self._transport}
+        return {**self._options, **self._options_for(tenant), "transport": self._transport}
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError(f"{type(self).__name__} já foi fechado")
+
+    def _lookup(self, tenant: Hashable, lease: bool) -> C | None:
+        with self._lock:
+            self._check_open()
+            client = self._clients.get(tenant)
+            if client is None:
+                self.misses += 1
+                return None
+            self._clients.move_to_end(tenant)
+            self.hits += 1
+            if lease:
+                self._leases[id(client)] = self._leases.get(id(client), 0) + 1
+            return client
+
+    def _insert(self, tenant: Hashable, client: C, lease: bool) -> tuple[C, list[C]]:
+        """Guarda ``client`` (ou o criado por outra thread) e devolve os que devem ser fechados."""
+        stale: list[C] = []
+        with self._lock:
+            self._check_open()
+            existing = self._clients.get(tenant)
+            if existing is not None:
+                stale.append(client)
+                client = existing
+                self._clients.move_to_end(tenant)
+            else:
+                self._clients[tenant] = client
+                while len(self._clients) > self._max_size:
+                    _, evicted = self._clients.popitem(last=False)
+                    self.evictions += 1
+                    stale.extend(self._retire(evicted))
+            if lease:
+                self._leases[id(client)] = self._leases.get(id(client), 0) + 1
+        return client, stale
+
+    def _retire(self, client: C) -> list[C]:
+        """Sob o lock: fecha já, ou quando o último empréstimo for devolvido."""
+        if self._leases.get(id(client)):
+            self._retired[id(client)] = client
+            return []
+        return [client]
+
+    def _release(self, client: C) -> tuple[C | None, bool]:
+        """Devolve o cliente a fechar (se retirado) e se o transporte já pode ser fechado."""
+        with self._lock:
+            remaining = self._leases[id(client)] - 1
+            if remaining:
+                self._leases[id(client)] = remaining
+                return None, False
+            del self._leases[id(client)]
+            return self._retired.pop(id(client), None), self._transport_idle()
+
+    def _discard(self, tenant: Hashable) -> list[C]:
+        with self._lock:
+            client = self._clients.pop(tenant, None)
+            return self._retire(client) if client is not None else []
+
+    def _drain(self) -> tuple[list[C], bool]:
+        """Fecha o registro: clientes a fechar já e se o transporte já pode ser fechado."""
+        with self._lock:
+            self._closed = True
+            clients = list(self._clients.values())
+            self._clients.clear()
+            return [stale for client in clients for stale in self._retire(client)], self._transport_idle()
+
+    def _transport_idle(self) -> bool:
+        """Sob o lock: o transporte próprio fecha após o ``close`` e o último empréstimo."""
+        return self._closed and self._owns_transport and not self._leases
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def __contains__(self, tenant: object) -> bool:
+        with self._lock:
+            return tenant in self._clients
+
+    def stats(self) -> dict[str, int]:
+        """Métricas: tamanho, hits, misses, evictions e clientes emprestados."""
+        with self._lock:
+            return {
+                "size": len(self._clients),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "leased": len(self._leases),
+            }
+
+
+class ClientRegistry(_Registry["Notifica"]):
+    """Clientes ``Notifica`` por tenant, criados sob demanda em um LRU limitado.
+
+    Thread-safe. Clientes descartados do LRU são fechados; se estiverem
+    emprestados via ``lease()``, o fechamento espera a devolução — inclusive
+    em ``close()``, que também adia o fechamento do transporte próprio até o
+    último empréstimo. Clientes obtidos com ``get()`` não são protegidos: em
+    código concorrente com muitos tenants (mais que ``max_size``), prefira
+    ``lease()``. Após ``close()``, ``get()`` e ``lease()`` levantam
+    ``RuntimeError``.
+
+    Args:
+        api_key_for: Retorna a API key de um tenant (chamado uma vez por criação).
+        max_size: Número máximo de clientes mantidos.
+        transport: Pool compartilhado; se omitido, o registro cria e fecha o seu.
+        options_for: Opções específicas de um tenant, somadas às comuns (ex:
+            caches locais, que não devem ser compartilhados entre organizações).
+        **options: Configuração comum a todos os clientes (``base_url``,
+            ``timeout``, ``max_retries``...).
+
+    Example:
+        ```python
+        from notifica import ClientRegistry
+
+        registry = ClientRegistry(lambda org_id: secrets[org_id], max_size=500, timeout=10.0)
+
+        with registry.lease("org_1") as client:
+            client.notifications.send({...})
+
+        registry.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key_for: Callable[[Any], str],
+        *,
+        max_size: int = 256,
+        transport: SharedTransport | None = None,
+        options_for: Callable[[Any], dict[str, Any]] | None = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(max_size, transport, options_for, options)
+        self._api_key_for = api_key_for
+
+    def _obtain(self, tenant: Hashable, lease: bool) -> Notifica:
+        client = self._lookup(tenant, lease)
+        if client is not None:
+            return client
+        from . import Notifica
+
+        # A API key é buscada fora do lock (pode envolver I/O).
+        created = Notifica(self._api_key_for(tenant), **self._options_of(tenant))
+        try:
+            client, stale = self._insert(tenant, created, lease)
+        except RuntimeError:
+            created.close()
+            raise
+        for old in stale:
+            old.close()
+        return client
+
+    def get(self, tenant: Hashable) -> Notifica:
+        """Cliente do tenant, criado se necessário."""
+        return self._obtain(tenant, lease=False)
+
+    @contextmanager
+    def lease(self, tenant: Hashable) -> Iterator[Notifica]:
+        """Empresta o cliente do tenant; ele não é fechado antes de ser devolvido."""
+        client = self._obtain(tenant, lease=True)
+        try:
+            yield client
+        finally:
+            retired, idle = self._release(client)
+            if retired is not None:
+                retired.close()
+            if idle:
+                self._transport.close()
+
+    def discard(self, tenant: Hashable) -> None:
+        """Remove e fecha o cliente do tenant (ex: após rotação da API key)."""
+        for client in self._discard(tenant):
+            client.close()
+
+    def close(self) -> None:
+        """Fecha os clientes e, se for dono dele, o transporte (emprestados: na devolução)."""
+        clients, idle = self._drain()
+        for client in clients:
+            client.close()
+        if idle:
+            self._transport.close()
+
+    def __enter__(self) -> ClientRegistry:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class AsyncClientRegistry(_Registry["AsyncNotifica"]):
+    """Equivalente assíncrono de ``ClientRegistry`` para ``AsyncNotifica``.
+
+    ``api_key_for`` pode ser uma função comum ou uma corrotina.
+
+    Example:
+        ```python
+        from notifica import AsyncClientRegistry
+        from notifica.domain_health import check_health_async
+
+        async with AsyncClientRegistry(fetch_api_key, max_size=500) as registry:
+            async with registry.lease("org_1") as client:
+                report = await check_health_async(client)
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key_for: Callable[[Any], str | Awaitable[str]],
+        *,
+        max_size: int = 256,
+        transport: SharedTransport | None = None,
+        options_for: Callable[[Any], dict[str, Any]] | None = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(max_size, transport, options_for, options)
+        self._api_key_for = api_key_for
+
+    async def _obtain(self, tenant: Hashable, lease: bool) -> AsyncNotifica:
+        client = self._lookup(tenant, lease)
+        if client is not None:
+            return client
+        from . import AsyncNotifica
+
+        api_key = self._api_key_for(tenant)
+        if inspect.isawaitable(api_key):
+            api_key = await api_key
+        created = AsyncNotifica(api_key, **self._options_of(tenant))
+        try:
+            client, stale = self._insert(tenant, created, lease)
+        except RuntimeError:
+            await created.close()
+            raise
+        for old in stale:
+            await old.close()
+        return client
+
+    async def get(self, tenant: Hashable) -> AsyncNotifica:
+        """Cliente do tenant, criado se necessário."""
+        return await self._obtain(tenant, lease=False)
+
+    @asynccontextmanager
+    async def lease(self, tenant: Hashable) -> AsyncIterator[AsyncNotifica]:
+        """Empresta o cliente do tenant; ele não é fechado antes de ser devolvido."""
+        client = await self._obtain(tenant, lease=True)
+        try:
+            yield client
+        finally:
+            retired, idle = self._release(client)
+            if retired is not None:
+                await retired.close()
+            if idle:
+                await self._transport.aclose()
+
+    async def discard(self, tenant: Hashable) -> None:
+        """Remove e fecha o cliente do tenant."""
+        for client in self._discard(tenant):
+            await client.close()
+
+    async def close(self) -> None:
+        """Fecha os clientes e, se for dono dele, o transporte (emprestados: na devolução)."""
+        clients, idle = self._drain()
+        for client in clients:
+            await client.close()
+        if idle:
+            await self._transport.aclose()
+
+    async def __aenter__(self) -> AsyncClientRegistry:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
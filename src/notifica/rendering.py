@@ -0,0 +1,231 @@
+"""Renderização local (offline) de templates do Notifica.
+
+Suporta a sintaxe de variáveis dos templates — ``{{name}}``, com espaços
+opcionais (``{{ name }}``) e caminhos aninhados (``{{user.first_name}}``).
+Cada conteúdo é compilado uma única vez para uma format string, então
+renderizar custa uma chamada a ``str.format``.
+
+O resultado tem o mesmo formato de ``Templates.preview``/``preview_content``
+(``PreviewResult``): ``rendered`` (``body`` + uma chave por variante),
+``variables`` e ``validation``. Variáveis ausentes são renderizadas como
+string vazia e reportadas em ``validation.warnings``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from .cache import TTLCache
+
+if TYPE_CHECKING:
+    from .resources.templates import Templates
+
+_TAG = re.compile(r"\{\{\s*(.*?)\s*\}\}", re.DOTALL)
+_VARIABLE = re.compile(r"[A-Za-z_][A-Za-z0-9_\-]*(?:\.[A-Za-z0-9_\-]+)*")
+
+# Sentinela devolvida por ``lookup`` quando o caminho não existe em ``data``.
+MISSING = object()
+
+
+def lookup(data: Mapping[str, Any], path: tuple[str, ...]) -> Any:
+    """Valor de ``data`` no caminho ``path`` (chaves ou índices de lista), ou ``MISSING``."""
+    value: Any = data
+    for part in path:
+        # ``type(...) is dict`` evita o isinstance contra o ABC no caso comum.
+        if type(value) is dict or isinstance(value, Mapping):
+            value = value.get(part, MISSING)
+            if value is MISSING:
+                return MISSING
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return MISSING
+    return value
+
+
+def _format_value(value: Any) -> str:
+    if value is None or value is MISSING:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))  # como no JSON: 1.0 -> "1"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+class CompiledContent:
+    """Conteúdo de template compilado — renderize quantas vezes quiser."""
+
+    __slots__ = ("source", "variables", "errors", "_format", "_paths", "_flat")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.errors: list[str] = []
+        pieces: list[str] = []
+        paths: list[tuple[str, ...]] = []
+        names: list[str] = []
+        position = 0
+        for match in _TAG.finditer(source):
+            literal = source[position:match.start()]
+            pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+            expression = match.group(1)
+            if _VARIABLE.fullmatch(expression):
+                pieces.append("{}")
+                paths.append(tuple(expression.split(".")))
+                if expression not in names:
+                    names.append(expression)
+            else:
+                self.errors.append(f"Expressão inválida: {match.group(0)}")
+                pieces.append(match.group(0).replace("{", "{{").replace("}", "}}"))
+            position = match.end()
+        pieces.append(source[position:].replace("{", "{{").replace("}", "}}"))
+
+        self.variables = names
+        self._format = "".join(pieces)
+        self._paths = tuple(paths)
+        # Caminhos sem aninhamento permitem um lookup direto por chave.
+        self._flat = all(len(p) == 1 for p in paths)
+
+    def render(self, data: Mapping[str, Any]) -> str:
+        """Renderiza o conteúdo com os dados informados."""
+        if not self._paths:
+            return self._format.format()
+        if self._flat:
+            get = data.get
+            values = [get(path[0]) for path in self._paths]
+        else:
+            values = [lookup(data, path) for path in self._paths]
+        for i, value in enumerate(values):
+            if type(value) is not str:
+                values[i] = _format_value(value)
+        return self._format.format(*values)
+
+
+@lru_cache(maxsize=4096)
+def compile_content(source: str) -> CompiledContent:
+    """Compila (com cache por conteúdo) um texto de template."""
+    return CompiledContent(source)
+
+
+class CompiledTemplate:
+    """Template (conteúdo + variantes) compilado para renderização local."""
+
+    def __init__(self, content: str, variants: Mapping[str, str] | None = None) -> None:
+        self.parts: dict[str, CompiledContent] = {"body": compile_content(content)}
+        for name, source in (variants or {}).items():
+            self.parts[name] = compile_content(source)
+        seen: dict[str, None] = {}
+        for part in self.parts.values():
+            seen.update(dict.fromkeys(part.variables))
+        self.variables = list(seen)
+        self._variable_paths = [(name, tuple(name.split("."))) for name in self.variables]
+        self.errors = [e for part in self.parts.values() for e in part.errors]
+
+    @classmethod
+    def from_template(cls, template: Mapping[str, Any]) -> CompiledTemplate:
+        """Compila um objeto ``Template`` retornado pela API."""
+        return cls(template["content"], template.get("variants"))
+
+    def render(self, variables: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        """Renderiza no formato ``PreviewResult`` de ``/templates/preview``."""
+        variables = variables or {}
+        rendered = {name: part.render(variables) for name, part in self.parts.items()}
+        missing = [
+            name for name, path in self._variable_paths
+            if lookup(variables, path) is MISSING
+        ]
+        return {
+            "rendered": rendered,
+            "variables": list(self.variables),
+            "validation": {
+                "valid": not self.errors,
+                "errors": list(self.errors),
+                "warnings": [f"Variável ausente: {name}" for name in missing],
+            },
+        }
+
+    def render_body(self, variables: Mapping[str, Any]) -> str:
+        """Renderiza apenas o corpo — o caminho mais rápido."""
+        return self.parts["body"].render(variables)
+
+
+class TemplateRenderer:
+    """Renderizador local de templates buscados via ``Templates.get``/``list_auto``.
+
+    Templates são compilados uma vez e mantidos em cache (por id e slug)
+    por ``ttl`` segundos.
+
+    Example:
+        ```python
+        from notifica.rendering import TemplateRenderer
+
+        renderer = TemplateRenderer(client.templates)
+        renderer.preload({"channel": "email"})  # opcional: busca tudo de uma vez
+
+        result = renderer.render("welcome-email", {"name": "João"})
+        print(result["rendered"]["body"])
+        ```
+    """
+
+    def __init__(
+        self,
+        templates: Templates,
+        max_size: int = 4096,
+        ttl: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._templates = templates
+        self._cache: TTLCache[str, CompiledTemplate] = TTLCache(max_size, ttl, clock=clock)
+
+    def _store(self, template: Mapping[str, Any]) -> CompiledTemplate:
+        compiled = CompiledTemplate.from_template(template)
+        for key in (template.get("id"), template.get("slug")):
+            if key:
+                self._cache.set(key, compiled)
+        return compiled
+
+    def preload(self, params: dict[str, Any] | None = None) -> int:
+        """Busca e compila todos os templates (via ``list_auto``); retorna a quantidade."""
+        count = 0
+        for template in self._templates.list_auto(params):
+            self._store(template)
+            count += 1
+        return count
+
+    def add(self, templates: Iterable[Mapping[str, Any]]) -> None:
+        """Compila templates já obtidos (ex: de um snapshot local)."""
+        for template in templates:
+            self._store(template)
+
+    def get(self, id_or_slug: str) -> CompiledTemplate:
+        """Obtém o template compilado, buscando via ``Templates.get`` se necessário."""
+        compiled = self._cache.get(id_or_slug)
+        if compiled is None:
+            compiled = self._store(self._templates.get(id_or_slug))
+            self._cache.set(id_or_slug, compiled)
+        return compiled
+
+    def invalidate(self, id_or_slug: str) -> None:
+        self._cache.invalidate(id_or_slug)
+
+    def render(self, id_or_slug: str, variables: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        """Renderiza localmente no formato de ``Templates.preview``."""
+        return self.get(id_or_slug).render(variables)
+
+
+def render_content(
+    content: str,
+    variables: Mapping[str, Any] | None = None,
+    variants: Mapping[str, str] | None = None,
+) -> dict[str, Any]:
+    """Equivalente local de ``Templates.preview_content``."""
+    return CompiledTemplate(content, variants).render(variables)
@@ -4,28 +4,91 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from ..columnar import Backend, ColumnarTable, TimeseriesTable
+
 if TYPE_CHECKING:
+    from ..analytics_cache import AnalyticsCache
     from ..client import NotificaClient
 
 
 class Analytics:
     """Recurso de analytics."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(self, client: NotificaClient, cache: AnalyticsCache | None = None) -> None:
         self._client = client
+        self._cache = cache
+
+    def _get(self, path: str, params: dict[str, Any] | None, options: dict[str, Any] | None) -> Any:
+        if self._cache is None:
+            return self._client.get(path, params=params, options=options)["data"]
+        return self._cache.cached(
+            path, params or {}, lambda: self._client.get(path, params=params, options=options)["data"]
+        )
 
     def overview(self, params: dict[str, Any] | None = None, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Métricas gerais (total enviado, entregue, falhas, taxa de entrega)."""
-        return self._client.get("/analytics/overview", params=params, options=options)["data"]  # type: ignore[no-any-return]
+        return self._get("/analytics/overview", params, options)  # type: ignore[no-any-return]
 
     def by_channel(self, params: dict[str, Any] | None = None, options: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Métricas por canal."""
-        return self._client.get("/analytics/channels", params=params, options=options)["data"]  # type: ignore[no-any-return]
+        return self._get("/analytics/channels", params, options)  # type: ignore[no-any-return]
 
     def timeseries(self, params: dict[str, Any] | None = None, options: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        """Série temporal de envios."""
-        return self._client.get("/analytics/timeseries", params=params, options=options)["data"]  # type: ignore[no-any-return]
+        """Série temporal de envios.
+
+        Com ``analytics_cache`` configurado, buckets já fechados ficam em
+        cache e só os buckets abertos são buscados de novo após o TTL.
+        """
+        if self._cache is None:
+            return self._client.get("/analytics/timeseries", params=params, options=options)["data"]  # type: ignore[no-any-return]
+        return self._cache.timeseries(
+            params or {},
+            lambda p: self._client.get("/analytics/timeseries", params=p, options=options)["data"],
+        )
 
     def top_templates(self, params: dict[str, Any] | None = None, options: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Templates mais utilizados."""
-        return self._client.get("/analytics/templates", params=params, options=options)["data"]  # type: ignore[no-any-return]
+        return self._get("/analytics/templates", params, options)  # type: ignore[no-any-return]
+
+    # ── Resultados em colunas ───────────────────────────
+
+    def by_channel_columns(
+        self,
+        params: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
+        *,
+        backend: Backend = "auto",
+    ) -> ColumnarTable:
+        """Como ``by_channel``, mas em colunas (``ColumnarTable``)."""
+        return ColumnarTable.from_records(self.by_channel(params, options), backend=backend)
+
+    def timeseries_columns(
+        self,
+        params: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
+        *,
+        backend: Backend = "auto",
+    ) -> TimeseriesTable:
+        """Como ``timeseries``, mas em colunas (``TimeseriesTable``).
+
+        Permite reamostrar, preencher lacunas, calcular taxas e juntar
+        períodos sem laços em Python — vetorizado com NumPy, se instalado.
+
+        Example:
+            ```python
+            series = client.analytics.timeseries_columns({"period": "30d", "granularity": "hour"})
+            daily = series.resample("day").fill_gaps("day")
+            rates = daily.rate("delivered", "sent")
+            ```
+        """
+        return TimeseriesTable.from_points(self.timeseries(params, options), backend=backend)
+
+    def top_templates_columns(
+        self,
+        params: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
+        *,
+        backend: Backend = "auto",
+    ) -> ColumnarTable:
+        """Como ``top_templates``, mas em colunas (``ColumnarTable``)."""
+        return ColumnarTable.from_records(self.top_templates(params, options), backend=backend)
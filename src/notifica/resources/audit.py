@@ -13,7 +13,12 @@ Use audit logs para rastrear ações sensíveis na sua organização:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+import time
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..audit_follow import follow
+from ..audit_store import AuditLogStore
 
 if TYPE_CHECKING:
     from ..client import NotificaClient
@@ -125,3 +130,75 @@ class Audit:
             ```
         """
         return self._client.get_one(f"{self._base_path}/{id}", options=options)  # type: ignore[no-any-return]
+
+    def mirror(self, path: str = ":memory:") -> AuditLogStore:
+        """Abre um espelho local (SQLite) dos audit logs associado a este recurso.
+
+        ⚠️ **Admin Only**: Requer autenticação admin.
+
+        Args:
+            path: Caminho do banco SQLite (default: em memória)
+
+        Returns:
+            ``AuditLogStore`` — chame ``sync()`` para buscar apenas as
+            entradas novas e ``query()`` para consultar localmente.
+
+        Example:
+            ```python
+            store = client.audit.mirror("audit.db")
+            store.sync()
+            revoked = store.query(action="api_key.revoked", actor_type="user")
+            ```
+        """
+        return AuditLogStore(path, self)
+
+    def follow(
+        self,
+        params: dict[str, Any] | None = None,
+        *,
+        since: str | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        max_seen: int = 10_000,
+        max_polls: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Iterator[dict[str, Any]]:
+        """Acompanha (tail) os audit logs, produzindo apenas entradas novas.
+
+        ⚠️ **Admin Only**: Requer autenticação admin.
+
+        Cada consulta lista só as entradas a partir da marca d'água; o
+        intervalo volta a ``min_interval`` quando há novidades e cresce até
+        ``max_interval`` enquanto ocioso. Entradas são deduplicadas por id
+        (janela de ``max_seen`` ids) e produzidas da mais antiga para a
+        mais nova. Para a variante assíncrona, veja
+        ``notifica.audit_follow.follow_async``.
+
+        Args:
+            params: Filtros (mesmos de list())
+            since: Produzir também as entradas desde esta data (ISO 8601);
+                por padrão, começa do momento atual
+            min_interval: Intervalo mínimo entre consultas (segundos)
+            max_interval: Intervalo máximo entre consultas (segundos)
+            backoff: Fator de crescimento do intervalo enquanto ocioso
+            max_seen: Quantidade de ids lembrados para deduplicação
+            max_polls: Encerra após este número de consultas (default: infinito)
+
+        Example:
+            ```python
+            for log in client.audit.follow({"resource_type": "api_key"}):
+                siem.send(log)
+            ```
+        """
+        return follow(
+            self,
+            params,
+            since=since,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            max_seen=max_seen,
+            max_polls=max_polls,
+            sleep=sleep,
+        )
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Iterator
 
+from ..export import Destination, export_list
+
 if TYPE_CHECKING:
     from ..client import NotificaClient
 
@@ -115,6 +117,10 @@ class BillingInvoices:
         """Itera automaticamente por todas as faturas."""
         return self._client.list_auto("/billing/invoices", params=params)
 
+    def export(self, destination: Destination, params: dict[str, Any] | None = None, **kwargs: Any) -> dict[str, Any]:
+        """Exporta todas as faturas para NDJSON ou CSV (mesmas opções de ``Notifications.export``)."""
+        return export_list(self._client, "/billing/invoices", destination, params, **kwargs)
+
     def get(self, id: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Obtém detalhes de uma fatura."""
         return self._client.get_one(f"/billing/invoices/{id}", options=options)  # type: ignore[no-any-return]
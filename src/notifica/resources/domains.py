@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..concurrency import DEFAULT_MAX_CONCURRENCY, map_concurrent
+from ..domain_health import DomainRef, build_report, domain_ref
+from ..errors import NotificaError
 
 if TYPE_CHECKING:
     from ..client import NotificaClient
+    from ..domain_health import DomainHealthCache
 
 
 class Domains:
     """Recurso de domínios."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(self, client: NotificaClient, health_cache: DomainHealthCache | None = None) -> None:
         self._client = client
+        self._health_cache = health_cache
 
     def create(self, params: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Registra um novo domínio de envio."""
@@ -33,7 +40,58 @@ class Domains:
     def delete(self, id: str, options: dict[str, Any] | None = None) -> None:
         """Remove um domínio."""
         self._client.delete(f"/domains/{id}", options=options)
+        if self._health_cache is not None:
+            self._health_cache.invalidate(id)
 
     def get_health(self, domain_id: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Obtém status de saúde do domínio."""
-        return self._client.get_one(f"/domains/{domain_id}/health", options=options)  # type: ignore[no-any-return]
+        """Obtém status de saúde do domínio.
+
+        Com ``domain_health_cache`` configurado, resultados recentes são
+        servidos do cache.
+        """
+        if self._health_cache is not None:
+            cached = self._health_cache.get(domain_id)
+            if cached is not None:
+                return cached
+        health: dict[str, Any] = self._client.get_one(f"/domains/{domain_id}/health", options=options)
+        if self._health_cache is not None:
+            self._health_cache.set(domain_id, health)
+        return health
+
+    def check_health(
+        self,
+        domains: Iterable[DomainRef] | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Verifica a saúde de muitos domínios em paralelo.
+
+        ``domains`` aceita ids ou objetos ``Domain``; por padrão, todos os
+        domínios da conta (via ``list_auto``). As consultas rodam com
+        concorrência limitada e passam pelo ``domain_health_cache``, se
+        configurado. Falhas de consulta não interrompem a verificação.
+
+        Retorna um ``DomainHealthReport``: ``checked``, ``healthy``,
+        ``failing`` (domínios com DNS/DKIM/SPF inválidos, ``issues`` ou
+        consulta falha), ``alerts`` (formato ``DomainAlert``) e ``errors``.
+
+        Example:
+            ```python
+            report = client.domains.check_health(max_concurrency=16)
+            for failing in report["failing"]:
+                print(failing["domain"], failing["issues"])
+            ```
+        """
+        refs = [domain_ref(domain) for domain in (self.list_auto() if domains is None else domains)]
+
+        def check(ref: tuple[str, str | None]) -> dict[str, Any] | NotificaError:
+            try:
+                return self.get_health(ref[0], options=options)
+            except NotificaError as exc:
+                return exc
+
+        results = map_concurrent(check, refs, max_concurrency)
+        return build_report(
+            (domain_id, name, result) for (domain_id, name), result in zip(refs, results, strict=True)
+        )
@@ -2,17 +2,62 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+import builtins
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from ..deliveries import DeliveryFuture
+from ..export import DEFAULT_BUFFER_SIZE, Destination, ExportFormat, export_list
+from ..phone import normalize_phone
+from ..tracking import NotificationTracker
+from ..types import SendNotificationParams
+from ..validation import compile_validator
 
 if TYPE_CHECKING:
     from ..client import NotificaClient
+    from ..consents import SmsConsentIndex
+    from ..deliveries import DeliveryIndex
+    from ..governor import QuotaGovernor
+    from ..preferences import PreferenceCache
+    from ..template_index import TemplateVariableIndex
+
+
+PHONE_CHANNELS = frozenset({"whatsapp", "sms"})
+
+
+def _skipped(params: dict[str, Any], reason: str, **extra: Any) -> dict[str, Any]:
+    """Monta o registro ``SkippedNotification`` de um envio pulado localmente."""
+    return {
+        "skipped": True,
+        "reason": reason,
+        "channel": params["channel"],
+        "to": params.get("to"),
+        **extra,
+    }
 
 
 class Notifications:
     """Recurso de notificações."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(
+        self,
+        client: NotificaClient,
+        preference_cache: PreferenceCache | None = None,
+        sms_consent_index: SmsConsentIndex | None = None,
+        normalize_phones: bool = False,
+        validate_payloads: bool = False,
+        template_variable_index: TemplateVariableIndex | None = None,
+        delivery_index: DeliveryIndex | None = None,
+        quota_governor: QuotaGovernor | None = None,
+    ) -> None:
         self._client = client
+        self._preferences = preference_cache
+        self._consent_index = sms_consent_index
+        self._normalize_phones = normalize_phones
+        self._validate = compile_validator(SendNotificationParams) if validate_payloads else None
+        self._variable_index = template_variable_index
+        self._deliveries = delivery_index
+        self._governor = quota_governor
 
     def send(
         self,
@@ -32,10 +77,91 @@ class Notifications:
                 "data": {"name": "João"},
             })
             ```
+
+        Com ``preference_cache`` configurado, ``options["subscriber_id"]`` (e
+        opcionalmente ``options["category"]``) habilita a filtragem local: se
+        as preferências em cache desativam o canal, nenhuma requisição é
+        feita e o retorno é um ``SkippedNotification`` (``{"skipped": True, ...}``).
+        Da mesma forma, com ``sms_consent_index`` configurado, envios SMS para
+        números com opt-out são pulados com ``reason="sms_opted_out"``.
+
+        Com ``normalize_phones=True``, o ``to`` de envios WhatsApp/SMS é
+        normalizado para E.164 localmente e números inválidos levantam
+        ``ValidationError`` sem round trip. Com ``validate_payloads=True``, o
+        payload é validado contra ``SendNotificationParams`` antes do envio.
+
+        Com ``template_variable_index`` configurado, envios com ``template``
+        têm ``data`` verificado contra as variáveis do template, levantando
+        ``ValidationError`` localmente se faltar alguma.
+
+        Com ``quota_governor`` configurado, o envio aguarda sua vez conforme
+        o uso da quota do plano; ``options["priority"]`` (``"transactional"``,
+        padrão, ou ``"bulk"``) define quão cedo ele é limitado.
         """
+        if self._validate is not None:
+            self._validate(params)
+        if self._variable_index is not None and params.get("template"):
+            self._variable_index.check(params["template"], params.get("data"))
+        if self._normalize_phones and params.get("channel") in PHONE_CHANNELS:
+            params = {**params, "to": normalize_phone(params["to"], field="to")}
+        if self._preferences is not None and options and options.get("subscriber_id"):
+            skipped = self._check_preferences(params, options)
+            if skipped is not None:
+                return skipped
+        if (
+            self._consent_index is not None
+            and params.get("channel") == "sms"
+            and self._consent_index.is_blocked(params["to"])
+        ):
+            return _skipped(params, "sms_opted_out")
+        if self._governor is not None:
+            self._governor.acquire(
+                params.get("channel"), (options or {}).get("priority", "transactional")
+            )
         response = self._client.post("/notifications", json=params, options=options)
         return response["data"]  # type: ignore[no-any-return]
 
+    def send_tracked(
+        self,
+        params: dict[str, Any],
+        options: dict[str, Any] | None = None,
+    ) -> DeliveryFuture:
+        """Envia uma notificação e retorna um future do seu status final.
+
+        Com ``delivery_index`` configurado, o future é resolvido pelo
+        ``WebhookReceiver`` ao chegar o evento terminal; sem webhook em
+        ``webhook_timeout`` (ou sem índice), o status é consultado por
+        polling. Envios pulados localmente resolvem imediatamente.
+
+        Example:
+            ```python
+            future = client.notifications.send_tracked({...})
+            notification = future.result(timeout=300)  # ou: await future
+            print(notification["status"])  # "delivered"
+            ```
+        """
+        future = DeliveryFuture(self.send(params, options), self, self._deliveries)
+        if self._deliveries is not None:
+            self._deliveries.register(future)
+        return future
+
+    def _check_preferences(
+        self,
+        params: dict[str, Any],
+        options: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Retorna o registro de envio pulado, ou ``None`` se permitido."""
+        assert self._preferences is not None
+        subscriber_id = options["subscriber_id"]
+        category = options.get("category")
+        if self._preferences.is_allowed(subscriber_id, params["channel"], category):
+            return None
+        self._preferences.record_skip()
+        skipped = _skipped(params, "preference_disabled", subscriber_id=subscriber_id)
+        if category is not None:
+            skipped["category"] = category
+        return skipped
+
     def list(
         self,
         params: dict[str, Any] | None = None,
@@ -61,6 +187,48 @@ class Notifications:
         """
         return self._client.list_auto("/notifications", params=params)
 
+    def export(
+        self,
+        destination: Destination,
+        params: dict[str, Any] | None = None,
+        *,
+        format: ExportFormat = "ndjson",
+        fields: Sequence[str] | None = None,
+        compress: bool | None = None,
+        read_ahead: bool = True,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Exporta todas as notificações (filtros de ``list``) para NDJSON ou CSV.
+
+        As páginas são gravadas conforme chegam, com a próxima já sendo
+        buscada em paralelo; o pico de memória é de duas páginas. Em CSV, as
+        colunas vêm de ``fields`` ou da primeira notificação, e valores
+        aninhados são gravados como JSON.
+
+        ``destination`` pode ser um caminho ou um arquivo binário aberto.
+        Caminhos terminados em ``.gz`` são comprimidos com gzip (ou force
+        com ``compress``) e gravados em ``<caminho>.part`` até o fim, de modo
+        que um arquivo incompleto nunca aparece no destino.
+
+        ``on_progress`` recebe ``{rows, pages, bytes_written,
+        bytes_uncompressed}`` após cada página. Retorna um ``ExportResult``.
+
+        Example:
+            ```python
+            result = client.notifications.export(
+                "notifications-2024-01.ndjson.gz",
+                {"start_date": "2024-01-01", "end_date": "2024-01-31"},
+                on_progress=lambda p: print(p["rows"], p["bytes_written"]),
+            )
+            ```
+        """
+        return export_list(
+            self._client, "/notifications", destination, params,
+            format=format, fields=fields, compress=compress, read_ahead=read_ahead,
+            buffer_size=buffer_size, on_progress=on_progress,
+        )
+
     def get(
         self,
         id: str,
@@ -73,9 +241,26 @@ class Notifications:
         self,
         notification_id: str,
         options: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> builtins.list[dict[str, Any]]:
         """Lista tentativas de entrega de uma notificação."""
         response = self._client.get(
             f"/notifications/{notification_id}/attempts", options=options
         )
         return response["data"]  # type: ignore[no-any-return]
+
+    def tracker(
+        self,
+        ids: Iterable[str] = (),
+        **kwargs: Any,
+    ) -> NotificationTracker:
+        """Cria um ``NotificationTracker`` para acompanhar ids até o status final.
+
+        Example:
+            ```python
+            tracker = client.notifications.tracker(ids, max_concurrency=16)
+            counts = tracker.run(timeout=3600)
+            ```
+        """
+        tracker = NotificationTracker(self, **kwargs)
+        tracker.add(ids)
+        return tracker
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..export import Destination, export_list
+from ..phone import normalize_phone
 
 if TYPE_CHECKING:
     from ..client import NotificaClient
+    from ..consents import SmsConsentIndex
 
 
 # ═══════════════════════════════════════════════════
@@ -90,8 +95,25 @@ class SmsCompliance:
 class SmsConsents:
     """Sub-recurso de consentimentos SMS."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(
+        self,
+        client: NotificaClient,
+        consent_index: SmsConsentIndex | None = None,
+        normalize_phones: bool = False,
+    ) -> None:
         self._client = client
+        self._index = consent_index
+        self._normalize_phones = normalize_phones
+        if consent_index is not None:
+            consent_index.attach(self)
+
+    def _phone(self, phone: str) -> str:
+        return normalize_phone(phone) if self._normalize_phones else phone
+
+    def _consent(self, params: dict[str, Any]) -> dict[str, Any]:
+        if not self._normalize_phones:
+            return params
+        return {**params, "phone": normalize_phone(params["phone"])}
 
     def list(self, params: dict[str, Any] | None = None, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Lista consentimentos SMS com paginação."""
@@ -101,26 +123,56 @@ class SmsConsents:
         """Itera automaticamente por todos os consentimentos."""
         return self._client.list_auto("/channels/sms/consents", params=params)
 
+    def export(self, destination: Destination, params: dict[str, Any] | None = None, **kwargs: Any) -> dict[str, Any]:
+        """Exporta todos os consentimentos SMS para NDJSON ou CSV (mesmas opções de ``Notifications.export``)."""
+        return export_list(self._client, "/channels/sms/consents", destination, params, **kwargs)
+
     def summary(self, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Obtém resumo estatístico dos consentimentos."""
         return self._client.get_one("/channels/sms/consents/summary", options=options)  # type: ignore[no-any-return]
 
     def get(self, phone: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Obtém o consentimento de um número específico."""
-        return self._client.get_one(f"/channels/sms/consents/{phone}", options=options)  # type: ignore[no-any-return]
+        return self._client.get_one(f"/channels/sms/consents/{self._phone(phone)}", options=options)  # type: ignore[no-any-return]
 
     def revoke(self, phone: str, options: dict[str, Any] | None = None) -> None:
         """Revoga o consentimento de um número (DELETE)."""
+        phone = self._phone(phone)
         self._client.delete(f"/channels/sms/consents/{phone}", options=options)
+        if self._index is not None:
+            self._index.apply({"phone": phone, "status": "opted_out"})
 
     def create(self, params: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Cria ou atualiza um consentimento SMS (idempotent)."""
-        return self._client.post("/channels/sms/consents", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        consent: dict[str, Any] = self._client.post(
+            "/channels/sms/consents", json=self._consent(params), options=options
+        )["data"]
+        if self._index is not None and "status" in consent:
+            self._index.apply(consent)
+        return consent
 
     def import_bulk(self, params: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Importa consentimentos em lote."""
+        if self._normalize_phones:
+            params = {**params, "consents": [self._consent(c) for c in params["consents"]]}
         return self._client.post("/channels/sms/consents/import", json=params, options=options)["data"]  # type: ignore[no-any-return]
 
+    def import_bulk_stream(
+        self,
+        consents: Iterable[dict[str, Any]],
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Importa consentimentos em lote a partir de um iterável (ex: generator).
+
+        O corpo é enviado com chunked transfer encoding e codificado item a
+        item. Requisições streaming não são retentadas automaticamente.
+        """
+        if self._normalize_phones:
+            consents = (self._consent(c) for c in consents)
+        return self._client.post_stream(  # type: ignore[no-any-return]
+            "/channels/sms/consents/import", "consents", consents, options=options
+        )["data"]
+
 
 # ═══════════════════════════════════════════════════
 # Main SMS Resource
@@ -130,7 +182,14 @@ class SmsConsents:
 class Sms:
     """Recurso de SMS com sub-recursos providers, compliance e consents."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(
+        self,
+        client: NotificaClient,
+        consent_index: SmsConsentIndex | None = None,
+        normalize_phones: bool = False,
+    ) -> None:
         self.providers = SmsProviders(client)
         self.compliance = SmsCompliance(client)
-        self.consents = SmsConsents(client)
+        self.consents = SmsConsents(
+            client, consent_index=consent_index, normalize_phones=normalize_phones
+        )
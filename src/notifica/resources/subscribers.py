@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+import builtins
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..export import Destination, export_list
+from ..types import CreateSubscriberParams
+from ..validation import compile_validator
 
 if TYPE_CHECKING:
     from ..client import NotificaClient
+    from ..preferences import PreferenceCache
 
 
 class Subscribers:
     """Recurso de subscribers."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(
+        self,
+        client: NotificaClient,
+        preference_cache: PreferenceCache | None = None,
+        validate_payloads: bool = False,
+    ) -> None:
         self._client = client
+        self._preferences = preference_cache
+        self._validate = compile_validator(CreateSubscriberParams) if validate_payloads else None
 
     def create(self, params: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Cria ou atualiza um subscriber (upsert por external_id).
 
         LGPD: registra consentimento automaticamente.
         """
+        if self._validate is not None:
+            self._validate(params)
         return self._client.post("/subscribers", json=params, options=options)["data"]  # type: ignore[no-any-return]
 
     def list(self, params: dict[str, Any] | None = None, options: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -29,6 +45,10 @@ class Subscribers:
         """Itera automaticamente por todos os subscribers."""
         return self._client.list_auto("/subscribers", params=params)
 
+    def export(self, destination: Destination, params: dict[str, Any] | None = None, **kwargs: Any) -> dict[str, Any]:
+        """Exporta todos os subscribers para NDJSON ou CSV (mesmas opções de ``Notifications.export``)."""
+        return export_list(self._client, "/subscribers", destination, params, **kwargs)
+
     def get(self, id: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Obtém detalhes de um subscriber."""
         return self._client.get_one(f"/subscribers/{id}", options=options)  # type: ignore[no-any-return]
@@ -43,16 +63,43 @@ class Subscribers:
         ⚠️ Irreversível: email, telefone e nome são removidos.
         """
         self._client.delete(f"/subscribers/{id}", options=options)
+        if self._preferences is not None:
+            self._preferences.invalidate(id)
 
     # ── Preferences ─────────────────────────────────────
 
     def get_preferences(self, id: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Obtém preferências de notificação do subscriber."""
-        return self._client.get_one(f"/subscribers/{id}/preferences", options=options)  # type: ignore[no-any-return]
+        """Obtém preferências de notificação do subscriber.
+
+        Com ``preference_cache`` configurado, serve do cache enquanto a
+        entrada for válida e armazena a resposta da API nos demais casos.
+        """
+        if self._preferences is not None:
+            cached = self._preferences.get(id)
+            if cached is not None:
+                return cached
+        prefs: dict[str, Any] = self._client.get_one(f"/subscribers/{id}/preferences", options=options)
+        if self._preferences is not None:
+            self._preferences.store(id, prefs)
+        return prefs
 
     def update_preferences(self, id: str, params: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Atualiza preferências de notificação do subscriber."""
-        return self._client.put(f"/subscribers/{id}/preferences", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        """Atualiza preferências de notificação do subscriber.
+
+        Com ``preference_cache`` configurado, a resposta substitui a entrada
+        em cache (write-through); em caso de erro, a entrada é invalidada.
+        """
+        if self._preferences is None:
+            return self._client.put(f"/subscribers/{id}/preferences", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        try:
+            prefs: dict[str, Any] = self._client.put(
+                f"/subscribers/{id}/preferences", json=params, options=options
+            )["data"]
+        except Exception:
+            self._preferences.invalidate(id)
+            raise
+        self._preferences.store(id, prefs)
+        return prefs
 
     # ── Bulk import ─────────────────────────────────────
 
@@ -60,6 +107,31 @@ class Subscribers:
         """Importa subscribers em lote (upsert transacional)."""
         return self._client.post("/subscribers/import", json=params, options=options)["data"]  # type: ignore[no-any-return]
 
+    def bulk_import_stream(
+        self,
+        subscribers: Iterable[dict[str, Any]],
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Importa subscribers em lote a partir de um iterável (ex: generator).
+
+        O corpo é enviado com chunked transfer encoding e codificado item a
+        item, sem materializar a lista inteira em memória. Requisições
+        streaming não são retentadas automaticamente.
+
+        Example:
+            ```python
+            def rows():
+                for line in open("subscribers.csv"):
+                    external_id, email = line.strip().split(",")
+                    yield {"external_id": external_id, "email": email}
+
+            result = client.subscribers.bulk_import_stream(rows())
+            ```
+        """
+        return self._client.post_stream(  # type: ignore[no-any-return]
+            "/subscribers/import", "subscribers", subscribers, options=options
+        )["data"]
+
     # ── In-App Notifications ────────────────────────────
 
     def list_notifications(
@@ -67,7 +139,7 @@ class Subscribers:
         subscriber_id: str,
         params: dict[str, Any] | None = None,
         options: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> builtins.list[dict[str, Any]]:
         """Lista notificações in-app de um subscriber."""
         response = self._client.get(
             f"/subscribers/{subscriber_id}/notifications",
@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+import builtins
+import copy
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..concurrency import DEFAULT_MAX_CONCURRENCY, map_concurrent
+from ..previews import fingerprint
 
 if TYPE_CHECKING:
     from ..client import NotificaClient
+    from ..previews import PreviewCache
+    from ..template_index import TemplateVariableIndex
 
 
 class Templates:
     """Recurso de templates."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(
+        self,
+        client: NotificaClient,
+        preview_cache: PreviewCache | None = None,
+        variable_index: TemplateVariableIndex | None = None,
+    ) -> None:
         self._client = client
+        self._previews = preview_cache
+        self._variable_index = variable_index
+        if variable_index is not None:
+            variable_index.attach(self)
+
+    def _seen(self, template: dict[str, Any]) -> dict[str, Any]:
+        if self._previews is not None:
+            self._previews.note_version(template)
+        if self._variable_index is not None:
+            self._variable_index.add(template)
+        return template
 
     def create(
         self,
@@ -31,7 +55,7 @@ class Templates:
             })
             ```
         """
-        return self._client.post("/templates", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        return self._seen(self._client.post("/templates", json=params, options=options)["data"])
 
     def list(
         self,
@@ -54,7 +78,7 @@ class Templates:
         options: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Obtém detalhes de um template."""
-        return self._client.get_one(f"/templates/{id}", options=options)  # type: ignore[no-any-return]
+        return self._seen(self._client.get_one(f"/templates/{id}", options=options))
 
     def update(
         self,
@@ -62,8 +86,10 @@ class Templates:
         params: dict[str, Any],
         options: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Atualiza um template."""
-        return self._client.put(f"/templates/{id}", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        """Atualiza um template (invalida os previews em cache do template)."""
+        if self._previews is not None:
+            self._previews.invalidate(id)
+        return self._seen(self._client.put(f"/templates/{id}", json=params, options=options)["data"])
 
     def delete(
         self,
@@ -72,6 +98,10 @@ class Templates:
     ) -> None:
         """Deleta um template."""
         self._client.delete(f"/templates/{id}", options=options)
+        if self._previews is not None:
+            self._previews.invalidate(id)
+        if self._variable_index is not None:
+            self._variable_index.remove(id)
 
     def preview(
         self,
@@ -79,16 +109,86 @@ class Templates:
         params: dict[str, Any],
         options: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Preview de um template salvo com variáveis."""
-        return self._client.post(f"/templates/{id}/preview", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        """Preview de um template salvo com variáveis.
+
+        Com ``preview_cache`` configurado, previews repetidos (mesmo template,
+        mesma versão e mesmos dados) são servidos do cache.
+        """
+        if self._previews is None:
+            return self._client.post(f"/templates/{id}/preview", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        key = self._previews.template_key(id, params)
+        cached = self._previews.get(key)
+        if cached is not None:
+            return cached
+        preview: dict[str, Any] = self._client.post(
+            f"/templates/{id}/preview", json=params, options=options
+        )["data"]
+        self._previews.set(key, preview)
+        return preview
 
     def preview_content(
         self,
         params: dict[str, Any],
         options: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Preview de conteúdo arbitrário (útil para editor em tempo real)."""
-        return self._client.post("/templates/preview", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        """Preview de conteúdo arbitrário (útil para editor em tempo real).
+
+        Com ``preview_cache`` configurado, é memoizado pelo hash de
+        conteúdo + variáveis.
+        """
+        if self._previews is None:
+            return self._client.post("/templates/preview", json=params, options=options)["data"]  # type: ignore[no-any-return]
+        key = self._previews.content_key(params)
+        cached = self._previews.get(key)
+        if cached is not None:
+            return cached
+        preview: dict[str, Any] = self._client.post("/templates/preview", json=params, options=options)["data"]
+        self._previews.set(key, preview)
+        return preview
+
+    def preview_many(
+        self,
+        id: str,
+        params_list: Iterable[dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+        options: dict[str, Any] | None = None,
+    ) -> builtins.list[Any]:
+        """Renderiza um template com vários conjuntos de dados em paralelo.
+
+        Conjuntos de dados idênticos são renderizados uma única vez e as
+        requisições rodam com no máximo ``max_concurrency`` em voo. Os
+        resultados voltam na ordem de entrada.
+
+        Example:
+            ```python
+            previews = client.templates.preview_many("tpl_abc", [
+                {"variables": {"name": "Ana"}},
+                {"variables": {"name": "Bruno"}},
+            ])
+            ```
+        """
+        return _unique_map(
+            lambda params: self.preview(id, params, options),
+            params_list,
+            max_concurrency,
+            return_exceptions,
+        )
+
+    def preview_content_many(
+        self,
+        params_list: Iterable[dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+        options: dict[str, Any] | None = None,
+    ) -> builtins.list[Any]:
+        """Versão em lote de ``preview_content`` (veja ``preview_many``)."""
+        return _unique_map(
+            lambda params: self.preview_content(params, options),
+            params_list,
+            max_concurrency,
+            return_exceptions,
+        )
 
     def validate(
         self,
@@ -105,3 +205,33 @@ class Templates:
     ) -> dict[str, Any]:
         """Valida conteúdo arbitrário."""
         return self._client.post("/templates/validate", json=params, options=options)["data"]  # type: ignore[no-any-return]
+
+
+def _unique_map(
+    render: Callable[[dict[str, Any]], Any],
+    params_list: Iterable[dict[str, Any]],
+    max_concurrency: int,
+    return_exceptions: bool,
+) -> list[Any]:
+    """Executa ``render`` uma vez por payload distinto e expande na ordem original."""
+    keys: list[str] = []
+    unique: dict[str, dict[str, Any]] = {}
+    for params in params_list:
+        key = fingerprint(params)
+        keys.append(key)
+        unique.setdefault(key, params)
+
+    rendered = dict(
+        zip(
+            unique,
+            map_concurrent(render, unique.values(), max_concurrency, return_exceptions),
+            strict=True,
+        )
+    )
+    seen: set[str] = set()
+    results: list[Any] = []
+    for key in keys:
+        result = rendered[key]
+        results.append(copy.deepcopy(result) if key in seen else result)
+        seen.add(key)
+    return results
@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator
+import builtins
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from ..concurrency import DEFAULT_MAX_CONCURRENCY, imap_concurrent, map_concurrent
+from ..errors import NotificaError
+from ..runs import WorkflowRunWatcher
+from ..triggers import (
+    Recipient,
+    iter_unique_recipients,
+    new_batch_id,
+    trigger_idempotency_key,
+    trigger_result,
+)
+from ..types import CreateWorkflowParams, TriggerWorkflowParams
+from ..validation import Validator, compile_validator
 
 if TYPE_CHECKING:
     from ..client import NotificaClient
+    from ..governor import QuotaGovernor
 
 
 class Workflows:
     """Recurso de workflows."""
 
-    def __init__(self, client: NotificaClient) -> None:
+    def __init__(
+        self,
+        client: NotificaClient,
+        validate_payloads: bool = False,
+        quota_governor: QuotaGovernor | None = None,
+    ) -> None:
         self._client = client
+        self._governor = quota_governor
+        self._validate_create: Validator | None = None
+        self._validate_trigger: Validator | None = None
+        if validate_payloads:
+            self._validate_create = compile_validator(CreateWorkflowParams)
+            self._validate_trigger = compile_validator(TriggerWorkflowParams)
 
     def create(
         self,
@@ -34,6 +61,8 @@ class Workflows:
             })
             ```
         """
+        if self._validate_create is not None:
+            self._validate_create(params)
         return self._client.post("/workflows", json=params, options=options)["data"]  # type: ignore[no-any-return]
 
     def list(
@@ -84,8 +113,85 @@ class Workflows:
             })
             ```
         """
+        if self._validate_trigger is not None:
+            self._validate_trigger(params)
         return self._client.post(f"/workflows/{slug}/trigger", json=params, options=options)["data"]  # type: ignore[no-any-return]
 
+    def trigger_many(
+        self,
+        slug: str,
+        recipients: Iterable[Recipient],
+        data: dict[str, Any] | None = None,
+        *,
+        batch_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        options: dict[str, Any] | None = None,
+    ) -> builtins.list[dict[str, Any]]:
+        """Dispara um workflow para muitos destinatários.
+
+        Destinatários (strings ou ``{"recipient", "data"}``) são consumidos
+        sob demanda e deduplicados; os disparos rodam com concorrência
+        limitada. Cada disparo usa uma idempotency key estável (slug +
+        destinatário + dados + ``batch_id``). Sem ``batch_id``, cada chamada
+        gera um novo lote aleatório, então disparar o mesmo fluxo de novo
+        não é deduplicado pela API; para retomar um lote que falhou no meio
+        sem duplicar execuções, repita a chamada com o ``batch_id`` devolvido
+        nos resultados.
+
+        Retorna um ``TriggerResult`` por destinatário único, na ordem de
+        entrada: ``{recipient, run_id, run, error, batch_id}``. Erros da API não
+        interrompem o lote. Com ``quota_governor`` configurado, cada disparo
+        passa por ele com prioridade ``"bulk"``; disparos bloqueados pela
+        quota viram resultados com ``QuotaExceededError``.
+
+        Example:
+            ```python
+            results = client.workflows.trigger_many(
+                "welcome-flow",
+                ["+5511999999999", {"recipient": "+5511888888888", "data": {"name": "Ana"}}],
+                data={"plan": "pro"},
+                max_concurrency=16,
+            )
+            failed = [r for r in results if r["error"] is not None]
+            if failed:  # retoma só o que falhou, no mesmo lote
+                client.workflows.trigger_many(
+                    "welcome-flow", [r["recipient"] for r in failed], data={"plan": "pro"},
+                    batch_id=results[0]["batch_id"],
+                )
+            ```
+        """
+        return list(self.iter_trigger_many(
+            slug, recipients, data,
+            batch_id=batch_id, max_concurrency=max_concurrency, options=options,
+        ))
+
+    def iter_trigger_many(
+        self,
+        slug: str,
+        recipients: Iterable[Recipient],
+        data: dict[str, Any] | None = None,
+        *,
+        batch_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        options: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Como ``trigger_many``, mas produz os resultados conforme ficam prontos (em ordem)."""
+        batch = batch_id or new_batch_id()
+
+        def trigger(params: dict[str, Any]) -> dict[str, Any]:
+            key = trigger_idempotency_key(slug, params, batch)
+            try:
+                if self._governor is not None:
+                    self._governor.acquire(None, "bulk")
+                run = self.trigger(slug, params, options={**(options or {}), "idempotency_key": key})
+            except NotificaError as exc:
+                return trigger_result(params, batch, error=exc)
+            return trigger_result(params, batch, run=run)
+
+        return imap_concurrent(  # type: ignore[return-value]
+            trigger, iter_unique_recipients(recipients, data), max_concurrency
+        )
+
     # ── Workflow Runs ───────────────────────────────────
 
     def list_runs(
@@ -96,6 +202,13 @@ class Workflows:
         """Lista execuções de workflows."""
         return self._client.list("/workflow-runs", params=params, options=options)  # type: ignore[no-any-return]
 
+    def list_runs_auto(
+        self,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Itera automaticamente por todas as execuções (filtros: ``workflow_id``, ``status``)."""
+        return self._client.list_auto("/workflow-runs", params=params)
+
     def get_run(self, id: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Obtém detalhes de uma execução (incluindo step_results)."""
         return self._client.get_one(f"/workflow-runs/{id}", options=options)  # type: ignore[no-any-return]
@@ -103,3 +216,24 @@ class Workflows:
     def cancel_run(self, id: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Cancela uma execução em andamento."""
         return self._client.post(f"/workflow-runs/{id}/cancel", options=options)["data"]  # type: ignore[no-any-return]
+
+    def cancel_runs(
+        self,
+        ids: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        options: dict[str, Any] | None = None,
+    ) -> builtins.list[dict[str, Any] | BaseException]:
+        """Cancela várias execuções com concorrência limitada.
+
+        Retorna, na ordem dos ids, o run cancelado ou a exceção da falha.
+        """
+        return map_concurrent(
+            lambda run_id: self.cancel_run(run_id, options=options),
+            ids,
+            max_concurrency,
+            return_exceptions=True,
+        )
+
+    def watch_runs(self, **kwargs: Any) -> WorkflowRunWatcher:
+        """Cria um ``WorkflowRunWatcher`` (veja seus argumentos)."""
+        return WorkflowRunWatcher(self, **kwargs)
@@ -0,0 +1,204 @@
+"""Acompanhamento de execuções de workflows via listagem de ``/workflow-runs``."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .concurrency import DEFAULT_MAX_CONCURRENCY, map_concurrent
+from .errors import ApiError
+
+if TYPE_CHECKING:
+    from .resources.workflows import Workflows
+
+TERMINAL_RUN_STATUSES = frozenset({"completed", "failed", "cancelled"})
+# Ordem importa: um run que passa de pending para running entre as duas
+# listagens aparece na segunda.
+ACTIVE_RUN_STATUSES = ("pending", "running")
+# Erros de autenticação/permissão valem para todos os runs: não adianta repetir.
+_FATAL_STATUSES = frozenset({401, 403})
+
+
+class _RunState:
+    __slots__ = ("status", "steps", "errors")
+
+    def __init__(self) -> None:
+        self.status: str | None = None
+        self.steps: dict[int, str] = {}
+        self.errors = 0
+
+
+class WorkflowRunWatcher:
+    """Acompanha muitas execuções de workflow até um status terminal.
+
+    Cada rodada lista apenas os runs ativos (``pending`` e ``running``,
+    filtrados por ``workflow_id``) com paginação por cursor — o custo é
+    proporcional ao número de páginas, não de runs. Só os runs que saíram
+    das listagens ativas (ou seja, que mudaram para um status terminal) são
+    consultados individualmente via ``get_run``.
+
+    Transições são emitidas por callbacks: ``on_run(run, status_anterior)``
+    a cada mudança de status e ``on_step(run, step, status_anterior)`` a
+    cada mudança em ``step_results``.
+
+    Um run cujo ``get_run`` falha ``max_errors`` vezes seguidas (ex:
+    removido, 404) deixa de ser acompanhado e é contado como ``error``.
+    Erros de autenticação (401/403) são levantados por ``poll``.
+
+    Args:
+        workflows: Recurso de workflows usado nas consultas.
+        workflow_id: Filtra as listagens por workflow.
+        run_ids: Acompanha apenas estes runs (default: todos os ativos).
+        page_size: ``limit`` de cada página da listagem.
+        max_concurrency: Máximo de ``get_run``/``cancel_run`` simultâneos.
+        max_errors: Erros consecutivos de ``get_run`` após os quais um run é abandonado.
+
+    Example:
+        ```python
+        watcher = client.workflows.watch_runs(
+            workflow_id="wf_abc",
+            on_step=lambda run, step, _: print(run["id"], step["step_index"], step["status"]),
+        )
+        counts = watcher.watch(interval=10)  # {"completed": 950, "failed": 50}
+        ```
+    """
+
+    def __init__(
+        self,
+        workflows: Workflows,
+        *,
+        workflow_id: str | None = None,
+        run_ids: Iterable[str] | None = None,
+        page_size: int = 100,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_errors: int = 5,
+        on_run: Callable[[dict[str, Any], str | None], None] | None = None,
+        on_step: Callable[[dict[str, Any], dict[str, Any], str | None], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._workflows = workflows
+        self._workflow_id = workflow_id
+        self._page_size = page_size
+        self._max_concurrency = max_concurrency
+        self._max_errors = max_errors
+        self._on_run = on_run
+        self._on_step = on_step
+        self._clock = clock
+        self._sleep = sleep
+
+        self._fixed = run_ids is not None
+        self._tracked: dict[str, _RunState] = {}
+        for run_id in run_ids or ():
+            self._tracked[run_id] = _RunState()
+        self._counts: dict[str, int] = {}
+
+    @property
+    def active(self) -> int:
+        """Quantidade de runs acompanhados ainda não finalizados."""
+        return len(self._tracked)
+
+    def counts(self) -> dict[str, int]:
+        """Contagens por status: terminais acumulados e ativos atuais."""
+        counts = dict(self._counts)
+        for state in self._tracked.values():
+            status = state.status or "unknown"
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    # ── Observação ──────────────────────────────────────
+
+    def _observe(self, run: dict[str, Any]) -> None:
+        run_id = run["id"]
+        state = self._tracked.get(run_id)
+        if state is None:
+            if self._fixed:
+                return
+            state = self._tracked[run_id] = _RunState()
+
+        state.errors = 0
+        for step in run.get("step_results") or ():
+            index = step["step_index"]
+            previous = state.steps.get(index)
+            if previous != step["status"]:
+                state.steps[index] = step["status"]
+                if self._on_step is not None:
+                    self._on_step(run, step, previous)
+
+        previous_status = state.status
+        status = run["status"]
+        if status != previous_status:
+            state.status = status
+            if self._on_run is not None:
+                self._on_run(run, previous_status)
+        if status in TERMINAL_RUN_STATUSES:
+            self._settle(run_id, status)
+
+    def _settle(self, run_id: str, status: str) -> None:
+        del self._tracked[run_id]
+        self._counts[status] = self._counts.get(status, 0) + 1
+
+    def _fail(self, run_id: str, error: BaseException) -> None:
+        if isinstance(error, ApiError) and error.status in _FATAL_STATUSES:
+            raise error
+        state = self._tracked[run_id]
+        state.errors += 1
+        if state.errors >= self._max_errors:
+            self._settle(run_id, "error")
+
+    def _list_active(self) -> set[str]:
+        seen: set[str] = set()
+        for status in ACTIVE_RUN_STATUSES:
+            params: dict[str, Any] = {"status": status, "limit": self._page_size}
+            if self._workflow_id is not None:
+                params["workflow_id"] = self._workflow_id
+            for run in self._workflows.list_runs_auto(params):
+                seen.add(run["id"])
+                self._observe(run)
+        return seen
+
+    def poll(self) -> int:
+        """Executa uma rodada; retorna quantos runs finalizaram (inclusive com ``error``)."""
+        before = sum(self._counts.values())
+        seen = self._list_active()
+        # Runs que saíram das listagens ativas mudaram de status: um GET cada.
+        missing = [run_id for run_id in self._tracked if run_id not in seen]
+        results = map_concurrent(
+            self._workflows.get_run, missing, self._max_concurrency, return_exceptions=True
+        )
+        for run_id, result in zip(missing, results, strict=True):
+            if isinstance(result, BaseException):
+                self._fail(run_id, result)
+            else:
+                self._observe(result)
+        return sum(self._counts.values()) - before
+
+    def watch(self, interval: float = 5.0, timeout: float | None = None) -> dict[str, int]:
+        """Consulta a cada ``interval`` segundos até não haver runs ativos (ou ``timeout``)."""
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            self.poll()
+            if not self._tracked:
+                break
+            wait = interval
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    break
+                wait = min(wait, remaining)
+            self._sleep(wait)
+        return self.counts()
+
+    def cancel(
+        self,
+        run_ids: Iterable[str] | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Cancela runs (default: todos os ativos acompanhados) com concorrência limitada."""
+        ids = list(self._tracked) if run_ids is None else list(run_ids)
+        results = self._workflows.cancel_runs(ids, max_concurrency or self._max_concurrency)
+        for result in results:
+            if not isinstance(result, BaseException) and "status" in result and "id" in result:
+                self._observe(result)
+        return results
@@ -0,0 +1,223 @@
+"""Índice das variáveis exigidas por cada template, para checar ``data`` antes do envio."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from .cache import TTLCache
+from .errors import ValidationError
+from .rendering import MISSING, CompiledTemplate, lookup
+
+if TYPE_CHECKING:
+    from .resources.templates import Templates
+
+# Variáveis de um template como tuplas ``(nome, caminho)``; compartilhadas entre templates iguais.
+Requirements = tuple[tuple[str, tuple[str, ...]], ...]
+
+# Conjuntos de variáveis distintos guardados para compartilhamento; ao
+# exceder, os menos usados deixam de ser compartilhados (só custa memória).
+_MAX_INTERNED = 4096
+
+
+class TemplateVariableIndex:
+    """Índice pré-computado das variáveis que cada template exige.
+
+    Construído a partir de ``Templates.list_auto`` (campo ``variables`` do
+    template, ou extração local do conteúdo quando ausente — opcionalmente
+    via ``Templates.validate_content``), indexado por id e slug. Refreshes
+    só reprocessam templates cujo ``updated_at`` mudou, e conjuntos de
+    variáveis idênticos são armazenados uma única vez.
+
+    Quando configurado em ``Notifica(template_variable_index=...)``,
+    ``Notifications.send`` verifica ``data`` contra o índice em O(k) e
+    levanta ``ValidationError`` localmente se faltar alguma variável. O
+    envio nunca sincroniza o índice (isso listaria todos os templates
+    dentro da requisição): chame ``refresh()`` ou, periodicamente,
+    ``refresh_if_stale()`` fora do caminho de envio.
+
+    Args:
+        max_age: Idade máxima do índice em segundos, usada por
+            ``refresh_if_stale`` (``None`` = só sincroniza no primeiro uso).
+        use_validate_content: Usar ``Templates.validate_content`` para obter
+            as variáveis de templates sem o campo ``variables``.
+
+    Example:
+        ```python
+        from notifica import Notifica, TemplateVariableIndex
+
+        index = TemplateVariableIndex(max_age=300)
+        client = Notifica("nk_live_...", template_variable_index=index)
+        index.refresh()
+
+        index.missing("welcome-email", {"name": "João"})  # ["plan"]
+
+        # Num job periódico, fora do caminho de envio:
+        index.refresh_if_stale()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_age: float | None = None,
+        use_validate_content: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_age = max_age
+        self._use_validate_content = use_validate_content
+        self._clock = clock
+        self._templates: Templates | None = None
+        self._lock = threading.Lock()
+        # ``_loading`` garante um único refresh automático por vez.
+        self._loading = threading.Lock()
+
+        self._requirements: dict[str, Requirements] = {}
+        self._versions: dict[str, str] = {}
+        self._aliases: dict[str, str] = {}  # slug -> id
+        self._interned: TTLCache[Requirements, Requirements] = TTLCache(
+            max_size=_MAX_INTERNED, ttl=None
+        )
+        self._loaded_at: float | None = None
+
+    def attach(self, templates: Templates) -> None:
+        """Associa o índice ao recurso usado para carregar templates."""
+        self._templates = templates
+
+    # ── Building ────────────────────────────────────────
+
+    def _variables(self, template: Mapping[str, Any]) -> list[str]:
+        variables = template.get("variables")
+        if variables is not None:
+            return list(variables)
+        if self._use_validate_content and self._templates is not None:
+            params = {"content": template["content"], "channel": template["channel"]}
+            if template.get("variants"):
+                params["variants"] = template["variants"]
+            result = self._templates.validate_content(params)
+            if result.get("variables") is not None:
+                return list(result["variables"])
+        return CompiledTemplate.from_template(template).variables
+
+    def add(self, template: Mapping[str, Any]) -> bool:
+        """Indexa (ou reindexa) um template; retorna ``False`` se já estava atualizado."""
+        template_id = template["id"]
+        version = str(template.get("updated_at", ""))
+        if version and self._versions.get(template_id) == version:
+            return False
+        requirements: Requirements = tuple(
+            (sys.intern(name), tuple(sys.intern(p) for p in name.split(".")))
+            for name in self._variables(template)
+        )
+        with self._lock:
+            shared = self._interned.get(requirements)
+            if shared is None:
+                self._interned.set(requirements, requirements)
+            else:
+                requirements = shared
+            self._requirements[template_id] = requirements
+            self._versions[template_id] = version
+            slug = template.get("slug")
+            if slug:
+                self._aliases[slug] = template_id
+        return True
+
+    def remove(self, id_or_slug: str) -> None:
+        """Remove um template do índice."""
+        with self._lock:
+            template_id = self._aliases.pop(id_or_slug, id_or_slug)
+            self._requirements.pop(template_id, None)
+            self._versions.pop(template_id, None)
+            for slug in [s for s, i in self._aliases.items() if i == template_id]:
+                del self._aliases[slug]
+
+    def refresh(self, params: dict[str, Any] | None = None) -> dict[str, int]:
+        """Sincroniza com ``Templates.list_auto``.
+
+        Apenas templates novos ou com ``updated_at`` diferente são
+        reprocessados; templates que sumiram da listagem são removidos
+        (somente quando ``params`` não filtra a listagem).
+        """
+        if self._templates is None:
+            raise RuntimeError("TemplateVariableIndex não está associado a um cliente")
+        seen: set[str] = set()
+        updated = 0
+        for template in self._templates.list_auto(params):
+            seen.add(template["id"])
+            if self.add(template):
+                updated += 1
+        removed = 0
+        if not params:
+            for template_id in set(self._requirements) - seen:
+                self.remove(template_id)
+                removed += 1
+        self._loaded_at = self._clock()
+        return {"templates": len(self._requirements), "updated": updated, "removed": removed}
+
+    def refresh_if_stale(self) -> None:
+        """Sincroniza se ``max_age`` expirou (ou se nunca foi carregado)."""
+        if self._templates is None or not self._is_stale():
+            return
+        # Com um índice já carregado, as demais threads seguem com ele
+        # enquanto uma só sincroniza; sem índice, todas esperam a carga.
+        if not self._loading.acquire(blocking=self._loaded_at is None):
+            return
+        try:
+            if self._is_stale():
+                self.refresh()
+        finally:
+            self._loading.release()
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or (
+            self._max_age is not None and self._clock() - self._loaded_at > self._max_age
+        )
+
+    # ── Lookup ──────────────────────────────────────────
+
+    def required(self, id_or_slug: str) -> list[str] | None:
+        """Variáveis exigidas pelo template, ou ``None`` se desconhecido."""
+        requirements = self._get(id_or_slug)
+        return None if requirements is None else [name for name, _ in requirements]
+
+    def _get(self, id_or_slug: str) -> Requirements | None:
+        requirements = self._requirements.get(id_or_slug)
+        if requirements is None:
+            template_id = self._aliases.get(id_or_slug)
+            if template_id is not None:
+                requirements = self._requirements.get(template_id)
+        return requirements
+
+    def missing(self, id_or_slug: str, data: Mapping[str, Any] | None) -> list[str]:
+        """Variáveis exigidas ausentes em ``data`` (O(k) no número de variáveis)."""
+        requirements = self._get(id_or_slug)
+        if not requirements:
+            return []
+        data = data or {}
+        return [name for name, path in requirements if lookup(data, path) is MISSING]
+
+    def check(self, id_or_slug: str, data: Mapping[str, Any] | None) -> None:
+        """Levanta ``ValidationError`` se ``data`` não cobre as variáveis do template.
+
+        Templates desconhecidos pelo índice não são verificados. Não
+        sincroniza o índice (veja ``refresh_if_stale``).
+        """
+        missing = self.missing(id_or_slug, data)
+        if missing:
+            raise ValidationError(
+                f"Variáveis ausentes para o template {id_or_slug!r}: {', '.join(missing)}",
+                details={f"data.{name}": ["is required by template"] for name in missing},
+            )
+
+    def __len__(self) -> int:
+        return len(self._requirements)
+
+    def stats(self) -> dict[str, int]:
+        """Métricas do índice: templates, aliases e conjuntos distintos de variáveis."""
+        return {
+            "templates": len(self._requirements),
+            "aliases": len(self._aliases),
+            "distinct_variable_sets": len(set(map(id, self._requirements.values()))),
+        }
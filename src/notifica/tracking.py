@@ -0,0 +1,242 @@
+"""Acompanhamento em lote do status de notificações até um estado final."""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .concurrency import DEFAULT_MAX_CONCURRENCY, imap_unordered
+from .errors import NotificaError
+
+if TYPE_CHECKING:
+    from .resources.notifications import Notifications
+
+TERMINAL_STATUSES = frozenset({"delivered", "failed", "bounced", "rejected"})
+
+
+class _Tracked:
+    __slots__ = ("status", "interval", "errors")
+
+    def __init__(self, interval: float) -> None:
+        self.status: str | None = None
+        self.interval = interval
+        self.errors = 0
+
+
+class NotificationTracker:
+    """Acompanha muitas notificações até um status terminal.
+
+    Cada id é consultado via ``Notifications.get`` com concorrência limitada
+    e backoff adaptativo individual: o intervalo dobra (até ``max_interval``)
+    enquanto o status não muda e volta a ``initial_interval`` quando muda.
+    Ids em status terminal (delivered, failed, bounced, rejected) saem do
+    acompanhamento e são reportados via ``on_settled`` assim que a consulta
+    de cada um termina; no máximo ``2 * max_concurrency`` consultas ficam
+    em voo, qualquer que seja o tamanho da rodada.
+
+    Quando muitos ids vencem na mesma rodada (``list_threshold``), a
+    listagem filtrada por status terminal (e ``list_params``, ex: canal)
+    substitui os GETs individuais: uma página resolve até ``limit`` ids.
+    Cada varredura lista até ``max_list_pages`` páginas para *cada* um dos
+    quatro status terminais; sem ``list_params``, isso percorre as
+    notificações da conta inteira — restrinja com ``list_params`` (ex:
+    ``{"channel": "email"}``) ou desative com ``list_threshold=None``.
+
+    Args:
+        notifications: Recurso de notificações usado nas consultas.
+        max_concurrency: Máximo de GETs simultâneos.
+        initial_interval: Intervalo inicial entre consultas de um id (segundos).
+        max_interval: Intervalo máximo do backoff (segundos).
+        backoff: Fator multiplicativo do backoff.
+        max_errors: Erros consecutivos após os quais um id é abandonado.
+        list_threshold: Ids vencidos a partir dos quais a rodada usa listagem
+            (``None`` desativa).
+        list_params: Filtros extras da listagem (``channel``, ``limit``).
+        max_list_pages: Páginas por status em cada varredura.
+        on_settled: Chamado com a notificação ao atingir status terminal.
+        on_progress: Chamado com as contagens agregadas ao fim de cada rodada.
+
+    Example:
+        ```python
+        tracker = client.notifications.tracker(ids, on_settled=print)
+        counts = tracker.run(timeout=3600)
+        # {"delivered": 9800, "failed": 150, "bounced": 50, ...}
+        ```
+    """
+
+    def __init__(
+        self,
+        notifications: Notifications,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        initial_interval: float = 5.0,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        max_errors: int = 5,
+        list_threshold: int | None = 500,
+        list_params: dict[str, Any] | None = None,
+        max_list_pages: int = 10,
+        on_settled: Callable[[dict[str, Any]], None] | None = None,
+        on_progress: Callable[[dict[str, int]], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._notifications = notifications
+        self._max_concurrency = max_concurrency
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._max_errors = max_errors
+        self._list_threshold = list_threshold
+        self._list_params = list_params or {}
+        self._max_list_pages = max_list_pages
+        self._on_settled = on_settled
+        self._on_progress = on_progress
+        self._clock = clock
+        self._sleep = sleep
+
+        self._tracked: dict[str, _Tracked] = {}
+        self._schedule: list[tuple[float, str]] = []
+        self._counts: dict[str, int] = {}
+        # ``add``/``counts`` podem ser chamados de outras threads enquanto
+        # ``run`` consulta; ``on_settled`` roda fora do lock.
+        self._lock = threading.RLock()
+
+    # ── Tracking ────────────────────────────────────────
+
+    def add(self, ids: Iterable[str]) -> None:
+        """Adiciona ids ao acompanhamento (ids repetidos são ignorados)."""
+        now = self._clock()
+        with self._lock:
+            for notification_id in ids:
+                if notification_id not in self._tracked:
+                    self._tracked[notification_id] = _Tracked(self._initial_interval)
+                    heapq.heappush(self._schedule, (now, notification_id))
+
+    @property
+    def pending(self) -> int:
+        """Quantidade de ids ainda não finalizados."""
+        return len(self._tracked)
+
+    def counts(self) -> dict[str, int]:
+        """Contagens agregadas: status terminais, ``error`` e status dos pendentes."""
+        with self._lock:
+            counts = dict(self._counts)
+            for state in self._tracked.values():
+                status = state.status or "unknown"
+                counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    # ── Polling ─────────────────────────────────────────
+
+    def _settle(self, notification_id: str, status: str) -> None:
+        with self._lock:
+            del self._tracked[notification_id]
+            self._counts[status] = self._counts.get(status, 0) + 1
+
+    def _notify(self, notification: dict[str, Any] | None) -> None:
+        if notification is not None and self._on_settled is not None:
+            self._on_settled(notification)
+
+    def _observe(
+        self, notification_id: str, result: dict[str, Any] | BaseException, now: float
+    ) -> dict[str, Any] | None:
+        """Aplica o resultado de uma consulta e reagenda o id se necessário.
+
+        Retorna a notificação se ela atingiu um status terminal.
+        """
+        state = self._tracked[notification_id]
+        if isinstance(result, BaseException):
+            state.errors += 1
+            if state.errors >= self._max_errors:
+                self._settle(notification_id, "error")
+                return None
+            state.interval = min(state.interval * self._backoff, self._max_interval)
+        else:
+            state.errors = 0
+            status = result.get("status")
+            if status in TERMINAL_STATUSES:
+                self._settle(notification_id, status)
+                return result
+            if status == state.status:
+                state.interval = min(state.interval * self._backoff, self._max_interval)
+            else:
+                state.status = status
+                state.interval = self._initial_interval
+        heapq.heappush(self._schedule, (now + state.interval, notification_id))
+        return None
+
+    def _due(self, now: float) -> list[str]:
+        due: list[str] = []
+        while self._schedule and self._schedule[0][0] <= now:
+            _, notification_id = heapq.heappop(self._schedule)
+            if notification_id in self._tracked:
+                due.append(notification_id)
+        return due
+
+    def _sweep(self, due: set[str]) -> None:
+        """Resolve ids vencidos pela listagem filtrada por status terminal."""
+        for status in sorted(TERMINAL_STATUSES):
+            params: dict[str, Any] = {**self._list_params, "status": status}
+            for _ in range(self._max_list_pages):
+                if not due:
+                    return
+                page = self._notifications.list(params)
+                for notification in page["data"]:
+                    notification_id = notification.get("id")
+                    if notification_id in due:
+                        due.discard(notification_id)
+                        self._settle(notification_id, status)
+                        self._notify(notification)
+                meta = page.get("meta") or {}
+                if not meta.get("has_more") or not meta.get("cursor"):
+                    break
+                params = {**params, "cursor": meta["cursor"]}
+
+    def poll(self) -> int:
+        """Executa uma rodada com os ids vencidos; retorna quantos finalizaram."""
+        before = self._settled()
+        with self._lock:
+            due = self._due(self._clock())
+        if self._list_threshold is not None and len(due) >= self._list_threshold:
+            remaining = set(due)
+            # A listagem é uma otimização; os GETs cobrem o restante.
+            with contextlib.suppress(NotificaError):
+                self._sweep(remaining)
+            due = [i for i in due if i in remaining]
+
+        for notification_id, result in imap_unordered(
+            self._notifications.get, due, self._max_concurrency, return_exceptions=True
+        ):
+            with self._lock:
+                settled = self._observe(notification_id, result, self._clock())
+            self._notify(settled)
+
+        if self._on_progress is not None:
+            self._on_progress(self.counts())
+        return self._settled() - before
+
+    def _settled(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+    def run(self, timeout: float | None = None) -> dict[str, int]:
+        """Consulta até todos os ids finalizarem (ou ``timeout``); retorna as contagens."""
+        deadline = None if timeout is None else self._clock() + timeout
+        while self._tracked:
+            self.poll()
+            if not self._tracked or not self._schedule:
+                break
+            now = self._clock()
+            if deadline is not None and now >= deadline:
+                break
+            wait = self._schedule[0][0] - now
+            if deadline is not None:
+                wait = min(wait, deadline - now)
+            if wait > 0:
+                self._sleep(wait)
+        return self.counts()
@@ -0,0 +1,272 @@
+"""Transporte HTTP compartilhado entre vários clientes (ex: multi-tenant).
+
+Cada ``Notifica(api_key)`` cria, por padrão, o próprio ``httpx.Client`` —
+e com ele um pool de conexões e um contexto TLS. Plataformas que enviam em
+nome de milhares de organizações acabam com milhares de sockets ociosos
+para o mesmo host. ``SharedTransport`` mantém um único pool, emprestado a
+todos os clientes que o recebem; autenticação, timeouts e retries continuam
+por cliente. ``limits`` vale para o pool inteiro e
+``max_connections_per_client`` limita quantas conexões cada cliente ocupa.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import warnings
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, cast
+
+import httpx
+
+# Mantém ociosas tantas conexões quanto o pool permite: com o default do
+# httpx (20), de 21 threads em diante cada requisição abria (e fechava) uma
+# conexão nova — um handshake TLS completo por envio.
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=5.0)
+
+
+def _pool_timeout(request: httpx.Request) -> float | None:
+    timeout: dict[str, float | None] = request.extensions.get("timeout", {})
+    return timeout.get("pool")
+
+
+def _once(release: Callable[[], None]) -> Callable[[], None]:
+    done = False
+
+    def wrapper() -> None:
+        nonlocal done
+        if not done:
+            done = True
+            release()
+
+    return wrapper
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Devolve a vaga do cliente quando a resposta é fechada."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _ReleasingAsyncStream(httpx.AsyncByteStream):
+    """Versão assíncrona de ``_ReleasingStream``."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _BorrowedTransport(httpx.BaseTransport):
+    """Repassa requisições ao pool compartilhado; ``close`` do cliente não o fecha.
+
+    Com ``max_connections``, cada requisição ocupa uma vaga do cliente até
+    a resposta ser fechada (inclusive respostas em streaming).
+    """
+
+    def __init__(self, owner: SharedTransport, max_connections: int | None = None) -> None:
+        self._owner = owner
+        self._slots = threading.BoundedSemaphore(max_connections) if max_connections is not None else None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        slots = self._slots
+        if slots is None:
+            return self._owner._sync_pool().handle_request(request)
+        timeout = _pool_timeout(request)
+        if not slots.acquire(timeout=timeout):
+            raise httpx.PoolTimeout("limite de conexões do cliente atingido", request=request)
+        release = _once(slots.release)
+        try:
+            response = self._owner._sync_pool().handle_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _ReleasingStream(cast(httpx.SyncByteStream, response.stream), release)
+        return response
+
+    def close(self) -> None:
+        pass  # o pool pertence ao SharedTransport
+
+
+class _BorrowedAsyncTransport(httpx.AsyncBaseTransport):
+    """Versão assíncrona de ``_BorrowedTransport``."""
+
+    def __init__(self, owner: SharedTransport, max_connections: int | None = None) -> None:
+        self._owner = owner
+        self._slots = asyncio.BoundedSemaphore(max_connections) if max_connections is not None else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slots = self._slots
+        if slots is None:
+            return await self._owner._async_pool().handle_async_request(request)
+        try:
+            await asyncio.wait_for(slots.acquire(), _pool_timeout(request))
+        except TimeoutError:
+            raise httpx.PoolTimeout("limite de conexões do cliente atingido", request=request) from None
+        release = _once(slots.release)
+        try:
+            response = await self._owner._async_pool().handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _ReleasingAsyncStream(cast(httpx.AsyncByteStream, response.stream), release)
+        return response
+
+    async def aclose(self) -> None:
+        pass
+
+
+class SharedTransport:
+    """Pool de conexões compartilhado por vários ``Notifica``/``AsyncNotifica``.
+
+    Os pools (síncrono e assíncrono) são criados sob demanda, na primeira
+    requisição. Fechar um cliente não fecha o pool; feche o
+    ``SharedTransport`` quando nenhum cliente for mais usá-lo — com
+    ``AsyncNotifica``, via ``aclose()``/``async with``, já que o pool
+    assíncrono só pode ser fechado de dentro do event loop.
+
+    ``limits`` vale para o pool inteiro. Para que um tenant com muitas
+    requisições simultâneas não ocupe todas as conexões, use
+    ``max_connections_per_client``: cada cliente espera uma vaga própria
+    (até o timeout de ``pool``, levantando ``httpx.PoolTimeout``) antes de
+    pedir uma conexão ao pool.
+
+    As conexões do pool assíncrono pertencem ao event loop em que foram
+    abertas, e o pool é um só para todos os ``AsyncNotifica`` que recebem
+    este transporte. Use um ``SharedTransport`` por event loop — não o
+    compartilhe entre chamadas de ``asyncio.run`` nem entre threads com
+    loops próprios.
+
+    Com transporte compartilhado, os clientes não leem proxies e
+    certificados de variáveis de ambiente: configure-os aqui (``proxy``,
+    ``verify`` etc. são repassados a ``httpx.HTTPTransport``).
+
+    Args:
+        limits: Limites do pool compartilhado (default: ``DEFAULT_LIMITS``, 100 conexões).
+        max_connections_per_client: Máximo de requisições simultâneas de
+            cada cliente (``None``: sem limite além de ``limits``).
+        **transport_options: Repassados a ``httpx.HTTPTransport`` /
+            ``httpx.AsyncHTTPTransport`` (ex: ``verify``, ``proxy``, ``retries``).
+
+    Example:
+        ```python
+        from notifica import Notifica, SharedTransport
+
+        transport = SharedTransport(max_connections_per_client=10)
+        clients = {org.id: Notifica(org.api_key, transport=transport) for org in orgs}
+        ...
+        transport.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        *,
+        max_connections_per_client: int | None = None,
+        **transport_options: Any,
+    ) -> None:
+        if max_connections_per_client is not None and max_connections_per_client < 1:
+            raise ValueError("max_connections_per_client deve ser maior que zero")
+        self._limits = limits
+        self._max_per_client = max_connections_per_client
+        self._options = transport_options
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._sync: httpx.HTTPTransport | None = None
+        self._async: httpx.AsyncHTTPTransport | None = None
+
+    def borrow(self) -> httpx.BaseTransport:
+        """Transporte de um cliente síncrono, com o próprio limite de conexões."""
+        return _BorrowedTransport(self, self._max_per_client)
+
+    def borrow_async(self) -> httpx.AsyncBaseTransport:
+        """Transporte de um cliente assíncrono, com o próprio limite de conexões."""
+        return _BorrowedAsyncTransport(self, self._max_per_client)
+
+    def _check_fork(self) -> None:
+        # Pools herdados de um ``fork`` são abandonados sem fechar (fechar
+        # encerraria as conexões do pai); o lock pode ter sido herdado travado.
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._sync = self._async = None
+            self._pid = os.getpid()
+
+    def _sync_pool(self) -> httpx.HTTPTransport:
+        self._check_fork()
+        pool = self._sync
+        if pool is None:
+            with self._lock:
+                if self._sync is None:
+                    self._sync = httpx.HTTPTransport(limits=self._limits, **self._options)
+                pool = self._sync
+        return pool
+
+    def _async_pool(self) -> httpx.AsyncHTTPTransport:
+        self._check_fork()
+        pool = self._async
+        if pool is None:
+            with self._lock:
+                if self._async is None:
+                    self._async = httpx.AsyncHTTPTransport(limits=self._limits, **self._options)
+                pool = self._async
+        return pool
+
+    def close(self) -> None:
+        """Fecha o pool síncrono (o próximo uso cria um novo).
+
+        O pool assíncrono, se existir, não pode ser fechado aqui: ele
+        continua aberto para ``aclose()`` e um ``ResourceWarning`` é emitido.
+        """
+        with self._lock:
+            pool, self._sync = self._sync, None
+            async_open = self._async is not None
+        if pool is not None:
+            pool.close()
+        if async_open:
+            warnings.warn(
+                "SharedTransport tem um pool assíncrono aberto; use aclose() ou 'async with'",
+                ResourceWarning,
+                stacklevel=2,
+            )
+
+    async def aclose(self) -> None:
+        """Fecha os pools síncrono e assíncrono."""
+        with self._lock:
+            pool, self._async = self._async, None
+        if pool is not None:
+            await pool.aclose()
+        self.close()
+
+    def __enter__(self) -> SharedTransport:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> SharedTransport:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
@@ -0,0 +1,137 @@
+"""Disparo de workflows em lote (``Workflows.trigger_many`` e variante assíncrona)."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections import deque
+from collections.abc import AsyncIterable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .client import async_http_client
+from .errors import NotificaError
+from .previews import fingerprint
+
+if TYPE_CHECKING:
+    from . import AsyncNotifica
+    from .client import AsyncNotificaClient
+
+Recipient = str | dict[str, Any]
+
+
+def new_batch_id() -> str:
+    """Gera um ``batch_id`` aleatório para um novo lote de disparos."""
+    return uuid.uuid4().hex
+
+
+def trigger_idempotency_key(slug: str, params: dict[str, Any], batch_id: str) -> str:
+    """Idempotency key estável de um disparo (mesmo slug, destinatário, dados e lote)."""
+    return "trg_" + fingerprint([slug, params["recipient"], params.get("data"), batch_id])
+
+
+def _trigger_params(item: Recipient, data: dict[str, Any] | None) -> dict[str, Any]:
+    if isinstance(item, str):
+        params: dict[str, Any] = {"recipient": item}
+        if data is not None:
+            params["data"] = data
+        return params
+    if data is not None:
+        return {**item, "data": {**data, **(item.get("data") or {})}}
+    return dict(item)
+
+
+def iter_unique_recipients(
+    recipients: Iterable[Recipient],
+    data: dict[str, Any] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Converte destinatários em ``TriggerWorkflowParams``, sem repetições.
+
+    Aceita strings (``recipient``) ou dicts (``{"recipient", "data"}``); o
+    ``data`` comum é mesclado sob o de cada destinatário. A primeira
+    ocorrência de cada destinatário prevalece.
+    """
+    seen: set[str] = set()
+    for item in recipients:
+        params = _trigger_params(item, data)
+        if params["recipient"] in seen:
+            continue
+        seen.add(params["recipient"])
+        yield params
+
+
+def trigger_result(
+    params: dict[str, Any],
+    batch_id: str,
+    run: dict[str, Any] | None = None,
+    error: Exception | None = None,
+) -> dict[str, Any]:
+    """Monta o ``TriggerResult`` de um destinatário (``run`` em caso de sucesso, ou ``error``)."""
+    return {
+        "recipient": params["recipient"],
+        "run_id": None if run is None else run.get("id"),
+        "run": run,
+        "error": error,
+        "batch_id": batch_id,
+    }
+
+
+async def trigger_many_async(
+    client: AsyncNotifica | AsyncNotificaClient,
+    slug: str,
+    recipients: Iterable[Recipient] | AsyncIterable[Recipient],
+    data: dict[str, Any] | None = None,
+    *,
+    batch_id: str | None = None,
+    max_concurrency: int = 8,
+    options: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """Equivalente assíncrono de ``Workflows.trigger_many``.
+
+    Example:
+        ```python
+        from notifica.triggers import trigger_many_async
+
+        async with AsyncNotifica("nk_live_...") as client:
+            results = await trigger_many_async(client, "welcome-flow", recipients)
+        ```
+    """
+    http = async_http_client(client)
+    path = f"/workflows/{slug}/trigger"
+    batch = batch_id or new_batch_id()
+
+    async def trigger(params: dict[str, Any]) -> dict[str, Any]:
+        key = trigger_idempotency_key(slug, params, batch)
+        try:
+            response = await http.post(
+                path, json=params, options={**(options or {}), "idempotency_key": key}
+            )
+        except NotificaError as exc:
+            return trigger_result(params, batch, error=exc)
+        return trigger_result(params, batch, run=response["data"])
+
+    results: list[dict[str, Any]] = []
+    pending: deque[asyncio.Task[dict[str, Any]]] = deque()
+    seen: set[str] = set()
+
+    async def submit(item: Recipient) -> None:
+        params = _trigger_params(item, data)
+        if params["recipient"] in seen:
+            return
+        seen.add(params["recipient"])
+        pending.append(asyncio.ensure_future(trigger(params)))
+        if len(pending) >= max(1, max_concurrency):
+            results.append(await pending.popleft())
+
+    try:
+        if isinstance(recipients, AsyncIterable):
+            async for item in recipients:
+                await submit(item)
+        else:
+            for item in recipients:
+                await submit(item)
+        while pending:
+            results.append(await pending.popleft())
+    finally:
+        for task in pending:
+            task.cancel()
+    return results
@@ -40,6 +40,60 @@ class SingleResponse(TypedDict):
     data: Any
 
 
+class ExportProgress(TypedDict):
+    """Progresso de uma exportação (``export`` dos recursos paginados)."""
+
+    rows: int
+    pages: int
+    bytes_written: int
+    bytes_uncompressed: int
+
+
+class ExportResult(ExportProgress):
+    """Resultado de uma exportação para NDJSON/CSV."""
+
+    format: Literal["ndjson", "csv"]
+    compressed: bool
+    path: str | None
+    elapsed: float
+
+
+RetryReason = Literal["timeout", "network", "rate_limited", "server_error"]
+
+
+class RequestEvent(TypedDict):
+    """Início de uma tentativa de requisição (``RequestHook.on_request``)."""
+
+    method: str
+    path: str
+    attempt: int
+    idempotency_key: str | None
+
+
+class ResponseEvent(RequestEvent):
+    """Resposta HTTP recebida em uma tentativa, de sucesso ou erro."""
+
+    status: int
+    elapsed: float
+    bytes: int
+    request_id: str | None
+
+
+class RetryEvent(RequestEvent):
+    """Tentativa que falhou e será repetida após ``delay`` segundos."""
+
+    reason: RetryReason
+    delay: float
+    error: Exception
+
+
+class ErrorEvent(RequestEvent):
+    """Falha definitiva de uma requisição, após todas as tentativas."""
+
+    error: Exception
+    elapsed: float
+
+
 # ═══════════════════════════════════════════════════
 # Notificações
 # ═══════════════════════════════════════════════════
@@ -68,6 +122,17 @@ class Notification(TypedDict):
     updated_at: NotRequired[str]
 
 
+class SkippedNotification(TypedDict):
+    """Envio pulado localmente pelo SDK (sem requisição à API)."""
+
+    skipped: Literal[True]
+    reason: str
+    channel: Channel
+    to: str
+    subscriber_id: NotRequired[str]
+    category: NotRequired[str]
+
+
 class MessageAttempt(TypedDict):
     """Tentativa de entrega de mensagem."""
 
@@ -283,6 +348,16 @@ class WorkflowRun(TypedDict):
     updated_at: str
 
 
+class TriggerResult(TypedDict):
+    """Resultado de um destinatário em ``Workflows.trigger_many``."""
+
+    recipient: str
+    run_id: str | None
+    run: WorkflowRun | None
+    error: Exception | None
+    batch_id: str
+
+
 class ListWorkflowsParams(TypedDict):
     """Parâmetros para listar workflows."""
 
@@ -513,6 +588,25 @@ class DomainAlert(TypedDict):
     created_at: str
 
 
+class FailingDomain(TypedDict):
+    """Domínio com problemas em ``Domains.check_health``."""
+
+    domain_id: str
+    domain: str | None
+    health: DomainHealth | None
+    issues: list[str]
+
+
+class DomainHealthReport(TypedDict):
+    """Resumo de ``Domains.check_health``."""
+
+    checked: int
+    healthy: int
+    failing: list[FailingDomain]
+    alerts: list[DomainAlert]
+    errors: dict[str, Exception]
+
+
 class ListDomainsParams(TypedDict):
     """Parâmetros para listar domínios."""
 
@@ -1339,3 +1433,45 @@ class MarkInboxReadAllResult(TypedDict):
 
     success: bool
     marked_count: int
+
+
+# ═══════════════════════════════════════════════════
+# Audit Logs
+# ═══════════════════════════════════════════════════
+
+
+AuditActorType = Literal["user", "api_key", "system"]
+
+
+class AuditActor(TypedDict):
+    """Ator de uma ação auditada."""
+
+    type: AuditActorType
+    id: NotRequired[str]
+    name: NotRequired[str]
+
+
+class AuditLog(TypedDict):
+    """Entrada de audit log."""
+
+    id: str
+    action: str
+    resource_type: str
+    resource_id: NotRequired[str]
+    actor: AuditActor
+    metadata: NotRequired[dict[str, Any]]
+    created_at: str
+
+
+class ListAuditLogsParams(TypedDict):
+    """Parâmetros para listar audit logs."""
+
+    action: NotRequired[str]
+    resource_type: NotRequired[str]
+    resource_id: NotRequired[str]
+    actor_type: NotRequired[AuditActorType]
+    actor_id: NotRequired[str]
+    start_date: NotRequired[str]
+    end_date: NotRequired[str]
+    limit: NotRequired[int]
+    cursor: NotRequired[str]
@@ -0,0 +1,144 @@
+"""Testes do cache de analytics."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pytest_httpx import HTTPXMock
+
+from notifica import AnalyticsCache, Notifica
+from notifica.columnar import format_timestamp
+
+from conftest import BASE_URL, TEST_API_KEY, single_envelope
+
+SERIES_URL = f"{BASE_URL}/analytics/timeseries"
+HOUR = 3600
+NOW = 1704067200 + 30 * 86400 + 1800  # 30 dias após 2024-01-01, às 00:30
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def hourly(start: int, hours: int, sent: int = 1) -> list[dict[str, Any]]:
+    return [
+        {"timestamp": format_timestamp(start + h * HOUR), "sent": sent, "delivered": sent, "failed": 0}
+        for h in range(hours)
+    ]
+
+
+def make_client(cache: AnalyticsCache) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, analytics_cache=cache)
+
+
+class TestAnalyticsCache:
+    def test_incremental_timeseries_refresh(self, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock(NOW)
+        current_bucket = NOW // HOUR * HOUR
+        first = current_bucket - 720 * HOUR + HOUR
+        httpx_mock.add_response(
+            url=f"{SERIES_URL}?period=30d&granularity=hour", json=single_envelope(hourly(first, 720))
+        )
+        cache = AnalyticsCache(ttls={"30d": 60}, clock=clock)
+        client = make_client(cache)
+        params = {"period": "30d", "granularity": "hour"}
+
+        assert len(client.analytics.timeseries(params)) == 720
+        clock.now += 30
+        assert len(client.analytics.timeseries(params)) == 720  # dentro do TTL
+        assert len(httpx_mock.get_requests()) == 1
+
+        # Após o TTL, no mesmo bucket: só o bucket aberto, via period=1h.
+        clock.now += 60
+        httpx_mock.add_response(
+            url=f"{SERIES_URL}?period=1h&granularity=hour",
+            json=single_envelope(hourly(current_bucket, 1, sent=5)),
+        )
+        points = client.analytics.timeseries(params)
+        assert len(httpx_mock.get_requests()) == 2
+        assert [p["sent"] for p in points[-2:]] == [1, 5]
+
+        # Virou a hora: o período de 24h cobre o bucket anterior e o novo.
+        clock.now += 3600
+        httpx_mock.add_response(
+            url=f"{SERIES_URL}?period=24h&granularity=hour",
+            json=single_envelope(hourly(current_bucket - 22 * HOUR, 24, sent=7)),
+        )
+        points = client.analytics.timeseries(params)
+        assert len(httpx_mock.get_requests()) == 3
+        # A janela de 30d desliza: o bucket mais antigo saiu.
+        assert len(points) == 720
+        assert points[0]["timestamp"] == format_timestamp(first + HOUR)
+        assert points[-1]["timestamp"] == format_timestamp(current_bucket + HOUR)
+        assert cache.stats() == {
+            "hits": 1, "refreshes": 2, "full_fetches": 1, "points_fetched": 745, "series": 1, "responses": 0,
+        }
+
+    def test_hour_boundary_keeps_closed_buckets(self, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock(NOW)
+        current_bucket = NOW // HOUR * HOUR
+        httpx_mock.add_response(
+            url=f"{SERIES_URL}?period=24h&granularity=hour",
+            json=single_envelope(hourly(current_bucket - 23 * HOUR, 24, sent=3)),
+        )
+        cache = AnalyticsCache(ttls={"24h": 60}, clock=clock)
+        client = make_client(cache)
+        params = {"period": "24h", "granularity": "hour"}
+        client.analytics.timeseries(params)
+
+        # Virou a hora: a página de 24h traz valores diferentes (ex: janela
+        # parcial) para buckets já fechados, que não podem ser sobrescritos.
+        clock.now += HOUR
+        httpx_mock.add_response(
+            url=f"{SERIES_URL}?period=24h&granularity=hour",
+            json=single_envelope(hourly(current_bucket - 22 * HOUR, 24, sent=9)),
+        )
+        points = client.analytics.timeseries(params)
+        assert len(httpx_mock.get_requests()) == 2
+        assert len(points) == 24
+        assert [p["sent"] for p in points[:-2]] == [3] * 22
+        # O bucket aberto na última consulta e o novo vêm da atualização.
+        assert [p["sent"] for p in points[-2:]] == [9, 9]
+
+    def test_shorter_period_reuses_series(self, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock(NOW)
+        current_bucket = NOW // HOUR * HOUR
+        httpx_mock.add_response(
+            url=f"{SERIES_URL}?period=30d&granularity=hour",
+            json=single_envelope(hourly(current_bucket - 719 * HOUR, 720)),
+        )
+        cache = AnalyticsCache(clock=clock)
+        client = make_client(cache)
+        client.analytics.timeseries({"period": "30d", "granularity": "hour"})
+        assert len(client.analytics.timeseries({"period": "24h", "granularity": "hour"})) == 24
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_point_copies_are_isolated(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{SERIES_URL}?period=1h&granularity=hour",
+            json=single_envelope(hourly(NOW // HOUR * HOUR, 1)),
+        )
+        client = make_client(AnalyticsCache(clock=FakeClock(NOW)))
+        client.analytics.timeseries({"period": "1h", "granularity": "hour"})[0]["sent"] = 99
+        assert client.analytics.timeseries({"period": "1h", "granularity": "hour"})[0]["sent"] == 1
+
+    def test_other_endpoints_use_period_ttl(self, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock(NOW)
+        overview = {"total_sent": 10, "total_delivered": 9, "total_failed": 1, "delivery_rate": 0.9, "period": "7d"}
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/analytics/overview?period=7d", json=single_envelope(overview), is_reusable=True
+        )
+        cache = AnalyticsCache(ttls={"7d": 100}, clock=clock)
+        client = make_client(cache)
+        assert client.analytics.overview({"period": "7d"}) == overview
+        clock.now += 99
+        client.analytics.overview({"period": "7d"})
+        assert len(httpx_mock.get_requests()) == 1
+        clock.now += 2
+        client.analytics.overview({"period": "7d"})
+        assert len(httpx_mock.get_requests()) == 2
+        assert cache.stats()["hits"] == 1
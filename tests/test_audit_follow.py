@@ -0,0 +1,73 @@
+"""Testes do modo follow dos audit logs."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pytest_httpx import HTTPXMock
+
+from notifica import AsyncNotifica, Notifica
+from notifica.audit_follow import _Follower, follow_async
+
+from conftest import BASE_URL, TEST_API_KEY, paginated_envelope
+
+AUDIT_URL = f"{BASE_URL}/internal/audit-logs"
+
+
+def log(id: str, created_at: str) -> dict[str, Any]:
+    return {"id": id, "action": "api_key.created", "resource_type": "api_key", "created_at": created_at}
+
+
+def since(created_at: str) -> str:
+    return f"{AUDIT_URL}?start_date={created_at.replace(':', '%3A')}"
+
+
+class TestAuditFollow:
+    def test_yields_only_new_entries_with_adaptive_interval(
+        self, client: Notifica, httpx_mock: HTTPXMock
+    ) -> None:
+        t1, t2, t3 = "2024-01-01T00:00:01Z", "2024-01-01T00:00:02Z", "2024-01-01T00:00:03Z"
+        # Bootstrap: começa da entrada mais recente existente.
+        httpx_mock.add_response(url=f"{AUDIT_URL}?limit=1", json=paginated_envelope([log("a1", t1)]))
+        # Poll 1: a fronteira inclusiva devolve a1 de novo; a2 e a3 são novas.
+        httpx_mock.add_response(
+            url=since(t1), json=paginated_envelope([log("a3", t3), log("a2", t2), log("a1", t1)])
+        )
+        # Polls 2 e 3: ociosos.
+        httpx_mock.add_response(url=since(t3), json=paginated_envelope([log("a3", t3)]), is_reusable=True)
+
+        sleeps: list[float] = []
+        logs = list(client.audit.follow(
+            min_interval=1, max_interval=3, max_polls=4, sleep=sleeps.append
+        ))
+        assert [entry["id"] for entry in logs] == ["a2", "a3"]
+        assert sleeps == [1, 2, 3]
+
+    def test_since_includes_backlog_in_order(
+        self, client: Notifica, httpx_mock: HTTPXMock
+    ) -> None:
+        t0 = "2024-01-01T00:00:00Z"
+        httpx_mock.add_response(
+            url=f"{since(t0)}&resource_type=api_key",
+            json=paginated_envelope([log("a2", t0), log("a1", t0)]),
+        )
+        logs = list(client.audit.follow(
+            {"resource_type": "api_key"}, since=t0, max_polls=1, sleep=lambda _: None
+        ))
+        assert [entry["id"] for entry in logs] == ["a1", "a2"]
+
+    def test_seen_ids_are_bounded(self) -> None:
+        state = _Follower(None, "t0", 1.0, 60.0, 2.0, max_seen=2)
+        assert len(state.accept([log(f"a{i}", f"t{i}") for i in range(5)])) == 5
+        assert list(state._seen) == ["a3", "a4"]
+        assert state.accept([log("a4", "t4")]) == []
+
+
+class TestAuditFollowAsync:
+    async def test_follow_async(self, httpx_mock: HTTPXMock) -> None:
+        t1, t2 = "2024-01-01T00:00:01Z", "2024-01-01T00:00:02Z"
+        httpx_mock.add_response(url=f"{AUDIT_URL}?limit=1", json=paginated_envelope([log("a1", t1)]))
+        httpx_mock.add_response(url=since(t1), json=paginated_envelope([log("a2", t2), log("a1", t1)]))
+        async with AsyncNotifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0) as client:
+            logs = [entry async for entry in follow_async(client, max_polls=1)]
+        assert [entry["id"] for entry in logs] == ["a2"]
@@ -0,0 +1,111 @@
+"""Testes do espelho local de audit logs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica
+from notifica.audit_store import AuditLogStore
+
+from conftest import BASE_URL, paginated_envelope
+
+AUDIT_URL = f"{BASE_URL}/internal/audit-logs"
+
+
+def log(id: str, created_at: str, action: str = "api_key.created", actor_id: str = "usr_1") -> dict[str, Any]:
+    return {
+        "id": id,
+        "action": action,
+        "resource_type": action.split(".")[0],
+        "resource_id": f"res_{id}",
+        "actor": {"type": "user", "id": actor_id, "name": "Ana"},
+        "created_at": created_at,
+    }
+
+
+class TestAuditLogStore:
+    def test_incremental_sync(self, client: Notifica, httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+        httpx_mock.add_response(
+            url=AUDIT_URL,
+            json=paginated_envelope([log("a2", "2024-01-02T00:00:00Z")], cursor="c1", has_more=True),
+        )
+        httpx_mock.add_response(
+            url=f"{AUDIT_URL}?cursor=c1", json=paginated_envelope([log("a1", "2024-01-01T00:00:00Z")])
+        )
+        httpx_mock.add_response(
+            url=f"{AUDIT_URL}?start_date=2024-01-02T00%3A00%3A00Z",
+            json=paginated_envelope([
+                log("a3", "2024-01-03T00:00:00Z", "webhook.deleted"),
+                log("a2", "2024-01-02T00:00:00Z"),
+            ]),
+        )
+        path = str(tmp_path / "audit.db")
+        with client.audit.mirror(path) as store:
+            assert store.sync() == {"fetched": 2, "inserted": 2, "high_water_mark": "2024-01-02T00:00:00Z"}
+            assert store.sync() == {"fetched": 2, "inserted": 1, "high_water_mark": "2024-01-03T00:00:00Z"}
+            assert len(store) == 3
+
+        # Persistido: outra instância continua da marca d'água.
+        with client.audit.mirror(path) as store:
+            assert store.high_water_mark == "2024-01-03T00:00:00Z"
+            assert store.get("a1")["actor"]["name"] == "Ana"  # type: ignore[index]
+
+    def test_filtered_sync_keeps_its_own_watermark(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{AUDIT_URL}?action=api_key.revoked",
+            json=paginated_envelope([log("a2", "2024-01-02T00:00:00Z", "api_key.revoked")]),
+        )
+        httpx_mock.add_response(
+            url=AUDIT_URL,
+            json=paginated_envelope([
+                log("a2", "2024-01-02T00:00:00Z", "api_key.revoked"),
+                log("a1", "2024-01-01T00:00:00Z"),
+            ]),
+        )
+        store = client.audit.mirror()
+        filtered = store.sync({"action": "api_key.revoked"})
+        assert filtered == {"fetched": 1, "inserted": 1, "high_water_mark": "2024-01-02T00:00:00Z"}
+        assert store.high_water_mark is None
+
+        # A sincronização sem filtros não herda a marca d'água filtrada.
+        assert store.sync() == {"fetched": 2, "inserted": 1, "high_water_mark": "2024-01-02T00:00:00Z"}
+        assert len(store) == 2
+
+    def test_query(self, client: Notifica) -> None:
+        store = client.audit.mirror()
+        store.add([
+            log("a1", "2024-01-01T00:00:00Z", "api_key.created", "usr_1"),
+            log("a2", "2024-01-02T00:00:00Z", "api_key.revoked", "usr_2"),
+            log("a3", "2024-01-03T00:00:00Z", "webhook.deleted", "usr_1"),
+            log("a4", "2024-01-04T00:00:00Z", "api_key.revoked", "usr_1"),
+        ])
+        assert [e["id"] for e in store.query(action="api_key.revoked")] == ["a4", "a2"]
+        assert [e["id"] for e in store.query(resource_type="api_key", actor_id="usr_1")] == ["a4", "a1"]
+        assert [e["id"] for e in store.query(
+            start_date="2024-01-02T00:00:00Z", end_date="2024-01-03T00:00:00Z", order="asc"
+        )] == ["a2", "a3"]
+        assert [e["id"] for e in store.query(limit=1)] == ["a4"]
+        assert store.count(actor_type="user") == 4
+        with pytest.raises(TypeError):
+            store.query(unknown="x")
+
+    def test_queries_use_indexes(self, client: Notifica) -> None:
+        store = client.audit.mirror()
+        for column, index in [
+            ("action", "audit_logs_action"),
+            ("resource_type", "audit_logs_resource"),
+            ("actor_type", "audit_logs_actor"),
+            ("created_at", "audit_logs_created_at"),
+        ]:
+            plan = store._db.execute(
+                f"EXPLAIN QUERY PLAN SELECT payload FROM audit_logs WHERE {column} = ?", ("x",)
+            ).fetchall()
+            assert index in str(plan)
+
+    def test_requires_audit_resource_to_sync(self) -> None:
+        with pytest.raises(RuntimeError):
+            AuditLogStore().sync()
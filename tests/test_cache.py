@@ -0,0 +1,95 @@
+"""Testes do cache LRU com TTL."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+from notifica.cache import TTLCache, default_shards, free_threaded
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_get_and_set(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(max_size=2)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_expires_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9
+        assert "a" in cache
+        clock.now = 11
+        assert "a" not in cache
+        assert cache.get("a") is None
+
+    def test_per_entry_ttl(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(ttl=10, clock=clock)
+        cache.set("a", 1, ttl=100)
+        clock.now = 50
+        assert cache.get("a") == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "b" not in cache
+        assert "a" in cache
+        assert cache.evictions == 1
+
+    def test_invalidate_and_clear(self) -> None:
+        cache: TTLCache[str, int] = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_rejects_invalid_size(self) -> None:
+        with pytest.raises(ValueError):
+            TTLCache(max_size=0)
+
+    def test_small_caches_are_not_sharded(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(max_size=100, shards=8)
+        assert len(cache._shards) == 1
+
+    def test_sharded_cache_bounds_size_and_sums_stats(self) -> None:
+        cache: TTLCache[int, int] = TTLCache(max_size=1024, shards=4)
+        assert len(cache._shards) == 4
+        for i in range(4096):
+            cache.set(i, i)
+        assert len(cache) <= 1024
+        assert cache.evictions == 4096 - len(cache)
+        assert cache.get(4095) == 4095
+        assert cache.get(-1) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        cache.invalidate(4095)
+        assert 4095 not in cache
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_shards_follow_the_gil(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+        assert not free_threaded() and default_shards() == 1
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        monkeypatch.setattr(os, "cpu_count", lambda: 64)
+        assert free_threaded() and default_shards() == 16
+        assert len(TTLCache(max_size=10_000)._shards) == 16
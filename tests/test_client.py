@@ -6,7 +6,7 @@ import pytest
 from pytest_httpx import HTTPXMock
 
 from notifica import Notifica, AsyncNotifica
-from notifica.client import NotificaClient
+from notifica.client import AsyncNotificaClient, NotificaClient, _iter_json_array_body
 from notifica.errors import (
     ApiError,
     NotificaError,
@@ -131,6 +131,58 @@ class TestPostRequests:
         assert body == {"channel": "email", "to": "a@b.com"}
 
 
+# ── Streaming bodies ─────────────────────────────────
+
+
+class TestStreamingBody:
+    def test_encodes_items_incrementally(self) -> None:
+        import json
+        chunks = list(_iter_json_array_body("items", iter([{"a": 1}, {"b": "ç"}]), {"mode": "x"}))
+        assert json.loads(b"".join(chunks)) == {"mode": "x", "items": [{"a": 1}, {"b": "ç"}]}
+
+    def test_encodes_empty_iterable(self) -> None:
+        assert b"".join(_iter_json_array_body("items", iter([]))) == b'{"items":[]}'
+
+    def test_splits_into_bounded_chunks(self) -> None:
+        items = ({"id": i, "pad": "x" * 100} for i in range(100))
+        chunks = list(_iter_json_array_body("items", items, chunk_size=1024))
+        assert len(chunks) > 1
+        assert all(len(c) < 1024 + 200 for c in chunks)
+
+    def test_post_stream_sends_chunked(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        import json
+        httpx_mock.add_response(json=single_envelope({"ok": True}))
+        client._client.post_stream("/bulk", "items", ({"id": i} for i in range(3)))
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["transfer-encoding"] == "chunked"
+        assert "idempotency-key" in request.headers
+        assert json.loads(request.read()) == {"items": [{"id": 0}, {"id": 1}, {"id": 2}]}
+
+    def test_post_stream_is_not_retried(
+        self, retrying_client: Notifica, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(status_code=503, json=error_body("unavailable", "err"))
+        with pytest.raises(ApiError):
+            retrying_client._client.post_stream("/bulk", "items", iter([{"id": 1}]))
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_async_post_stream(self, httpx_mock: HTTPXMock) -> None:
+        import json
+
+        async def items():  # type: ignore[no-untyped-def]
+            for i in range(2):
+                yield {"id": i}
+
+        httpx_mock.add_response(json=single_envelope({"imported": 2}))
+        async with AsyncNotificaClient(TEST_API_KEY, base_url=BASE_URL, max_retries=0) as c:
+            result = await c.post_stream("/subscribers/import", "subscribers", items())
+        assert result["data"]["imported"] == 2
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert json.loads(request.read()) == {"subscribers": [{"id": 0}, {"id": 1}]}
+
+
 # ── PUT requests ─────────────────────────────────────
 
 
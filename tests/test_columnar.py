@@ -0,0 +1,115 @@
+"""Testes dos resultados de analytics em colunas."""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica
+from notifica.columnar import ColumnarTable, TimeseriesTable, format_timestamp, parse_timestamps
+
+from conftest import BASE_URL, single_envelope
+
+BACKENDS = [
+    "array",
+    pytest.param("numpy", marks=pytest.mark.skipif(
+        importlib.util.find_spec("numpy") is None, reason="NumPy não instalado"
+    )),
+]
+
+HOUR = 3600
+T0 = 1704067200  # 2024-01-01T00:00:00Z
+
+
+def point(hour: int, sent: int, delivered: int, failed: int = 0) -> dict[str, Any]:
+    return {"timestamp": format_timestamp(T0 + hour * HOUR), "sent": sent, "delivered": delivered, "failed": failed}
+
+
+def as_list(column: Any) -> list[Any]:
+    return list(column.tolist())
+
+
+def test_parse_timestamps() -> None:
+    assert list(parse_timestamps([
+        "2024-01-01T00:00:00Z",
+        "2024-01-01T01:30:15",
+        "2024-01-01T02:00:00.000Z",
+        "2024-01-01T00:00:00-03:00",
+    ])) == [T0, T0 + 5415, T0 + 2 * HOUR, T0 + 3 * HOUR]
+    assert format_timestamp(T0) == "2024-01-01T00:00:00Z"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestTimeseriesTable:
+    def test_round_trip_and_sorting(self, backend: str) -> None:
+        points = [point(1, 5, 4), point(0, 10, 9, 1)]
+        series = TimeseriesTable.from_points(points, backend=backend)  # type: ignore[arg-type]
+        assert series.backend == backend
+        assert as_list(series["sent"]) == [10, 5]
+        assert series.to_points() == [points[1], points[0]]
+        assert series.totals() == {"sent": 15, "delivered": 13, "failed": 1}
+
+    def test_resample_with_offset(self, backend: str) -> None:
+        series = TimeseriesTable.from_points(
+            [point(h, 1, 1) for h in range(48)], backend=backend  # type: ignore[arg-type]
+        )
+        daily = series.resample("day")
+        assert as_list(daily["sent"]) == [24, 24]
+        # Dias de Brasília (UTC-3): 00h–02h UTC ainda pertencem a 31/12.
+        local = series.resample("day", utc_offset=-3 * HOUR)
+        assert as_list(local["sent"]) == [3, 24, 21]
+        assert as_list(local["timestamp"])[1] == T0 + 3 * HOUR
+
+    def test_fill_gaps(self, backend: str) -> None:
+        series = TimeseriesTable.from_points([point(0, 2, 2), point(3, 4, 3)], backend=backend)  # type: ignore[arg-type]
+        filled = series.fill_gaps("hour", end=T0 + 5 * HOUR)
+        assert as_list(filled["sent"]) == [2, 0, 0, 4, 0, 0]
+        assert as_list(filled["timestamp"]) == [T0 + h * HOUR for h in range(6)]
+        assert len(series.fill_gaps("hour", start="2024-01-01T01:00:00Z")) == 3
+
+    def test_rate(self, backend: str) -> None:
+        series = TimeseriesTable.from_points([point(0, 4, 3), point(1, 0, 0)], backend=backend)  # type: ignore[arg-type]
+        assert as_list(series.rate()) == [0.75, 0.0]
+
+    def test_merge_sums_overlap(self, backend: str) -> None:
+        first = TimeseriesTable.from_points([point(0, 1, 1), point(1, 2, 2)], backend=backend)  # type: ignore[arg-type]
+        second = TimeseriesTable.from_points([point(1, 3, 3), point(2, 4, 4)], backend=backend)  # type: ignore[arg-type]
+        merged = first.merge(second)
+        assert as_list(merged["sent"]) == [1, 5, 4]
+        assert as_list(merged["timestamp"]) == [T0, T0 + HOUR, T0 + 2 * HOUR]
+
+    def test_empty(self, backend: str) -> None:
+        series = TimeseriesTable.from_points([], backend=backend)  # type: ignore[arg-type]
+        assert len(series.resample("day")) == 0
+        assert len(series.fill_gaps("hour")) == 0
+        assert series.to_points() == []
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_columnar_table(backend: str) -> None:
+    table = ColumnarTable.from_records([
+        {"channel": "email", "sent": 10, "delivered": 9, "failed": 1, "delivery_rate": 0.9},
+        {"channel": "sms", "sent": 20, "delivered": 20, "failed": 0, "delivery_rate": 1},
+    ], backend=backend)  # type: ignore[arg-type]
+    assert table["channel"] == ["email", "sms"]
+    assert as_list(table["delivery_rate"]) == [0.9, 1.0]
+    assert [r["channel"] for r in table.sort_by("sent", descending=True).to_records()] == ["sms", "email"]
+    assert as_list(table.rate("failed", "sent")) == [0.1, 0.0]
+
+
+def test_analytics_timeseries_columns(client: Notifica, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/analytics/timeseries?period=7d&granularity=hour",
+        json=single_envelope([point(0, 3, 2), point(2, 1, 1)]),
+    )
+    series = client.analytics.timeseries_columns({"period": "7d", "granularity": "hour"}, backend="array")
+    assert isinstance(series, TimeseriesTable)
+    assert list(series.fill_gaps()["sent"]) == [3, 0, 1]
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        ColumnarTable({}, backend="pandas")  # type: ignore[arg-type]
@@ -0,0 +1,118 @@
+"""Testes do índice local de opt-outs SMS."""
+
+from __future__ import annotations
+
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica, SmsConsentIndex
+from notifica.consents import BloomFilter, ScalableBloomFilter
+
+from conftest import BASE_URL, TEST_API_KEY, error_body, paginated_envelope, single_envelope
+
+
+def make_client(index: SmsConsentIndex) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, sms_consent_index=index)
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        for n in range(1000):
+            bloom.add(5511900000000 + n)
+        assert all(5511900000000 + n in bloom for n in range(1000))
+
+    def test_false_positive_rate_is_bounded(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        for n in range(1000):
+            bloom.add(n)
+        false_positives = sum(1 for n in range(10_000, 20_000) if n in bloom)
+        assert false_positives < 300
+
+
+    def test_scalable_filter_grows_without_false_negatives(self) -> None:
+        bloom = ScalableBloomFilter(100, 0.01)
+        for n in range(1000):
+            bloom.add(5511900000000 + n)
+        assert all(5511900000000 + n in bloom for n in range(1000))
+        assert bloom.size_in_bytes > BloomFilter(100, 0.01).size_in_bytes * 4
+
+
+class TestSmsConsentIndex:
+    def test_load_from_iterable(self) -> None:
+        index = SmsConsentIndex(max_age=None)
+        stats = index.load([
+            {"phone": "+55 (11) 99999-9999", "status": "opted_out"},
+            {"phone": "+5511988888888", "status": "opted_in"},
+        ])
+        assert stats == {"size": 1, "added": 1, "removed": 0}
+        assert index.is_blocked("+5511999999999")
+        assert not index.is_blocked("+5511988888888")
+
+    def test_apply_updates_index(self) -> None:
+        index = SmsConsentIndex(max_age=None)
+        index.load([])
+        index.apply({"phone": "+5511999999999", "status": "opted_out"})
+        assert "+5511999999999" in index
+        index.apply({"phone": "+5511999999999", "status": "opted_in"})
+        assert "+5511999999999" not in index
+
+    def test_loads_from_api_on_first_use(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            json=paginated_envelope([{"phone": "+5511999999999", "status": "opted_out"}])
+        )
+        index = SmsConsentIndex()
+        make_client(index)
+        assert index.is_blocked("+5511999999999")
+        assert index.is_blocked("+5511999999999")
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.url.params["status"] == "opted_out"
+
+    def test_bloom_mode_confirms_positives(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            json=paginated_envelope([{"phone": "+5511999999999", "status": "opted_out"}])
+        )
+        httpx_mock.add_response(
+            json=single_envelope({"phone": "+5511999999999", "status": "opted_out"})
+        )
+        index = SmsConsentIndex(bloom_threshold=1)
+        make_client(index)
+        assert index.is_blocked("+5511999999999")
+        assert index.is_blocked("+5511999999999")
+        assert index.stats()["mode"] == "bloom"
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_bloom_mode_load_reports_real_counts(self) -> None:
+        def opt_outs(numbers: range) -> list[dict[str, str]]:
+            return [{"phone": f"+55119{n:08d}", "status": "opted_out"} for n in numbers]
+
+        index = SmsConsentIndex(max_age=None, bloom_threshold=10)
+        # Repetições (após o limiar, já no filtro) não contam duas vezes.
+        assert index.load(opt_outs(range(100)) + opt_outs(range(50))) == {"size": 100, "added": 100, "removed": 0}
+        assert index.stats()["mode"] == "bloom" and len(index) == 100
+        assert index._blocked == set()
+        assert index.load(opt_outs(range(20, 130))) == {"size": 110, "added": 30, "removed": 20}
+
+    def test_bloom_mode_confirm_404_is_not_blocked(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=404, json=error_body("not_found", "Not found"))
+        index = SmsConsentIndex(max_age=None, bloom_threshold=1)
+        make_client(index)
+        index.load([{"phone": "+5511999999999", "status": "opted_out"}])
+        assert not index.is_blocked("+5511999999999")
+
+    def test_revoke_writes_through(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=204)
+        index = SmsConsentIndex(max_age=None)
+        client = make_client(index)
+        index.load([])
+        client.sms.consents.revoke("+5511999999999")
+        assert index.is_blocked("+5511999999999")
+
+    def test_send_skips_blocked_sms(self, httpx_mock: HTTPXMock) -> None:
+        index = SmsConsentIndex(max_age=None)
+        client = make_client(index)
+        index.load([{"phone": "+5511999999999", "status": "opted_out"}])
+        result = client.notifications.send({"channel": "sms", "to": "+5511999999999"})
+        assert result["skipped"] is True
+        assert result["reason"] == "sms_opted_out"
+        assert httpx_mock.get_requests() == []
@@ -0,0 +1,161 @@
+"""Testes da confirmação de entrega por webhooks."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+import json
+import re
+import threading
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import DeliveryIndex, Notifica, PreferenceCache, WebhookReceiver
+from notifica.errors import TimeoutError, WebhookSignatureError
+
+from conftest import BASE_URL, TEST_API_KEY, single_envelope
+
+SECRET = "whsec_test"
+GET_URL = re.compile(rf"{re.escape(BASE_URL)}/notifications/ntf_\w+")
+
+
+def sign(payload: bytes) -> str:
+    return hmac.new(SECRET.encode(), payload, hashlib.sha256).hexdigest()
+
+
+def event(name: str, notification_id: str = "ntf_1") -> bytes:
+    return json.dumps({"event": name, "data": {"id": notification_id, "channel": "email"}}).encode()
+
+
+@pytest.fixture
+def deliveries() -> DeliveryIndex:
+    return DeliveryIndex(webhook_timeout=5.0, poll_interval=0.01, max_poll_interval=0.02)
+
+
+@pytest.fixture
+def receiver(deliveries: DeliveryIndex) -> WebhookReceiver:
+    return WebhookReceiver(deliveries, signing_secret=SECRET)
+
+
+@pytest.fixture
+def tracked_client(deliveries: DeliveryIndex) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, delivery_index=deliveries)
+
+
+def queue_send(httpx_mock: HTTPXMock, notification_id: str = "ntf_1") -> None:
+    httpx_mock.add_response(
+        method="POST", json=single_envelope({"id": notification_id, "status": "pending"})
+    )
+
+
+class TestDeliveryFuture:
+    def test_resolved_by_webhook(
+        self, tracked_client: Notifica, receiver: WebhookReceiver, httpx_mock: HTTPXMock
+    ) -> None:
+        queue_send(httpx_mock)
+        future = tracked_client.notifications.send_tracked({"channel": "email", "to": "a@b.c"})
+        assert not future.done()
+        payload = event("notification.delivered")
+        threading.Timer(0.05, receiver.handle, (payload, sign(payload))).start()
+        result = future.result(timeout=2)
+        assert result["status"] == "delivered"
+        assert len(httpx_mock.get_requests()) == 1  # sem polling
+
+    def test_webhook_before_registration(
+        self, tracked_client: Notifica, receiver: WebhookReceiver, deliveries: DeliveryIndex,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        payload = event("notification.bounced")
+        receiver.handle(payload, "sha256=" + sign(payload))
+        queue_send(httpx_mock)
+        future = tracked_client.notifications.send_tracked({"channel": "email", "to": "a@b.c"})
+        assert future.done()
+        assert future.result()["status"] == "bounced"
+        assert deliveries.stats()["pending"] == 0
+
+    def test_falls_back_to_polling(self, httpx_mock: HTTPXMock) -> None:
+        deliveries = DeliveryIndex(webhook_timeout=0.01, poll_interval=0.01, max_poll_interval=0.02)
+        client = Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, delivery_index=deliveries)
+        queue_send(httpx_mock)
+        httpx_mock.add_response(url=GET_URL, json=single_envelope({"id": "ntf_1", "status": "processing"}))
+        httpx_mock.add_response(url=GET_URL, json=single_envelope({"id": "ntf_1", "status": "failed"}))
+        future = client.notifications.send_tracked({"channel": "email", "to": "a@b.c"})
+        assert future.result(timeout=2)["status"] == "failed"
+        assert len(deliveries) == 0
+
+    def test_timeout(self, tracked_client: Notifica, httpx_mock: HTTPXMock) -> None:
+        queue_send(httpx_mock)
+        httpx_mock.add_response(
+            url=GET_URL, json=single_envelope({"id": "ntf_1", "status": "pending"}), is_reusable=True
+        )
+        future = tracked_client.notifications.send_tracked({"channel": "email", "to": "a@b.c"})
+        with pytest.raises(TimeoutError):
+            future.result(timeout=0.05)
+
+    async def test_awaitable(
+        self, tracked_client: Notifica, receiver: WebhookReceiver, httpx_mock: HTTPXMock
+    ) -> None:
+        queue_send(httpx_mock)
+        future = tracked_client.notifications.send_tracked({"channel": "email", "to": "a@b.c"})
+        payload = event("notification.delivered")
+        threading.Timer(0.05, receiver.handle, (payload, sign(payload))).start()
+        result = await future
+        assert result["status"] == "delivered"
+
+    def test_skipped_send_resolves_immediately(self) -> None:
+        preferences = PreferenceCache()
+        preferences.store("sub_1", {"preferences": [{"category": "marketing", "channel": "sms", "enabled": False}]})
+        client = Notifica(TEST_API_KEY, base_url=BASE_URL, preference_cache=preferences)
+        future = client.notifications.send_tracked(
+            {"channel": "sms", "to": "+5511999999999"},
+            options={"subscriber_id": "sub_1"},
+        )
+        assert future.result(timeout=0)["skipped"] is True
+
+
+class TestDeliveryIndex:
+    def test_bounded_memory_and_expiry(self, tracked_client: Notifica, httpx_mock: HTTPXMock) -> None:
+        now = [0.0]
+        deliveries = DeliveryIndex(max_pending=2, ttl=10.0, clock=lambda: now[0])
+        client = Notifica(TEST_API_KEY, base_url=BASE_URL, delivery_index=deliveries)
+        for i in range(3):
+            queue_send(httpx_mock, f"ntf_{i}")
+            client.notifications.send_tracked({"channel": "email", "to": "a@b.c"})
+        assert deliveries.stats()["evicted"] == 1
+        now[0] = 11.0
+        assert deliveries.stats()["pending"] == 0
+        assert deliveries.stats()["expired"] == 2
+
+
+class TestWebhookReceiver:
+    def test_rejects_invalid_signature(self, receiver: WebhookReceiver) -> None:
+        with pytest.raises(WebhookSignatureError):
+            receiver.handle(event("notification.delivered"), "deadbeef")
+        with pytest.raises(WebhookSignatureError):
+            receiver.handle(event("notification.delivered"))
+
+    def test_ignores_non_terminal_events(self, receiver: WebhookReceiver, deliveries: DeliveryIndex) -> None:
+        payload = event("notification.sent")
+        receiver.handle(payload, sign(payload))
+        assert deliveries.stats()["early"] == 0
+
+    def test_wsgi_app(self, receiver: WebhookReceiver) -> None:
+        statuses: list[str] = []
+
+        def call(payload: bytes, signature: str) -> Any:
+            environ = {
+                "REQUEST_METHOD": "POST",
+                "CONTENT_LENGTH": str(len(payload)),
+                "wsgi.input": io.BytesIO(payload),
+                "HTTP_X_NOTIFICA_SIGNATURE": signature,
+            }
+            return receiver.wsgi_app(environ, lambda status, headers: statuses.append(status))
+
+        payload = event("notification.delivered")
+        assert call(payload, sign(payload)) == [b'{"received":true}']
+        call(payload, "bad")
+        call(b"not json", sign(b"not json"))
+        assert statuses == ["200 OK", "401 Unauthorized", "400 Bad Request"]
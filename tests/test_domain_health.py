@@ -0,0 +1,93 @@
+"""Testes da verificação de saúde de domínios em lote."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pytest_httpx import HTTPXMock
+
+from notifica import AsyncNotifica, DomainHealthCache, Notifica
+from notifica.domain_health import check_health_async, domain_ref
+
+from conftest import BASE_URL, TEST_API_KEY, error_body, paginated_envelope, single_envelope
+
+
+def health(domain_id: str, ok: bool = True, **extra: Any) -> dict[str, Any]:
+    return {
+        "domain_id": domain_id,
+        "dns_valid": True,
+        "dkim_valid": ok,
+        "spf_valid": True,
+        "last_checked_at": "2024-01-01T00:00:00Z",
+        **extra,
+    }
+
+
+def mock_domains(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/domains",
+        json=paginated_envelope([
+            {"id": "dom_ok", "domain": "ok.com.br"},
+            {"id": "dom_dkim", "domain": "dkim.com.br"},
+            {"id": "dom_err", "domain": "err.com.br"},
+        ]),
+    )
+    httpx_mock.add_response(url=f"{BASE_URL}/domains/dom_ok/health", json=single_envelope(health("dom_ok")))
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/domains/dom_dkim/health",
+        json=single_envelope(health("dom_dkim", ok=False, issues=["DKIM selector s1 ausente"])),
+    )
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/domains/dom_err/health", status_code=404, json=error_body("not_found", "Domínio não encontrado")
+    )
+
+
+def assert_report(report: dict[str, Any]) -> None:
+    assert report["checked"] == 3
+    assert report["healthy"] == 1
+    assert [f["domain"] for f in report["failing"]] == ["dkim.com.br", "err.com.br"]
+    assert report["failing"][0]["issues"] == ["Registros DKIM ausentes ou inválidos", "DKIM selector s1 ausente"]
+    assert [a["alert_type"] for a in report["alerts"]] == ["dkim_invalid", "issue:0", "health_check_failed"]
+    assert list(report["errors"]) == ["dom_err"]
+
+
+class TestDomainHealth:
+    def test_check_health_all_domains_with_cache(self, httpx_mock: HTTPXMock) -> None:
+        mock_domains(httpx_mock)
+        cache = DomainHealthCache(ttl=60)
+        client = Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, domain_health_cache=cache)
+        assert_report(client.domains.check_health(max_concurrency=4))
+
+        # Segunda verificação: só o domínio que falhou é consultado de novo.
+        httpx_mock.add_response(url=f"{BASE_URL}/domains/dom_err/health", json=single_envelope(health("dom_err")))
+        report = client.domains.check_health(["dom_ok", "dom_dkim", "dom_err"])
+        assert report["healthy"] == 2
+        assert cache.stats()["hits"] == 2
+        assert len(httpx_mock.get_requests()) == 5
+
+    def test_cache_returns_copies(self) -> None:
+        cache = DomainHealthCache()
+        stored = health("dom_1")
+        cache.set("dom_1", stored)
+        stored["dkim_valid"] = False
+        cached = cache.get("dom_1")
+        assert cached is not None and cached["dkim_valid"] is True
+        cached["spf_valid"] = False
+        assert cache.get("dom_1") == health("dom_1")
+
+    def test_domain_ref(self) -> None:
+        assert domain_ref("dom_1") == ("dom_1", None)
+        assert domain_ref({"id": "dom_1", "domain": "a.com.br"}) == ("dom_1", "a.com.br")
+
+    def test_delete_invalidates_cache(self, httpx_mock: HTTPXMock) -> None:
+        cache = DomainHealthCache()
+        cache.set("dom_1", health("dom_1"))
+        httpx_mock.add_response(url=f"{BASE_URL}/domains/dom_1", method="DELETE", status_code=204)
+        client = Notifica(TEST_API_KEY, base_url=BASE_URL, domain_health_cache=cache)
+        client.domains.delete("dom_1")
+        assert cache.get("dom_1") is None
+
+    async def test_check_health_async(self, httpx_mock: HTTPXMock) -> None:
+        mock_domains(httpx_mock)
+        async with AsyncNotifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0) as client:
+            assert_report(await check_health_async(client, max_concurrency=2))
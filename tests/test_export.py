@@ -0,0 +1,95 @@
+"""Testes da exportação de listagens para NDJSON/CSV."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica, NotificaError
+
+from conftest import BASE_URL, error_body, paginated_envelope
+
+NOTIFICATIONS_URL = f"{BASE_URL}/notifications"
+
+
+def notification(i: int) -> dict[str, Any]:
+    return {"id": f"n{i}", "channel": "email", "status": "delivered", "metadata": {"ordem": i}}
+
+
+def mock_pages(httpx_mock: HTTPXMock, url: str, pages: int, per_page: int = 2) -> None:
+    for page in range(pages):
+        items = [notification(page * per_page + i) for i in range(per_page)]
+        has_more = page < pages - 1
+        query = f"?status=delivered&cursor=c{page}" if page else "?status=delivered"
+        httpx_mock.add_response(
+            url=f"{url}{query}",
+            json=paginated_envelope(items, cursor=f"c{page + 1}" if has_more else None, has_more=has_more),
+        )
+
+
+class TestExport:
+    @pytest.mark.parametrize("read_ahead", [True, False])
+    def test_ndjson_gzip_to_path(
+        self, client: Notifica, httpx_mock: HTTPXMock, tmp_path: Path, read_ahead: bool
+    ) -> None:
+        mock_pages(httpx_mock, NOTIFICATIONS_URL, pages=3)
+        progress: list[dict[str, Any]] = []
+        target = tmp_path / "notifications.ndjson.gz"
+        result = client.notifications.export(
+            target, {"status": "delivered"}, read_ahead=read_ahead, on_progress=progress.append
+        )
+        lines = gzip.decompress(target.read_bytes()).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [f"n{i}" for i in range(6)]
+        assert result["rows"] == 6 and result["pages"] == 3 and result["compressed"] is True
+        assert result["bytes_written"] == target.stat().st_size
+        assert result["path"] == str(target)
+        assert [p["rows"] for p in progress] == [2, 4, 6]
+        assert not (tmp_path / "notifications.ndjson.gz.part").exists()
+
+    def test_csv_to_file_object(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        mock_pages(httpx_mock, NOTIFICATIONS_URL, pages=2)
+        buffer = io.BytesIO()
+        result = client.notifications.export(
+            buffer, {"status": "delivered"}, format="csv", fields=["id", "metadata", "missing"]
+        )
+        rows = list(csv.reader(io.StringIO(buffer.getvalue().decode())))
+        assert rows[0] == ["id", "metadata", "missing"]
+        assert rows[1] == ["n0", '{"ordem":0}', ""]
+        assert len(rows) == 5
+        assert result["path"] is None and result["bytes_written"] == len(buffer.getvalue())
+
+    def test_failure_leaves_no_partial_file(
+        self, client: Notifica, httpx_mock: HTTPXMock, tmp_path: Path
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{NOTIFICATIONS_URL}?status=delivered",
+            json=paginated_envelope([notification(0)], cursor="c1", has_more=True),
+        )
+        httpx_mock.add_response(
+            url=f"{NOTIFICATIONS_URL}?status=delivered&cursor=c1",
+            status_code=400,
+            json=error_body("bad_request", "cursor inválido"),
+        )
+        target = tmp_path / "out.ndjson"
+        with pytest.raises(NotificaError):
+            client.notifications.export(target, {"status": "delivered"})
+        assert list(tmp_path.iterdir()) == []
+
+    def test_other_resources(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        for path in ("/subscribers", "/billing/invoices", "/channels/sms/consents"):
+            httpx_mock.add_response(url=f"{BASE_URL}{path}", json=paginated_envelope([{"id": "x"}]))
+        for resource in (client.subscribers, client.billing.invoices, client.sms.consents):
+            buffer = io.BytesIO()
+            assert resource.export(buffer)["rows"] == 1
+            assert buffer.getvalue() == b'{"id":"x"}\n'
+
+    def test_unknown_format(self, client: Notifica) -> None:
+        with pytest.raises(ValueError):
+            client.notifications.export(io.BytesIO(), format="xml")  # type: ignore[arg-type]
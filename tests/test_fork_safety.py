@@ -0,0 +1,85 @@
+"""Testes de segurança após fork e serialização (pickle) dos clientes."""
+
+from __future__ import annotations
+
+import os
+import pickle
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import AsyncNotifica, Notifica, PreferenceCache, SharedTransport
+
+from conftest import BASE_URL, TEST_API_KEY, single_envelope
+
+CHANNELS_URL = f"{BASE_URL}/channels"
+
+
+class TestForkSafety:
+    def test_client_is_rebuilt_after_pid_change(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        inherited = client._client._client
+        client.channels.list()
+        assert client._client._client is inherited
+
+        client._client._pid = -1  # simula o processo filho
+        client.channels.list()
+        assert client._client._client is not inherited
+        assert client._client._pid == os.getpid()
+        assert not inherited.is_closed  # herdado é abandonado, não fechado
+        assert httpx_mock.get_requests()[-1].headers["Authorization"] == f"Bearer {TEST_API_KEY}"
+
+    def test_shared_transport_drops_inherited_pools(self) -> None:
+        transport = SharedTransport()
+        inherited = transport._sync_pool()
+        transport._pid = -1
+        assert transport._sync_pool() is not inherited
+        transport.close()
+        inherited.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requer os.fork")
+    def test_real_fork(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        client.channels.list()
+        parent_http = client._client._client
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - roda no filho
+            try:
+                client.channels.list()
+                ok = client._client._client is not parent_http
+            except BaseException:
+                ok = False
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert client._client._client is parent_http
+
+
+class TestPickle:
+    def test_notifica_round_trip_keeps_configuration(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]))
+        original = Notifica(
+            TEST_API_KEY,
+            base_url=BASE_URL,
+            timeout=4.0,
+            max_retries=1,
+            normalize_phones=True,
+            preference_cache=PreferenceCache(),
+            transport=SharedTransport(),
+        )
+        restored = pickle.loads(pickle.dumps(original))
+        http = restored._client
+        assert (http._api_key, http._base_url, http._timeout, http._max_retries) == (TEST_API_KEY, BASE_URL, 4.0, 1)
+        assert restored.notifications._normalize_phones is True
+        assert restored.notifications._preferences is None  # estado local não é levado
+        assert http._transport is None
+        restored.channels.list()
+
+    def test_http_client_round_trip_drops_transport(self) -> None:
+        original = Notifica(TEST_API_KEY, base_url=BASE_URL, timeout=4.0, transport=SharedTransport())
+        restored = pickle.loads(pickle.dumps(original._client))
+        assert (restored._base_url, restored._timeout, restored._transport) == (BASE_URL, 4.0, None)
+
+    def test_async_client_round_trip(self) -> None:
+        restored = pickle.loads(pickle.dumps(AsyncNotifica(TEST_API_KEY, base_url=BASE_URL, timeout=9.0)))
+        assert restored._client._timeout == 9.0 and restored._client._base_url == BASE_URL
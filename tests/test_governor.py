@@ -0,0 +1,126 @@
+"""Testes do limitador de envios por quota."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica, QuotaExceededError, QuotaGovernor
+
+from conftest import BASE_URL, TEST_API_KEY, error_body, single_envelope
+
+USAGE_URL = f"{BASE_URL}/billing/usage"
+
+
+def usage(notifications: int, emails: int = 0, quota: int = 1000, email_quota: int | None = None) -> dict[str, Any]:
+    return single_envelope({
+        "period_start": "2024-01-01",
+        "period_end": "2024-01-31",
+        "current": {"notifications": notifications, "emails": emails, "sms": 0, "whatsapp": 0},
+        "quotas": {
+            "notifications_per_month": quota,
+            "emails_per_month": email_quota,
+            "sms_per_month": None,
+            "whatsapp_per_month": None,
+        },
+        "percentages": {},
+    })
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_client(governor: QuotaGovernor) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, quota_governor=governor)
+
+
+class TestQuotaGovernor:
+    def test_below_soft_limit_is_not_throttled(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=USAGE_URL, json=usage(100))
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/notifications", method="POST", json=single_envelope({"id": "n1"}), is_reusable=True
+        )
+        clock = FakeClock()
+        governor = QuotaGovernor(rate=1, clock=clock, sleep=clock.sleep)
+        client = make_client(governor)
+        for _ in range(3):
+            client.notifications.send({"channel": "email", "to": "a@b.com"}, options={"priority": "bulk"})
+        assert governor.waited == 0
+        # Envios locais somam ao uso até a próxima leitura.
+        assert governor.usage() == ("notifications", 0.103)
+
+    def test_bulk_is_slowed_then_blocked(self) -> None:
+        clock = FakeClock()
+        governor = QuotaGovernor(rate=10, soft_limit=0.8, clock=clock, sleep=clock.sleep)
+        governor._usage = usage(90_000, quota=100_000)["data"]
+        assert governor.factor(priority="bulk") == pytest.approx(0.5)
+        # Taxa efetiva de ~5/s: o primeiro envio passa, o seguinte espera ~0,2s.
+        assert governor.acquire(None, "bulk") == 0
+        assert governor.acquire(None, "bulk") == pytest.approx(0.2, rel=1e-3)
+        assert clock.now == pytest.approx(0.2, rel=1e-3)
+
+        governor._usage = usage(1000)["data"]
+        governor._local.clear()
+        with pytest.raises(QuotaExceededError) as exc_info:
+            governor.acquire(None, "bulk")
+        assert exc_info.value.metric == "notifications"
+        assert governor.stats()["blocked"] == 1
+
+    def test_transactional_keeps_a_floor(self) -> None:
+        governor = QuotaGovernor(transactional_floor=0.1)
+        governor._usage = usage(2000)["data"]
+        assert governor.factor(priority="transactional") == 0.1
+        assert governor.factor(priority="bulk") == 0.0
+        governor._usage = usage(900)["data"]
+        assert governor.factor(priority="transactional") == 1.0
+
+    def test_channel_quota_is_more_restrictive(self) -> None:
+        governor = QuotaGovernor()
+        governor._usage = usage(100, emails=95, email_quota=100)["data"]
+        assert governor.usage("email") == ("emails", 0.95)
+        assert governor.usage("sms") == ("notifications", 0.1)
+
+    def test_events_and_max_wait(self) -> None:
+        events: list[dict[str, Any]] = []
+        clock = FakeClock()
+        governor = QuotaGovernor(rate=1, max_wait=0.5, on_event=events.append, clock=clock, sleep=clock.sleep)
+        governor._usage = usage(950)["data"]
+        governor.acquire(None, "bulk")
+        with pytest.raises(QuotaExceededError):
+            governor.acquire(None, "bulk")
+        governor._usage = usage(100)["data"]
+        governor.acquire(None, "bulk")
+        assert [e["type"] for e in events] == ["throttle_engaged", "throttle_released"]
+
+    def test_refresh_is_periodic_and_survives_errors(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=USAGE_URL, json=usage(100))
+        httpx_mock.add_response(url=USAGE_URL, status_code=500, json=error_body("internal", "boom"))
+        events: list[dict[str, Any]] = []
+        clock = FakeClock()
+        governor = QuotaGovernor(refresh_interval=60, on_event=events.append, clock=clock)
+        make_client(governor)
+        governor.acquire()
+        governor.acquire()
+        assert len(httpx_mock.get_requests()) == 1
+        clock.now = 61
+        governor.acquire()
+        assert [e["type"] for e in events] == ["refresh_failed"]
+        assert governor.usage()[1] == pytest.approx(0.103)
+
+    def test_trigger_many_reports_blocked_recipients(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=USAGE_URL, json=usage(1000))
+        governor = QuotaGovernor()
+        client = make_client(governor)
+        results = client.workflows.trigger_many("welcome", ["+5511999999999"])
+        assert isinstance(results[0]["error"], QuotaExceededError)
+        assert not [r for r in httpx_mock.get_requests() if "/workflows/" in str(r.url)]
@@ -0,0 +1,193 @@
+"""Testes dos hooks do ciclo de vida das requisições."""
+
+from __future__ import annotations
+
+import logging
+import pickle
+from typing import Any
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import (
+    ApiError,
+    AsyncNotifica,
+    LoggingHook,
+    MetricsHook,
+    Notifica,
+    RateLimitError,
+    RequestHook,
+    ValidationError,
+)
+from notifica.hooks import HookDispatcher
+
+from conftest import BASE_URL, TEST_API_KEY, error_body, single_envelope
+
+
+class Recorder(RequestHook):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def on_request(self, event: Any) -> None:
+        self.events.append(("request", event))
+
+    def on_response(self, event: Any) -> None:
+        self.events.append(("response", event))
+
+    def on_retry(self, event: Any) -> None:
+        self.events.append(("retry", event))
+
+    def on_error(self, event: Any) -> None:
+        self.events.append(("error", event))
+
+    def kinds(self) -> list[str]:
+        return [kind for kind, _ in self.events]
+
+
+def make_client(*hooks: Any, max_retries: int = 0) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=max_retries, hooks=list(hooks))
+
+
+class TestEvents:
+    def test_success(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/notifications",
+            json=single_envelope({"id": "n"}),
+            status_code=202,
+            headers={"x-request-id": "req_1"},
+        )
+        recorder = Recorder()
+        make_client(recorder).notifications.send({"channel": "email", "to": "a@x.com", "template": "t"})
+
+        assert recorder.kinds() == ["request", "response"]
+        request, response = (event for _, event in recorder.events)
+        assert request["method"] == "POST" and request["path"] == "/notifications"
+        assert request["attempt"] == 1 and request["idempotency_key"]
+        assert response["status"] == 202 and response["request_id"] == "req_1"
+        assert response["bytes"] > 0 and response["elapsed"] >= 0
+        assert response["idempotency_key"] == request["idempotency_key"]
+
+    def test_retry_then_success(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=429, json=error_body("rate_limited", "calma"), headers={"Retry-After": "0"})
+        httpx_mock.add_response(json=single_envelope({"id": "sub"}))
+        recorder = Recorder()
+        make_client(recorder, max_retries=2).subscribers.get("sub")
+
+        assert recorder.kinds() == ["request", "response", "retry", "request", "response"]
+        retry = recorder.events[2][1]
+        assert retry["attempt"] == 1 and retry["reason"] == "rate_limited" and retry["delay"] == 0
+        assert isinstance(retry["error"], RateLimitError)
+        assert [event["attempt"] for kind, event in recorder.events if kind == "request"] == [1, 2]
+
+    def test_network_retry_reason(self, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("notifica.client._retry_delay", lambda attempt, error: 0.0)
+        httpx_mock.add_exception(httpx.ConnectError("recusada"))
+        httpx_mock.add_exception(httpx.ReadTimeout("lento"))
+        httpx_mock.add_response(json=single_envelope({"id": "sub"}))
+        recorder = Recorder()
+        make_client(recorder, max_retries=2).subscribers.get("sub")
+
+        reasons = [event["reason"] for kind, event in recorder.events if kind == "retry"]
+        assert reasons == ["network", "timeout"]
+
+    def test_error(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=422, json=error_body("validation_failed", "inválido"))
+        recorder = Recorder()
+        with pytest.raises(ValidationError):
+            make_client(recorder).subscribers.get("sub")
+
+        assert recorder.kinds() == ["request", "response", "error"]
+        error = recorder.events[2][1]
+        assert isinstance(error["error"], ValidationError)
+        assert error["attempt"] == 1 and error["elapsed"] >= 0
+
+    def test_failing_hook_does_not_break_request(self, httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture) -> None:
+        class Broken(RequestHook):
+            def on_response(self, event: Any) -> None:
+                raise RuntimeError("bug no hook")
+
+        httpx_mock.add_response(json=single_envelope({"id": "sub"}))
+        recorder = Recorder()
+        assert make_client(Broken(), recorder).subscribers.get("sub")["id"] == "sub"
+        assert recorder.kinds() == ["request", "response"]
+        assert "bug no hook" in caplog.text
+
+    async def test_async_client(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=503, json=error_body("unavailable", "fora"))
+        recorder = Recorder()
+        client = AsyncNotifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, hooks=[recorder])
+        with pytest.raises(ApiError):
+            await client._client.get("/subscribers/sub")
+        assert recorder.kinds() == ["request", "response", "error"]
+        assert recorder.events[1][1]["status"] == 503
+        await client.close()
+
+
+class TestDispatcher:
+    def test_no_hooks_means_no_dispatcher(self) -> None:
+        assert HookDispatcher.build(None) is None
+        assert HookDispatcher.build([]) is None
+        assert make_client()._client._hooks is None
+
+    def test_only_overridden_methods_are_called(self) -> None:
+        class OnlyErrors(RequestHook):
+            def on_error(self, event: Any) -> None: ...
+
+        class DuckTyped:
+            def on_response(self, event: Any) -> None: ...
+
+        dispatcher = HookDispatcher([OnlyErrors(), DuckTyped()])
+        assert (len(dispatcher.on_request), len(dispatcher.on_response)) == (0, 1)
+        assert (len(dispatcher.on_retry), len(dispatcher.on_error)) == (0, 1)
+
+    def test_picklable_hooks_survive_pickle(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=f"{BASE_URL}/subscribers/sub", json=single_envelope({"id": "sub"}))
+        restored = pickle.loads(pickle.dumps(make_client(Recorder())))
+        (recorder,) = restored._client._hooks.hooks
+        restored.subscribers.get("sub")
+        assert recorder.kinds() == ["request", "response"]
+
+    def test_unpicklable_hooks_are_dropped_with_warning(self) -> None:
+        client = make_client(Recorder(), MetricsHook())
+        with pytest.warns(RuntimeWarning, match="MetricsHook"):
+            restored = pickle.loads(pickle.dumps(client))
+        assert [type(hook) for hook in restored._client._hooks.hooks] == [Recorder]
+
+    def test_async_client_keeps_hooks(self) -> None:
+        client = AsyncNotifica(TEST_API_KEY, base_url=BASE_URL, hooks=[Recorder()])
+        restored = pickle.loads(pickle.dumps(client._client))
+        assert [type(hook) for hook in restored._hooks.hooks] == [Recorder]
+        assert pickle.loads(pickle.dumps(client))._client._hooks is not None
+
+
+class TestBuiltinHooks:
+    def test_metrics(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=502, json=error_body("bad_gateway", "ops"))
+        httpx_mock.add_response(status_code=502, json=error_body("bad_gateway", "ops"))
+        metrics = MetricsHook(latency_buckets=[0.5, 1.0])
+        client = make_client(metrics, max_retries=1)
+        client._client._backoff = lambda delay: None  # type: ignore[method-assign]
+        with pytest.raises(ApiError):
+            client.subscribers.get("sub")
+
+        snapshot = metrics.snapshot()
+        assert snapshot["requests"] == 2
+        assert snapshot["responses"] == {"502": 2}
+        assert snapshot["retries"] == {"server_error": 1}
+        assert snapshot["errors"] == {"ApiError": 1}
+        assert snapshot["bytes_received"] > 0
+        assert snapshot["latency"]["count"] == 2
+        assert snapshot["latency"]["buckets"]["+Inf"] == 2
+        metrics.reset()
+        assert metrics.snapshot()["requests"] == 0
+
+    def test_logging(self, httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture) -> None:
+        httpx_mock.add_response(status_code=404, json=error_body("not_found", "sumiu"))
+        caplog.set_level(logging.DEBUG, logger="notifica")
+        with pytest.raises(ApiError):
+            make_client(LoggingHook()).subscribers.get("sub")
+
+        messages = [(record.levelno, record.getMessage()) for record in caplog.records]
+        assert messages[0][0] == logging.DEBUG and "GET /subscribers/sub -> 404" in messages[0][1]
+        assert messages[1][0] == logging.WARNING and "falhou após 1 tentativa(s)" in messages[1][1]
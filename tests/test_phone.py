@@ -0,0 +1,75 @@
+"""Testes da normalização de telefones."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica, is_valid_phone, normalize_phone
+from notifica.errors import ValidationError
+
+from conftest import BASE_URL, TEST_API_KEY, single_envelope
+
+
+class TestNormalizePhone:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("+5511999999999", "+5511999999999"),
+            ("+55 (11) 99999-9999", "+5511999999999"),
+            ("(11) 99999-9999", "+5511999999999"),
+            ("11 99999 9999", "+5511999999999"),
+            ("011 99999-9999", "+5511999999999"),
+            ("0 15 11 99999-9999", "+5511999999999"),
+            ("5511999999999", "+5511999999999"),
+            ("005511999999999", "+5511999999999"),
+            ("(11) 9999-8888", "+5511999998888"),
+            ("(21) 3333-4444", "+552133334444"),
+            ("+1 415 555 2671", "+14155552671"),
+        ],
+    )
+    def test_normalizes(self, raw: str, expected: str) -> None:
+        assert normalize_phone(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw",
+        ["", "abc", "+55 (20) 99999-9999", "(11) 89999-9999", "(11) 1999-9999", "123", "+0123456789"],
+    )
+    def test_rejects_invalid(self, raw: str) -> None:
+        assert not is_valid_phone(raw)
+        with pytest.raises(ValidationError) as exc_info:
+            normalize_phone(raw, field="to")
+        assert "to" in exc_info.value.details
+
+
+class TestPhoneNormalizationIntegration:
+    @pytest.fixture
+    def client(self) -> Notifica:
+        return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, normalize_phones=True)
+
+    def test_send_normalizes_to(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope({"id": "n1"}))
+        params = {"channel": "whatsapp", "to": "(11) 99999-9999"}
+        client.notifications.send(params)
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert json.loads(request.content)["to"] == "+5511999999999"
+        assert params["to"] == "(11) 99999-9999"
+
+    def test_send_invalid_fails_locally(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        with pytest.raises(ValidationError):
+            client.notifications.send({"channel": "sms", "to": "123"})
+        assert httpx_mock.get_requests() == []
+
+    def test_email_is_untouched(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope({"id": "n1"}))
+        client.notifications.send({"channel": "email", "to": "a@b.com"})
+
+    def test_consent_phone_is_normalized(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope({"phone": "+5511999999999"}))
+        client.sms.consents.get("(11) 99999-9999")
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.url.path.endswith("/consents/+5511999999999")
@@ -0,0 +1,100 @@
+"""Testes do cache de preferências e da filtragem antes do envio."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica, PreferenceCache
+from notifica.errors import ApiError
+
+from conftest import BASE_URL, TEST_API_KEY, error_body, single_envelope
+
+PREFS = {
+    "preferences": [
+        {"category": "marketing", "channel": "email", "enabled": False},
+        {"category": "transactional", "channel": "email", "enabled": True},
+        {"category": "marketing", "channel": "sms", "enabled": False},
+    ]
+}
+
+
+@pytest.fixture
+def cache() -> PreferenceCache:
+    return PreferenceCache(max_size=10, ttl=60)
+
+
+@pytest.fixture
+def cached_client(cache: PreferenceCache) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, preference_cache=cache)
+
+
+class TestPreferenceCache:
+    def test_is_allowed_by_category(self, cache: PreferenceCache) -> None:
+        cache.store("s1", PREFS)
+        assert cache.is_allowed("s1", "email", "marketing") is False
+        assert cache.is_allowed("s1", "email", "transactional") is True
+        assert cache.is_allowed("s1", "email", "unknown") is True
+
+    def test_is_allowed_without_category(self, cache: PreferenceCache) -> None:
+        cache.store("s1", PREFS)
+        assert cache.is_allowed("s1", "email") is True
+        assert cache.is_allowed("s1", "sms") is False
+        assert cache.is_allowed("s1", "whatsapp") is True
+
+    def test_unknown_subscriber_is_allowed(self, cache: PreferenceCache) -> None:
+        assert cache.is_allowed("missing", "email", "marketing") is True
+
+
+class TestPreferenceCacheIntegration:
+    def test_get_preferences_reads_through(
+        self, cached_client: Notifica, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(json=single_envelope(PREFS))
+        first = cached_client.subscribers.get_preferences("s1")
+        second = cached_client.subscribers.get_preferences("s1")
+        assert first == second
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_update_preferences_writes_through(
+        self, cached_client: Notifica, cache: PreferenceCache, httpx_mock: HTTPXMock
+    ) -> None:
+        enabled = {"preferences": [{"category": "marketing", "channel": "email", "enabled": True}]}
+        httpx_mock.add_response(json=single_envelope(enabled))
+        cache.store("s1", PREFS)
+        cached_client.subscribers.update_preferences("s1", enabled)
+        assert cache.is_allowed("s1", "email", "marketing") is True
+
+    def test_update_failure_invalidates(
+        self, cached_client: Notifica, cache: PreferenceCache, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(status_code=500, json=error_body("internal", "err"))
+        cache.store("s1", PREFS)
+        with pytest.raises(ApiError):
+            cached_client.subscribers.update_preferences("s1", PREFS)
+        assert cache.get("s1") is None
+
+    def test_send_skips_opted_out(
+        self, cached_client: Notifica, cache: PreferenceCache, httpx_mock: HTTPXMock
+    ) -> None:
+        cache.store("s1", PREFS)
+        result = cached_client.notifications.send(
+            {"channel": "email", "to": "a@b.com", "template": "promo"},
+            options={"subscriber_id": "s1", "category": "marketing"},
+        )
+        assert result["skipped"] is True
+        assert result["reason"] == "preference_disabled"
+        assert result["category"] == "marketing"
+        assert cache.stats()["skipped"] == 1
+        assert httpx_mock.get_requests() == []
+
+    def test_send_allowed_hits_api(
+        self, cached_client: Notifica, cache: PreferenceCache, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(json=single_envelope({"id": "n1"}))
+        cache.store("s1", PREFS)
+        result = cached_client.notifications.send(
+            {"channel": "email", "to": "a@b.com"},
+            options={"subscriber_id": "s1", "category": "transactional"},
+        )
+        assert result["id"] == "n1"
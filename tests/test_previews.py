@@ -0,0 +1,97 @@
+"""Testes do cache de previews de templates."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica, PreviewCache
+from notifica.errors import ApiError
+
+from conftest import BASE_URL, TEST_API_KEY, error_body, single_envelope
+
+PREVIEW = {"rendered": {"body": "Olá João"}, "variables": ["name"]}
+
+
+@pytest.fixture
+def cache() -> PreviewCache:
+    return PreviewCache(max_size=16)
+
+
+@pytest.fixture
+def cached_client(cache: PreviewCache) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, preview_cache=cache)
+
+
+class TestPreviewCache:
+    def test_memoizes_preview(self, cached_client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope(PREVIEW))
+        first = cached_client.templates.preview("t1", {"variables": {"name": "João"}})
+        second = cached_client.templates.preview("t1", {"variables": {"name": "João"}})
+        assert first == second == PREVIEW
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_key_ignores_dict_order(self, cache: PreviewCache) -> None:
+        a = cache.template_key("t1", {"variables": {"a": 1, "b": 2}})
+        b = cache.template_key("t1", {"variables": {"b": 2, "a": 1}})
+        assert a == b
+
+    def test_cached_result_is_isolated(self, cached_client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope(PREVIEW))
+        first = cached_client.templates.preview("t1", {"variables": {}})
+        first["rendered"]["body"] = "mutated"
+        assert cached_client.templates.preview("t1", {"variables": {}}) == PREVIEW
+
+    def test_update_invalidates(self, cached_client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope(PREVIEW))
+        httpx_mock.add_response(json=single_envelope({"id": "t1", "updated_at": "2024-02-01"}))
+        httpx_mock.add_response(json=single_envelope({"rendered": {"body": "Oi João"}}))
+        cached_client.templates.preview("t1", {"variables": {"name": "João"}})
+        cached_client.templates.update("t1", {"content": "Oi {{name}}"})
+        result = cached_client.templates.preview("t1", {"variables": {"name": "João"}})
+        assert result["rendered"]["body"] == "Oi João"
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_new_version_changes_key(self, cache: PreviewCache) -> None:
+        before = cache.template_key("t1", {})
+        cache.note_version({"id": "t1", "updated_at": "2024-02-01"})
+        assert cache.template_key("t1", {}) != before
+
+    def test_memoizes_preview_content(self, cached_client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope(PREVIEW))
+        params = {"content": "Olá {{name}}", "channel": "email", "variables": {"name": "João"}}
+        cached_client.templates.preview_content(params)
+        cached_client.templates.preview_content(dict(params))
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestPreviewMany:
+    def test_renders_in_order_and_dedupes(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        def echo(request: httpx.Request) -> httpx.Response:
+            name = json.loads(request.content)["variables"]["name"]
+            return httpx.Response(200, json=single_envelope({"rendered": {"body": f"Olá {name}"}}))
+
+        httpx_mock.add_callback(echo, is_reusable=True)
+        names = ["Ana", "Bruno", "Ana", "Carla"]
+        results = client.templates.preview_many(
+            "t1", [{"variables": {"name": n}} for n in names], max_concurrency=3
+        )
+        assert [r["rendered"]["body"] for r in results] == [f"Olá {n}" for n in names]
+        assert results[0] is not results[2]
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_return_exceptions(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=404, json=error_body("not_found", "Not found"))
+        results = client.templates.preview_many("t1", [{"variables": {}}], return_exceptions=True)
+        assert isinstance(results[0], ApiError)
+
+    def test_raises_by_default(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(status_code=404, json=error_body("not_found", "Not found"))
+        with pytest.raises(ApiError):
+            client.templates.preview_many("t1", [{"variables": {}}])
+
+    def test_empty(self, client: Notifica) -> None:
+        assert client.templates.preview_content_many([]) == []
@@ -0,0 +1,147 @@
+"""Testes do registro de clientes por tenant."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import AsyncClientRegistry, ClientRegistry, PreferenceCache, SharedTransport
+
+from conftest import BASE_URL, single_envelope
+
+KEYS = {f"org_{i}": f"nk_{i}" for i in range(10)}
+
+
+def is_closed(client: Any) -> bool:
+    return bool(client._client._client.is_closed)
+
+
+class TestClientRegistry:
+    def test_lazy_creation_and_shared_options(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=f"{BASE_URL}/channels", json=single_envelope([]))
+        calls: list[str] = []
+
+        def api_key_for(tenant: str) -> str:
+            calls.append(tenant)
+            return KEYS[tenant]
+
+        with ClientRegistry(api_key_for, base_url=BASE_URL, timeout=3.0) as registry:
+            assert len(registry) == 0
+            client = registry.get("org_1")
+            assert registry.get("org_1") is client
+            assert calls == ["org_1"]
+            assert client._client._timeout == 3.0
+            client.channels.list()
+            assert httpx_mock.get_requests()[0].headers["Authorization"] == "Bearer nk_1"
+            assert registry.stats() == {
+                "size": 1, "max_size": 256, "hits": 1, "misses": 1, "evictions": 0, "leased": 0,
+            }
+        assert is_closed(client)
+
+    def test_lru_eviction_closes_clients(self) -> None:
+        registry = ClientRegistry(KEYS.__getitem__, max_size=2)
+        first = registry.get("org_1")
+        registry.get("org_2")
+        registry.get("org_1")  # org_2 passa a ser o menos usado
+        registry.get("org_3")
+        assert "org_2" not in registry and "org_1" in registry
+        assert registry.stats()["evictions"] == 1
+        assert not is_closed(first)
+        registry.close()
+        assert is_closed(first)
+
+    def test_leased_client_is_closed_on_release(self) -> None:
+        registry = ClientRegistry(KEYS.__getitem__, max_size=1)
+        with registry.lease("org_1") as client:
+            registry.get("org_2")
+            assert "org_1" not in registry
+            assert not is_closed(client)
+            assert registry.stats()["leased"] == 1
+        assert is_closed(client)
+        assert registry.stats()["leased"] == 0
+        registry.close()
+
+    def test_discard_and_per_tenant_options(self) -> None:
+        caches: dict[str, PreferenceCache] = {}
+
+        def options_for(tenant: str) -> dict[str, Any]:
+            return {"preference_cache": caches.setdefault(tenant, PreferenceCache())}
+
+        registry = ClientRegistry(KEYS.__getitem__, options_for=options_for)
+        first = registry.get("org_1")
+        assert first.notifications._preferences is caches["org_1"]
+        assert registry.get("org_2").notifications._preferences is caches["org_2"]
+        registry.discard("org_1")
+        assert is_closed(first)
+        assert registry.get("org_1") is not first
+        registry.close()
+
+    def test_close_waits_for_leases_before_closing_the_transport(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=f"{BASE_URL}/channels", json=single_envelope([]), is_reusable=True)
+        registry = ClientRegistry(KEYS.__getitem__, base_url=BASE_URL)
+        transport = registry._transport
+        with registry.lease("org_1") as client:
+            client.channels.list()
+            pool = transport._sync
+            registry.close()
+            # O cliente emprestado continua usando o mesmo pool até a devolução.
+            client.channels.list()
+            assert not is_closed(client) and transport._sync is pool
+        assert is_closed(client) and transport._sync is None
+        with pytest.raises(RuntimeError):
+            registry.get("org_1")
+
+    def test_external_transport_is_not_closed(self) -> None:
+        transport = SharedTransport()
+        transport._sync_pool()
+        ClientRegistry(KEYS.__getitem__, transport=transport).close()
+        assert transport._sync is not None
+        transport.close()
+
+    def test_rejects_invalid_configuration(self) -> None:
+        with pytest.raises(ValueError):
+            ClientRegistry(KEYS.__getitem__, max_size=0)
+        with pytest.raises(ValueError):
+            ClientRegistry(KEYS.__getitem__, api_key="nk_x")
+
+    def test_concurrent_leases_never_see_closed_clients(self) -> None:
+        registry = ClientRegistry(KEYS.__getitem__, max_size=4)
+        seen: list[Any] = []
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            for i in range(200):
+                with registry.lease(f"org_{i % 6}") as client:
+                    assert not is_closed(client)
+                    seen.append(client)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = registry.stats()
+        assert stats["size"] == 4 and stats["leased"] == 0
+        assert stats["hits"] + stats["misses"] == 1600
+        registry.close()
+        assert all(is_closed(client) for client in seen)
+
+
+class TestAsyncClientRegistry:
+    async def test_async_key_lookup_and_eviction(self) -> None:
+        async def api_key_for(tenant: str) -> str:
+            return KEYS[tenant]
+
+        async with AsyncClientRegistry(api_key_for, max_size=1, base_url=BASE_URL) as registry:
+            async with registry.lease("org_1") as first:
+                assert first._client._api_key == "nk_1"
+                second = await registry.get("org_2")
+                assert not is_closed(first)
+            assert is_closed(first)
+            assert await registry.get("org_2") is second
+            assert registry.stats()["evictions"] == 1
+        assert is_closed(second)
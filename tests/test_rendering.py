@@ -0,0 +1,78 @@
+"""Testes do renderizador local de templates.
+
+``fixtures/rendering_golden.json`` guarda saídas esperadas (golden) do
+renderizador local, escritas à mão no formato de ``/templates/preview`` —
+não são respostas gravadas da API.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica
+from notifica.rendering import CompiledTemplate, TemplateRenderer, render_content
+
+from conftest import paginated_envelope, single_envelope
+
+# Casos golden: conteúdo, variáveis e o resultado esperado de ``render_content``.
+GOLDEN_CASES: list[dict[str, Any]] = json.loads(
+    (Path(__file__).parent / "fixtures" / "rendering_golden.json").read_text(encoding="utf-8")
+)
+
+
+class TestGolden:
+    @pytest.mark.parametrize("case", GOLDEN_CASES, ids=[c["content"] for c in GOLDEN_CASES])
+    def test_matches_golden_output(self, case: dict[str, Any]) -> None:
+        assert render_content(case["content"], case["variables"], case.get("variants")) == case["expected"]
+
+
+class TestCompiledTemplate:
+    def test_extracts_variables(self) -> None:
+        compiled = CompiledTemplate("{{a}} {{b.c}}", {"subject": "{{d}} {{a}}"})
+        assert compiled.variables == ["a", "b.c", "d"]
+
+    def test_reports_missing_variables(self) -> None:
+        result = CompiledTemplate("{{name}} {{plan}}").render({"name": "x"})
+        assert result["validation"]["warnings"] == ["Variável ausente: plan"]
+        assert result["validation"]["valid"] is True
+
+    def test_reports_invalid_expressions(self) -> None:
+        result = CompiledTemplate("Oi {{#each items}}").render({})
+        assert result["validation"]["valid"] is False
+        assert result["rendered"]["body"] == "Oi {{#each items}}"
+
+    def test_render_body(self) -> None:
+        assert CompiledTemplate("Oi {{name}}").render_body({"name": "Ana"}) == "Oi Ana"
+
+    def test_formats_values_as_json(self) -> None:
+        render = CompiledTemplate("{{v}}").render_body
+        assert render({"v": {"a": 1, "nome": "João"}}) == '{"a": 1, "nome": "João"}'
+        assert render({"v": [True, None]}) == "[true, null]"
+        assert render({"v": 1.0}) == "1"
+        assert render({"v": 19.9}) == "19.9"
+
+
+class TestTemplateRenderer:
+    def test_fetches_once_by_id(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            json=single_envelope({"id": "t1", "slug": "welcome", "content": "Oi {{name}}"})
+        )
+        renderer = TemplateRenderer(client.templates)
+        assert renderer.render("t1", {"name": "Ana"})["rendered"]["body"] == "Oi Ana"
+        assert renderer.render("welcome", {"name": "Bia"})["rendered"]["body"] == "Oi Bia"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_preload(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=paginated_envelope([
+            {"id": "t1", "slug": "a", "content": "A {{x}}"},
+            {"id": "t2", "slug": "b", "content": "B {{x}}"},
+        ]))
+        renderer = TemplateRenderer(client.templates)
+        assert renderer.preload() == 2
+        assert renderer.render("b", {"x": 1})["rendered"]["body"] == "B 1"
+        assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,138 @@
+"""Testes do acompanhamento de execuções de workflows."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import ApiError, Notifica
+
+from conftest import BASE_URL, error_body, paginated_envelope, single_envelope
+
+RUNS_URL = f"{BASE_URL}/workflow-runs"
+
+
+def run(id: str, status: str, steps: list[str] | None = None) -> dict[str, Any]:
+    data: dict[str, Any] = {"id": id, "workflow_id": "wf_1", "status": status}
+    if steps is not None:
+        data["step_results"] = [
+            {"step_index": i, "step_type": "send", "status": s, "executed_at": "t"}
+            for i, s in enumerate(steps)
+        ]
+    return data
+
+
+def queue_active(httpx_mock: HTTPXMock, pending: list[Any], running: list[Any]) -> None:
+    httpx_mock.add_response(
+        url=f"{RUNS_URL}?status=pending&limit=100&workflow_id=wf_1", json=paginated_envelope(pending)
+    )
+    httpx_mock.add_response(
+        url=f"{RUNS_URL}?status=running&limit=100&workflow_id=wf_1", json=paginated_envelope(running)
+    )
+
+
+class TestWorkflowRunWatcher:
+    def test_tracks_runs_and_steps_to_terminal(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        # Rodada 1: run_1 pendente, run_2 rodando (página 2 via cursor).
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}?status=pending&limit=100&workflow_id=wf_1",
+            json=paginated_envelope([run("run_1", "pending")]),
+        )
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}?status=running&limit=100&workflow_id=wf_1",
+            json=paginated_envelope([], cursor="c1", has_more=True),
+        )
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}?status=running&limit=100&workflow_id=wf_1&cursor=c1",
+            json=paginated_envelope([run("run_2", "running", ["completed"])]),
+        )
+        # Rodada 2: run_1 rodando; run_2 saiu das listagens ativas.
+        queue_active(httpx_mock, [], [run("run_1", "running", ["running"])])
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}/run_2", json=single_envelope(run("run_2", "completed", ["completed", "completed"]))
+        )
+        # Rodada 3: run_1 sai e falhou.
+        queue_active(httpx_mock, [], [])
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}/run_1", json=single_envelope(run("run_1", "failed", ["failed"]))
+        )
+
+        transitions: list[tuple[str, str | None, str]] = []
+        steps: list[tuple[str, int, str | None, str]] = []
+        watcher = client.workflows.watch_runs(
+            workflow_id="wf_1",
+            on_run=lambda r, prev: transitions.append((r["id"], prev, r["status"])),
+            on_step=lambda r, s, prev: steps.append((r["id"], s["step_index"], prev, s["status"])),
+            sleep=lambda _: None,
+        )
+        assert watcher.watch(interval=1) == {"completed": 1, "failed": 1}
+        assert transitions == [
+            ("run_1", None, "pending"),
+            ("run_2", None, "running"),
+            ("run_1", "pending", "running"),
+            ("run_2", "running", "completed"),
+            ("run_1", "running", "failed"),
+        ]
+        assert steps == [
+            ("run_2", 0, None, "completed"),
+            ("run_1", 0, None, "running"),
+            ("run_2", 1, None, "completed"),
+            ("run_1", 0, "running", "failed"),
+        ]
+
+    def test_fixed_run_ids(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        queue_active(httpx_mock, [run("run_1", "pending"), run("other", "pending")], [])
+        watcher = client.workflows.watch_runs(workflow_id="wf_1", run_ids=["run_1"])
+        watcher.poll()
+        assert watcher.counts() == {"pending": 1}
+
+    def test_cancel_runs(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        queue_active(httpx_mock, [run("run_1", "pending")], [run("run_2", "running")])
+        httpx_mock.add_response(
+            method="POST", url=f"{RUNS_URL}/run_1/cancel", json=single_envelope(run("run_1", "cancelled"))
+        )
+        httpx_mock.add_response(
+            method="POST", url=f"{RUNS_URL}/run_2/cancel", status_code=409, json=error_body("conflict")
+        )
+        watcher = client.workflows.watch_runs(workflow_id="wf_1")
+        watcher.poll()
+        results = watcher.cancel(max_concurrency=2)
+        assert results[0]["status"] == "cancelled"  # type: ignore[index]
+        assert isinstance(results[1], Exception)
+        assert watcher.counts() == {"cancelled": 1, "running": 1}
+
+
+    def test_failing_get_run_settles_as_error(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}/run_1", status_code=404, json=error_body("not_found"), is_reusable=True
+        )
+        for _ in range(3):
+            queue_active(httpx_mock, [], [])
+        watcher = client.workflows.watch_runs(workflow_id="wf_1", run_ids=["run_1"], max_errors=3)
+        counts = watcher.watch(interval=0, timeout=None)
+        assert counts == {"error": 1}
+        assert watcher.active == 0
+        assert len(httpx_mock.get_requests(url=f"{RUNS_URL}/run_1")) == 3
+
+    def test_auth_errors_are_raised(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        queue_active(httpx_mock, [], [])
+        httpx_mock.add_response(url=f"{RUNS_URL}/run_1", status_code=401, json=error_body("unauthorized"))
+        watcher = client.workflows.watch_runs(workflow_id="wf_1", run_ids=["run_1"])
+        with pytest.raises(ApiError) as exc_info:
+            watcher.poll()
+        assert exc_info.value.status == 401
+        assert watcher.active == 1
+
+
+class TestListRunsAuto:
+    def test_paginates(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}?status=failed", json=paginated_envelope([run("run_1", "failed")], "c", True)
+        )
+        httpx_mock.add_response(
+            url=f"{RUNS_URL}?status=failed&cursor=c", json=paginated_envelope([run("run_2", "failed")])
+        )
+        ids = [r["id"] for r in client.workflows.list_runs_auto({"status": "failed"})]
+        assert ids == ["run_1", "run_2"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from pytest_httpx import HTTPXMock
 
 from notifica import Notifica
@@ -107,3 +109,12 @@ class TestSmsConsents:
         httpx_mock.add_response(json=single_envelope({"imported": 5}))
         result = client.sms.consents.import_bulk({"consents": []})
         assert result["imported"] == 5
+
+    def test_import_bulk_stream(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope({"imported": 2}))
+        phones = ({"phone": p} for p in ["+5511999999999", "+5511988888888"])
+        result = client.sms.consents.import_bulk_stream(phones)
+        assert result["imported"] == 2
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert json.loads(request.read())["consents"][1]["phone"] == "+5511988888888"
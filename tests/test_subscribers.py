@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from pytest_httpx import HTTPXMock
 
 from notifica import Notifica
@@ -54,6 +56,19 @@ class TestSubscribers:
         })
         assert result["imported"] == 2
 
+    def test_bulk_import_stream(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope({"imported": 3, "subscribers": []}))
+        rows = ({"external_id": f"u{i}"} for i in range(3))
+        result = client.subscribers.bulk_import_stream(rows)
+        assert result["imported"] == 3
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.url.path.endswith("/subscribers/import")
+        assert request.headers["transfer-encoding"] == "chunked"
+        assert json.loads(request.read()) == {
+            "subscribers": [{"external_id": "u0"}, {"external_id": "u1"}, {"external_id": "u2"}]
+        }
+
     def test_list_notifications(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(json={"data": [{"id": "n1", "read": False}]})
         result = client.subscribers.list_notifications("s1")
@@ -0,0 +1,141 @@
+"""Testes do índice de variáveis de templates."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica, TemplateVariableIndex
+from notifica.errors import ValidationError
+
+from conftest import BASE_URL, TEST_API_KEY, paginated_envelope, single_envelope
+
+
+def make_template(id: str, slug: str, variables: list[str] | None, updated_at: str = "t1") -> dict[str, Any]:
+    template: dict[str, Any] = {
+        "id": id,
+        "slug": slug,
+        "channel": "email",
+        "content": " ".join("{{" + v + "}}" for v in variables or ["name"]),
+        "updated_at": updated_at,
+    }
+    if variables is not None:
+        template["variables"] = variables
+    return template
+
+
+@pytest.fixture
+def index() -> TemplateVariableIndex:
+    return TemplateVariableIndex(max_age=None)
+
+
+@pytest.fixture
+def indexed_client(index: TemplateVariableIndex) -> Notifica:
+    return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, template_variable_index=index)
+
+
+class TestTemplateVariableIndex:
+    def test_refresh_indexes_by_id_and_slug(
+        self, indexed_client: Notifica, index: TemplateVariableIndex, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(json=paginated_envelope([
+            make_template("tpl_1", "welcome", ["name", "plan"]),
+            make_template("tpl_2", "reset", ["user.email"]),
+        ]))
+        assert index.refresh() == {"templates": 2, "updated": 2, "removed": 0}
+        assert index.required("welcome") == ["name", "plan"]
+        assert index.missing("tpl_1", {"name": "João"}) == ["plan"]
+        assert index.missing("reset", {"user": {"email": "a@b.c"}}) == []
+        assert index.missing("reset", {"user": {}}) == ["user.email"]
+        assert index.required("unknown") is None
+        assert index.missing("unknown", {}) == []
+
+    def test_refresh_is_incremental(
+        self, indexed_client: Notifica, index: TemplateVariableIndex, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(json=paginated_envelope([
+            make_template("tpl_1", "welcome", ["name"]),
+            make_template("tpl_2", "reset", ["code"]),
+        ]))
+        httpx_mock.add_response(json=paginated_envelope([
+            make_template("tpl_1", "welcome", ["name", "plan"], updated_at="t2"),
+        ]))
+        index.refresh()
+        assert index.refresh() == {"templates": 1, "updated": 1, "removed": 1}
+        assert index.required("welcome") == ["name", "plan"]
+        assert index.required("reset") is None
+
+    def test_identical_variable_sets_are_shared(self, index: TemplateVariableIndex) -> None:
+        index.add(make_template("tpl_1", "a", ["name"]))
+        index.add(make_template("tpl_2", "b", ["name"]))
+        assert index.stats() == {"templates": 2, "aliases": 2, "distinct_variable_sets": 1}
+
+    def test_shared_variable_sets_are_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("notifica.template_index._MAX_INTERNED", 2)
+        index = TemplateVariableIndex(max_age=None)
+        for i in range(10):
+            index.add(make_template(f"tpl_{i}", f"s{i}", [f"var_{i}"]))
+        assert len(index._interned) <= 2
+        assert index.required("s0") == ["var_0"]
+
+    def test_extracts_variables_from_content_when_missing(self, index: TemplateVariableIndex) -> None:
+        index.add({"id": "tpl_1", "slug": "a", "content": "Olá {{ name }}", "updated_at": "t1"})
+        assert index.required("a") == ["name"]
+
+    def test_uses_validate_content(self, httpx_mock: HTTPXMock) -> None:
+        index = TemplateVariableIndex(max_age=None, use_validate_content=True)
+        Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, template_variable_index=index)
+        httpx_mock.add_response(json=single_envelope({"valid": True, "variables": ["code"]}))
+        index.add(make_template("tpl_1", "otp", None))
+        assert index.required("otp") == ["code"]
+        assert json.loads(httpx_mock.get_request().content)["channel"] == "email"
+
+
+class TestSendCheck:
+    def test_rejects_missing_data_locally(
+        self, indexed_client: Notifica, index: TemplateVariableIndex, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(json=paginated_envelope([make_template("tpl_1", "welcome", ["name", "plan"])]))
+        index.refresh()
+        with pytest.raises(ValidationError) as exc_info:
+            indexed_client.notifications.send({
+                "channel": "email", "to": "a@b.c", "template": "welcome", "data": {"name": "João"},
+            })
+        assert exc_info.value.details == {"data.plan": ["is required by template"]}
+        assert len(httpx_mock.get_requests()) == 1  # apenas o carregamento do índice
+
+    def test_sends_when_data_is_complete(
+        self, indexed_client: Notifica, index: TemplateVariableIndex, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/templates", json=paginated_envelope([make_template("tpl_1", "welcome", ["name"])])
+        )
+        httpx_mock.add_response(method="POST", json=single_envelope({"id": "ntf_1"}))
+        index.refresh()
+        result = indexed_client.notifications.send({
+            "channel": "email", "to": "a@b.c", "template": "welcome", "data": {"name": "João"},
+        })
+        assert result == {"id": "ntf_1"}
+
+    def test_send_never_lists_templates(self, httpx_mock: HTTPXMock) -> None:
+        index = TemplateVariableIndex(max_age=0.0)
+        client = Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, template_variable_index=index)
+        httpx_mock.add_response(method="POST", json=single_envelope({"id": "ntf_1"}), is_reusable=True)
+        for _ in range(2):  # índice nunca carregado, e depois sempre vencido
+            client.notifications.send({"channel": "email", "to": "a@b.c", "template": "welcome", "data": {}})
+        assert [r.method for r in httpx_mock.get_requests()] == ["POST", "POST"]
+
+    def test_template_writes_update_the_index(
+        self, indexed_client: Notifica, index: TemplateVariableIndex, httpx_mock: HTTPXMock
+    ) -> None:
+        httpx_mock.add_response(
+            method="PUT", json=single_envelope(make_template("tpl_1", "welcome", ["name", "code"], "t2"))
+        )
+        httpx_mock.add_response(method="DELETE", status_code=204)
+        indexed_client.templates.update("tpl_1", {"content": "{{name}} {{code}}"})
+        assert index.required("welcome") == ["name", "code"]
+        indexed_client.templates.delete("tpl_1")
+        assert index.required("welcome") is None
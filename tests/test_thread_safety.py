@@ -0,0 +1,132 @@
+"""Testes de uso concorrente de um mesmo cliente e de seus caches."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from pytest_httpx import HTTPXMock
+
+from notifica import (
+    AnalyticsCache,
+    Notifica,
+    PreferenceCache,
+    SmsConsentIndex,
+    TemplateVariableIndex,
+)
+from notifica.cache import TTLCache
+from notifica.transport import DEFAULT_LIMITS
+
+from conftest import BASE_URL, TEST_API_KEY, paginated_envelope, single_envelope
+
+THREADS = 16
+
+
+def hammer(target: Callable[[int], Any], threads: int = THREADS) -> list[BaseException]:
+    """Roda ``target(i)`` em ``threads`` threads liberadas ao mesmo tempo."""
+    barrier = threading.Barrier(threads)
+    errors: list[BaseException] = []
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return errors
+
+
+class TestSharedClient:
+    def test_concurrent_sends_get_distinct_idempotency_keys(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=f"{BASE_URL}/notifications", json=single_envelope({"id": "n"}), is_reusable=True)
+
+        def send(index: int) -> None:
+            for _ in range(10):
+                client.notifications.send({"channel": "email", "to": f"u{index}@x.com", "template": "t"})
+
+        assert hammer(send) == []
+        keys = {request.headers["Idempotency-Key"] for request in httpx_mock.get_requests()}
+        assert len(keys) == THREADS * 10
+
+    def test_pool_keeps_as_many_idle_connections_as_it_opens(self, client: Notifica) -> None:
+        assert DEFAULT_LIMITS.max_keepalive_connections == DEFAULT_LIMITS.max_connections
+        pool = client._client._client._transport._pool  # type: ignore[attr-defined]
+        assert pool._max_keepalive_connections == DEFAULT_LIMITS.max_keepalive_connections
+
+
+class TestCaches:
+    def test_sharded_ttl_cache_counts_are_exact(self) -> None:
+        cache: TTLCache[int, int] = TTLCache(max_size=16_384, shards=8)
+
+        def work(index: int) -> None:
+            for i in range(500):
+                key = index * 500 + i
+                cache.set(key, key)
+                assert cache.get(key) == key
+
+        assert hammer(work) == []
+        assert cache.hits == THREADS * 500 and cache.misses == 0
+        assert len(cache) == THREADS * 500 and cache.evictions == 0
+
+    def test_preference_skip_counter_is_exact(self) -> None:
+        cache = PreferenceCache()
+        assert hammer(lambda _: [cache.record_skip() for _ in range(1000)]) == []
+        assert cache.stats()["skipped"] == THREADS * 1000
+
+    def test_consent_index_loads_once_under_contention(self, httpx_mock: HTTPXMock) -> None:
+        def slow_listing(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.05)
+            return httpx.Response(200, json=paginated_envelope([{"phone": "+5511999999999", "status": "opted_out"}]))
+
+        httpx_mock.add_callback(slow_listing, is_reusable=True)
+        index = SmsConsentIndex()
+        Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, sms_consent_index=index)
+        results: list[bool] = []
+        assert hammer(lambda _: results.append(index.is_blocked("+5511999999999"))) == []
+        assert results == [True] * THREADS
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_template_index_refreshes_once_under_contention(self, httpx_mock: HTTPXMock) -> None:
+        def slow_listing(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.05)
+            template = {"id": "tpl_1", "slug": "welcome", "updated_at": "v1", "variables": ["name"]}
+            return httpx.Response(200, json=paginated_envelope([template]))
+
+        httpx_mock.add_callback(slow_listing, is_reusable=True)
+        index = TemplateVariableIndex()
+        Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, template_variable_index=index)
+        assert hammer(lambda _: index.refresh_if_stale()) == []
+        assert index.required("welcome") == ["name"]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_consent_apply_during_reads(self) -> None:
+        index = SmsConsentIndex(max_age=None)
+        index.load([])
+
+        def work(i: int) -> None:
+            phone = f"+55119{i:08d}"
+            for status in ("opted_out", "opted_in") * 50:
+                index.apply({"phone": phone, "status": status})
+                index.is_blocked(phone)
+
+        assert hammer(work) == []
+        assert len(index) == 0
+
+    def test_analytics_cache_counts_every_hit(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/analytics/overview?period=7d", json=single_envelope({"total_sent": 1})
+        )
+        cache = AnalyticsCache()
+        client = Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, analytics_cache=cache)
+        client.analytics.overview({"period": "7d"})
+        assert hammer(lambda _: [client.analytics.overview({"period": "7d"}) for _ in range(100)]) == []
+        assert cache.stats()["hits"] == THREADS * 100
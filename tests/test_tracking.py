@@ -0,0 +1,140 @@
+"""Testes do acompanhamento em lote de status de notificações."""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any
+
+import httpx
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica
+
+from conftest import BASE_URL, error_body, paginated_envelope, single_envelope
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def status_sequence(statuses: dict[str, list[str]]) -> Any:
+    """Stand-in de ``GET /notifications/{id}`` que avança um status por chamada."""
+    def respond(request: httpx.Request) -> httpx.Response:
+        notification_id = request.url.path.rsplit("/", 1)[-1]
+        sequence = statuses[notification_id]
+        status = sequence.pop(0) if len(sequence) > 1 else sequence[0]
+        return httpx.Response(200, json=single_envelope({"id": notification_id, "status": status}))
+    return respond
+
+
+GET_URL = re.compile(rf"{re.escape(BASE_URL)}/notifications/ntf_\w+")
+
+
+class TestNotificationTracker:
+    def test_tracks_until_terminal(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock()
+        httpx_mock.add_callback(status_sequence({
+            "ntf_1": ["delivered"],
+            "ntf_2": ["pending", "processing", "failed"],
+        }), url=GET_URL, is_reusable=True)
+        settled: list[dict[str, Any]] = []
+        tracker = client.notifications.tracker(
+            ["ntf_1", "ntf_2", "ntf_1"], on_settled=settled.append, clock=clock, sleep=clock.sleep,
+        )
+        assert tracker.pending == 2
+        assert tracker.run() == {"delivered": 1, "failed": 1}
+        assert [n["id"] for n in settled] == ["ntf_1", "ntf_2"]
+        assert len(httpx_mock.get_requests()) == 4
+
+    def test_backoff_grows_while_status_is_unchanged(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock()
+        httpx_mock.add_callback(status_sequence({"ntf_1": ["pending"]}), url=GET_URL, is_reusable=True)
+        tracker = client.notifications.tracker(
+            ["ntf_1"], initial_interval=1.0, max_interval=4.0, clock=clock, sleep=clock.sleep,
+        )
+        counts = tracker.run(timeout=20)
+        assert counts == {"pending": 1}
+        # t=0, 1 (mudou de desconhecido), 3, 7, 11, 15, 19
+        assert len(httpx_mock.get_requests()) == 7
+
+    def test_drops_after_repeated_errors(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock()
+        httpx_mock.add_response(url=GET_URL, status_code=404, json=error_body("not_found"), is_reusable=True)
+        progress: list[dict[str, int]] = []
+        tracker = client.notifications.tracker(
+            ["ntf_1"], max_errors=2, on_progress=progress.append, clock=clock, sleep=clock.sleep,
+        )
+        assert tracker.run() == {"error": 1}
+        assert progress == [{"unknown": 1}, {"error": 1}]
+
+    def test_uses_list_queries_for_large_rounds(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        clock = FakeClock()
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/notifications?channel=email&status=bounced",
+            json=paginated_envelope([{"id": "ntf_3", "status": "bounced"}]),
+        )
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/notifications?channel=email&status=delivered",
+            json=paginated_envelope([{"id": "ntf_1", "status": "delivered"}], cursor="c1", has_more=True),
+        )
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/notifications?channel=email&status=delivered&cursor=c1",
+            json=paginated_envelope([{"id": "ntf_2", "status": "delivered"}, {"id": "other"}]),
+        )
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/notifications?channel=email&status=failed", json=paginated_envelope([]),
+        )
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/notifications?channel=email&status=rejected", json=paginated_envelope([]),
+        )
+        httpx_mock.add_callback(status_sequence({"ntf_4": ["rejected"]}), url=GET_URL)
+        tracker = client.notifications.tracker(
+            ["ntf_1", "ntf_2", "ntf_3", "ntf_4"],
+            list_threshold=3, list_params={"channel": "email"}, clock=clock, sleep=clock.sleep,
+        )
+        assert tracker.run() == {"bounced": 1, "delivered": 2, "rejected": 1}
+        gets = [r for r in httpx_mock.get_requests() if r.url.path != "/v1/notifications"]
+        assert [r.url.path for r in gets] == ["/v1/notifications/ntf_4"]
+
+    def test_settles_each_id_as_its_request_completes(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        first_settled = threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            notification_id = request.url.path.rsplit("/", 1)[-1]
+            if notification_id == "ntf_slow":
+                # Só responde depois que ``ntf_fast`` foi reportado na mesma rodada.
+                assert first_settled.wait(timeout=5)
+            return httpx.Response(200, json=single_envelope({"id": notification_id, "status": "delivered"}))
+
+        httpx_mock.add_callback(respond, url=GET_URL, is_reusable=True)
+        settled: list[str] = []
+
+        def on_settled(notification: dict[str, Any]) -> None:
+            settled.append(notification["id"])
+            first_settled.set()
+
+        tracker = client.notifications.tracker(["ntf_slow", "ntf_fast"], on_settled=on_settled)
+        assert tracker.poll() == 2
+        assert settled == ["ntf_fast", "ntf_slow"]
+
+    def test_on_settled_runs_outside_the_lock(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_callback(status_sequence({"ntf_1": ["delivered"]}), url=GET_URL)
+        blocked: list[bool] = []
+
+        def on_settled(notification: dict[str, Any]) -> None:
+            reader = threading.Thread(target=tracker.counts)
+            reader.start()
+            reader.join(timeout=2)
+            blocked.append(reader.is_alive())
+
+        tracker = client.notifications.tracker(["ntf_1"], on_settled=on_settled)
+        tracker.poll()
+        assert blocked == [False]
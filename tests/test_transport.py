@@ -0,0 +1,105 @@
+"""Testes do transporte compartilhado entre clientes."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import AsyncNotifica, Notifica, SharedTransport
+
+from conftest import BASE_URL, single_envelope
+
+CHANNELS_URL = f"{BASE_URL}/channels"
+
+
+class TestSharedTransport:
+    def test_clients_keep_their_own_auth_and_timeout(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        transport = SharedTransport()
+        first = Notifica("nk_a", base_url=BASE_URL, timeout=2.0, transport=transport)
+        second = Notifica("nk_b", base_url=BASE_URL, timeout=7.0, transport=transport)
+        first.channels.list()
+        second.channels.list()
+
+        requests = httpx_mock.get_requests()
+        assert [r.headers["Authorization"] for r in requests] == ["Bearer nk_a", "Bearer nk_b"]
+        assert [r.extensions["timeout"]["read"] for r in requests] == [2.0, 7.0]
+        assert transport._sync is not None
+        transport.close()
+
+    def test_closing_a_client_keeps_the_pool(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        with SharedTransport() as transport:
+            with Notifica("nk_a", base_url=BASE_URL, transport=transport) as first:
+                first.channels.list()
+            pool = transport._sync
+            Notifica("nk_b", base_url=BASE_URL, transport=transport).channels.list()
+            assert transport._sync is pool
+        assert transport._sync is None
+
+    def test_pool_is_created_lazily_with_options(self) -> None:
+        transport = SharedTransport(limits=httpx.Limits(max_connections=5), retries=1)
+        Notifica("nk_a", transport=transport)
+        assert transport._sync is None and transport._async is None
+        pool = transport._sync_pool()
+        assert pool._pool._max_connections == 5
+        transport.close()
+
+    async def test_async_clients_share_the_pool(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        async with SharedTransport() as transport:
+            for key in ("nk_a", "nk_b"):
+                async with AsyncNotifica(key, base_url=BASE_URL, transport=transport) as client:
+                    await client._client.get(CHANNELS_URL)
+            pool = transport._async
+            assert pool is not None
+        assert transport._async is None
+        assert [r.headers["Authorization"] for r in httpx_mock.get_requests()] == ["Bearer nk_a", "Bearer nk_b"]
+
+    async def test_sync_close_warns_about_the_async_pool(self) -> None:
+        transport = SharedTransport()
+        transport._async_pool()
+        with pytest.warns(ResourceWarning, match="aclose"):
+            transport.close()
+        assert transport._async is not None
+        await transport.aclose()
+        assert transport._async is None
+
+
+class TestPerClientLimit:
+    def _request(self) -> httpx.Request:
+        return httpx.Request("GET", CHANNELS_URL, extensions={"timeout": {"pool": 0.01}})
+
+    def test_slot_is_held_until_the_response_is_closed(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        with SharedTransport(max_connections_per_client=1) as transport:
+            first, second = transport.borrow(), transport.borrow()
+            response = first.handle_request(self._request())
+            with pytest.raises(httpx.PoolTimeout):
+                first.handle_request(self._request())
+            second.handle_request(self._request()).close()  # outro cliente não é afetado
+            response.close()
+            response.close()
+            first.handle_request(self._request()).close()
+
+    def test_clients_release_slots_after_each_call(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        with SharedTransport(max_connections_per_client=1) as transport:
+            client = Notifica("nk_a", base_url=BASE_URL, transport=transport)
+            for _ in range(3):
+                client.channels.list()
+
+    async def test_async_slot_is_held_until_the_response_is_closed(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=CHANNELS_URL, json=single_envelope([]), is_reusable=True)
+        async with SharedTransport(max_connections_per_client=1) as transport:
+            borrowed = transport.borrow_async()
+            response = await borrowed.handle_async_request(self._request())
+            with pytest.raises(httpx.PoolTimeout):
+                await borrowed.handle_async_request(self._request())
+            await response.aclose()
+            await (await borrowed.handle_async_request(self._request())).aclose()
+
+    def test_rejects_non_positive_limit(self) -> None:
+        with pytest.raises(ValueError, match="maior que zero"):
+            SharedTransport(max_connections_per_client=0)
@@ -0,0 +1,77 @@
+"""Testes do disparo de workflows em lote."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+
+import httpx
+from pytest_httpx import HTTPXMock
+
+from notifica import AsyncNotifica, Notifica
+from notifica.errors import ValidationError
+from notifica.triggers import trigger_idempotency_key, trigger_many_async
+
+from conftest import BASE_URL, TEST_API_KEY, error_body, single_envelope
+
+TRIGGER_URL = f"{BASE_URL}/workflows/welcome/trigger"
+
+
+def stand_in_trigger(request: httpx.Request) -> httpx.Response:
+    """Stand-in de ``POST /workflows/{slug}/trigger`` que rejeita destinatários ``bad``."""
+    params = json.loads(request.content)
+    if params["recipient"].startswith("bad"):
+        return httpx.Response(422, json=error_body("validation_failed", "Destinatário inválido"))
+    return httpx.Response(200, json=single_envelope({"id": f"run_{params['recipient']}", "status": "pending"}))
+
+
+class TestTriggerMany:
+    def test_dedupes_and_keeps_order(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_callback(stand_in_trigger, url=TRIGGER_URL, is_reusable=True)
+        results = client.workflows.trigger_many(
+            "welcome",
+            (r for r in ["a", "bad1", {"recipient": "c", "data": {"name": "C"}}, "a", "d"]),
+            data={"plan": "pro"},
+            max_concurrency=3,
+        )
+        assert [r["recipient"] for r in results] == ["a", "bad1", "c", "d"]
+        assert [r["run_id"] for r in results] == ["run_a", None, "run_c", "run_d"]
+        assert isinstance(results[1]["error"], ValidationError)
+
+        bodies = {json.loads(r.content)["recipient"]: json.loads(r.content) for r in httpx_mock.get_requests()}
+        assert len(httpx_mock.get_requests()) == 4
+        assert bodies["c"]["data"] == {"plan": "pro", "name": "C"}
+
+    def test_stable_idempotency_keys_within_a_batch(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_callback(stand_in_trigger, url=TRIGGER_URL, is_reusable=True)
+        first = client.workflows.trigger_many("welcome", ["a", "b"])
+        batch_id = first[0]["batch_id"]
+        assert [r["batch_id"] for r in first] == [batch_id, batch_id]
+        client.workflows.trigger_many("welcome", ["a", "b"], batch_id=batch_id)
+        keys = [r.headers["Idempotency-Key"] for r in httpx_mock.get_requests()]
+        assert keys[:2] == keys[2:4]
+        assert keys[0] != keys[1]
+        assert keys[0] == trigger_idempotency_key("welcome", {"recipient": "a"}, batch_id)
+
+    def test_each_call_is_a_new_batch(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_callback(stand_in_trigger, url=TRIGGER_URL, is_reusable=True)
+        first = client.workflows.trigger_many("welcome", ["a"])
+        again = client.workflows.trigger_many("welcome", ["a"])
+        assert first[0]["batch_id"] != again[0]["batch_id"]
+        keys = [r.headers["Idempotency-Key"] for r in httpx_mock.get_requests()]
+        assert keys[0] != keys[1]
+
+
+class TestTriggerManyAsync:
+    async def test_async_variant(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_callback(stand_in_trigger, url=TRIGGER_URL, is_reusable=True)
+
+        async def recipients() -> AsyncIterator[str]:
+            for recipient in ["x", "y", "x", "bad"]:
+                yield recipient
+
+        async with AsyncNotifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0) as client:
+            results = await trigger_many_async(client, "welcome", recipients(), max_concurrency=2)
+        assert [r["run_id"] for r in results] == ["run_x", "run_y", None]
+        assert results[2]["error"] is not None
+        assert len({r["batch_id"] for r in results}) == 1
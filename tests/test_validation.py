@@ -0,0 +1,107 @@
+"""Testes dos validadores compilados a partir de notifica.types."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notifica import Notifica
+from notifica.errors import ValidationError
+from notifica.types import (
+    CreateSubscriberParams,
+    CreateWorkflowParams,
+    SendNotificationParams,
+    SmsConsent,
+    TriggerWorkflowParams,
+)
+from notifica.validation import compile_validator
+
+from conftest import BASE_URL, TEST_API_KEY, single_envelope
+
+
+class TestCompileValidator:
+    def test_accepts_valid_payload(self) -> None:
+        validate = compile_validator(SendNotificationParams)
+        validate({"channel": "email", "to": "a@b.com", "data": {"name": "João"}})
+
+    def test_reports_missing_required_keys(self) -> None:
+        errors = compile_validator(SendNotificationParams).errors({"channel": "email"})
+        assert errors == {"to": ["is required"]}
+
+    def test_not_required_keys_are_optional(self) -> None:
+        assert compile_validator(CreateSubscriberParams).is_valid({"external_id": "u1"})
+        assert compile_validator(TriggerWorkflowParams).is_valid({"recipient": "u1"})
+
+    def test_rejects_unknown_literal(self) -> None:
+        errors = compile_validator(SendNotificationParams).errors({"channel": "fax", "to": "x"})
+        assert "channel" in errors
+        assert "whatsapp" in errors["channel"][0]
+
+    def test_checks_primitive_types(self) -> None:
+        errors = compile_validator(SendNotificationParams).errors(
+            {"channel": "email", "to": 123, "data": []}
+        )
+        assert errors == {"to": ["must be a string"], "data": ["must be an object"]}
+
+    def test_checks_nested_tagged_unions(self) -> None:
+        validate = compile_validator(CreateWorkflowParams)
+        errors = validate.errors({
+            "slug": "w",
+            "name": "W",
+            "steps": [
+                {"type": "send", "channel": "email", "template": "t"},
+                {"type": "delay"},
+                {"type": "teleport"},
+                {"type": "fallback", "channels": ["sms", "pigeon"], "template": "t"},
+            ],
+        })
+        assert errors["steps[1].duration"] == ["is required"]
+        assert "steps[2].type" in errors
+        assert "steps[3].channels[1]" in errors
+
+    def test_optional_values_accept_none(self) -> None:
+        assert compile_validator(SmsConsent).is_valid({
+            "phone": "+5511999999999",
+            "status": "opted_out",
+            "source": "api",
+            "opted_in_at": None,
+            "opted_out_at": "2024-01-01T00:00:00Z",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        })
+
+    def test_forbid_extra(self) -> None:
+        validate = compile_validator(SendNotificationParams, forbid_extra=True)
+        assert validate.errors({"channel": "email", "to": "x", "templat": "t"}) == {
+            "templat": ["is not allowed"]
+        }
+
+    def test_raises_validation_error(self) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            compile_validator(SendNotificationParams)([])
+        assert exc_info.value.details == {"body": ["must be an object"]}
+
+    def test_is_compiled_once(self) -> None:
+        assert compile_validator(SendNotificationParams) is compile_validator(SendNotificationParams)
+
+
+class TestValidationIntegration:
+    @pytest.fixture
+    def client(self) -> Notifica:
+        return Notifica(TEST_API_KEY, base_url=BASE_URL, max_retries=0, validate_payloads=True)
+
+    def test_send_fails_locally(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        with pytest.raises(ValidationError):
+            client.notifications.send({"channel": "telegram", "to": "x"})
+        assert httpx_mock.get_requests() == []
+
+    def test_valid_send_goes_through(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(json=single_envelope({"id": "n1"}))
+        assert client.notifications.send({"channel": "email", "to": "a@b.com"})["id"] == "n1"
+
+    def test_trigger_and_subscriber_create(self, client: Notifica, httpx_mock: HTTPXMock) -> None:
+        with pytest.raises(ValidationError):
+            client.workflows.trigger("welcome", {"data": {}})
+        with pytest.raises(ValidationError):
+            client.subscribers.create({"email": "a@b.com"})
+        assert httpx_mock.get_requests() == []